@@ -5,6 +5,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from starlette.responses import JSONResponse
 
 from app.db.mongodb import get_database
+from app.db.config_cache import invalidate_agent
 from app.schemas.agent_studio import (
     AgentConfig,
     AgentResponse,
@@ -65,6 +66,7 @@ async def create_agent(
                 {"$set": update_doc},
                 return_document=True
             )
+            invalidate_agent(agent_id)
 
             if not result:
                 raise HTTPException(status_code=404, detail="Agent not found")
@@ -194,6 +196,7 @@ async def update_agent(
             {"$set": update_doc},
             return_document=True
         )
+        invalidate_agent(payload.agent_id)
 
         if not result:
             raise HTTPException(status_code=404, detail="Agent not found")
@@ -220,6 +223,7 @@ async def delete_agent(
     try:
         result = await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_AGENT].delete_one(
             {"_id": ObjectId(agent_id)})
+        invalidate_agent(agent_id)
 
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Agent not found")
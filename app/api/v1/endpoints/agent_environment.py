@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.db.mongodb import get_database
+from app.db.config_cache import invalidate_environment
 from app.schemas.agent_studio import (
     EnvironmentConfig,
     EnvironmentResponse,
@@ -128,6 +129,7 @@ async def update_environment(
             {"$set": update_doc},
             return_document=True
         )
+        invalidate_environment(payload.environment_id)
 
         if not result:
             raise HTTPException(status_code=404, detail="Environment not found")
@@ -154,6 +156,7 @@ async def delete_environment(
     try:
         result = await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_AGENT_STUDIO].delete_one(
             {"_id": ObjectId(environment_id)})
+        invalidate_environment(environment_id)
 
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Environment not found")
@@ -1,5 +1,6 @@
-from pymongo import MongoClient
 from app.core.config import settings
+from app.db.mongodb import get_sync_database, get_async_database
+from app.db.config_cache import config_cache, AGENT, ENVIRONMENT, RAG_CONFIG, DATA_MANAGEMENT
 from bson import ObjectId
 from datetime import datetime
 
@@ -8,10 +9,11 @@ def get_agent_data(agent_id):
     """
     Fetch agent data from the MongoDB database using the provided agent_id.
     """
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
-    agent_data = db[settings.MONGODB_COLLECTION_AGENT].find_one({"_id": ObjectId(agent_id)})
-    client.close()
+    agent_data = config_cache.get(AGENT, agent_id)
+    if agent_data is None:
+        db = get_sync_database()
+        agent_data = db[settings.MONGODB_COLLECTION_AGENT].find_one({"_id": ObjectId(agent_id)})
+        config_cache.set(AGENT, agent_id, agent_data)
     return agent_data
 
 
@@ -19,10 +21,11 @@ def get_environment_data(env_id):
     """
     Fetch environment data from the MongoDB database using the provided agent_id.
     """
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
-    env_data = db[settings.MONGODB_COLLECTION_AGENT_STUDIO].find_one({"_id": ObjectId(env_id)})
-    client.close()
+    env_data = config_cache.get(ENVIRONMENT, env_id)
+    if env_data is None:
+        db = get_sync_database()
+        env_data = db[settings.MONGODB_COLLECTION_AGENT_STUDIO].find_one({"_id": ObjectId(env_id)})
+        config_cache.set(ENVIRONMENT, env_id, env_data)
     return env_data
 
 
@@ -33,53 +36,69 @@ def save_ai_request(request_data):
     :param request_data: A dictionary containing the request data to be saved.
     :return: The ID of the saved document.
     """
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
 
     # Add a timestamp to the request data
     request_data['created_at'] = datetime.now()
 
     result = db[settings.MONGODB_COLLECTION_AGENT_CHAT].insert_one(request_data)
-    client.close()
 
     return str(result.inserted_id)  # Return the ID of the inserted document
 
 
 def fetch_ai_requests_data(query):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     document = db[settings.MONGODB_COLLECTION_AGENT_CHAT].find_one(query)
     return document
 
 
 def fetch_ai_requests_data_by_user_id(query):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     document = db[settings.MONGODB_COLLECTION_AGENT_CHAT].find(query)
     return document
 
 
 def fetch_manage_data(search_query, skip, limit):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     collection = db[settings.MONGODB_COLLECTION_DATA_MANAGEMENT].find_one(search_query, skip=skip, limit=limit)
-    client.close()
     return collection  # Returning the query result
 
 
 def save_website_scrapper_logs(data):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
 
     result = db[settings.MONGODB_COLLECTION_RAG_LOGS].insert_one(data)
-    client.close()
 
     return str(result.inserted_id)  # Return the ID of the inserted document
 
 
+def save_website_scrapper_logs_bulk(logs):
+    """Insert many scrapper log entries in one round trip"""
+    if not logs:
+        return []
+    db = get_sync_database()
+
+    result = db[settings.MONGODB_COLLECTION_RAG_LOGS].insert_many(logs, ordered=False)
+
+    return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+
+def update_website_scrapper_logs_status(log_ids, status):
+    """Set the status of many scrapper log entries by id"""
+    if not log_ids:
+        return 0
+    db = get_sync_database()
+
+    result = db[settings.MONGODB_COLLECTION_RAG_LOGS].update_many(
+        {"_id": {"$in": [ObjectId(log_id) for log_id in log_ids]}},
+        {"$set": {"status": status}}
+    )
+
+    return result.modified_count
+
+
 def update_website_scrapper_logs(data):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
 
     result = db[settings.MONGODB_COLLECTION_RAG_LOGS].update_one(
         {
@@ -93,14 +112,12 @@ def update_website_scrapper_logs(data):
             }
         }
     )
-    client.close()
 
     return str(result.modified_count)  # Return the ID of the inserted document
 
 
 def update_data_management_logs(data):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
 
     result = db[settings.MONGODB_COLLECTION_DATA_MANAGEMENT].update_one(
         {
@@ -112,21 +129,18 @@ def update_data_management_logs(data):
             }
         }
     )
-    client.close()
 
     return str(result.modified_count)  # Return the ID of the inserted document
 
 
 def get_agent_history_data(query, skip, limit):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     agent_data = db[settings.MONGODB_COLLECTION_AGENT_CHAT].find(query).skip(skip).limit(limit).sort("_id", -1)
     return agent_data
 
 
 def get_recent_chat_history_helper(user_id: str, skip: int = 0, limit: int = 10, agent_id: str = None):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
 
     if agent_id is None:
         match_query = {"user_id": user_id}
@@ -177,37 +191,101 @@ def get_recent_chat_history_helper(user_id: str, skip: int = 0, limit: int = 10,
     ]
     
     result = list(db[settings.MONGODB_COLLECTION_AGENT_CHAT].aggregate(pipeline))
-    client.close()
     return result
 
 def get_chat_history(query):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     total = db[settings.MONGODB_COLLECTION_AGENT_CHAT].count_documents(query)
     result = db[settings.MONGODB_COLLECTION_AGENT_CHAT].find(query)
     return result,total
 
 
 def fetch_user_details(query):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     document = db[settings.MONGODB_COLLECTION_USER].find_one(query)
-    client.close()
     return document
 
 def update_user_credit(query,update_data):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     result = db[settings.MONGODB_COLLECTION_USER].update_one(query,{"$set":{"credit":update_data['credit']}})
-    client.close()
     return str(result.modified_count)
 
 
 def fetch_rag_data(search_query, skip, limit):
-    client = MongoClient(settings.MONGODB_CLUSTER_URL)
-    db = client[settings.MONGODB_DB_NAME]
+    db = get_sync_database()
     collection = db[settings.MONGODB_COLLECTION_RAG_CONFIGS]  # Accessing the 'ragData' collection from the MongoDB instance
     document = collection.find(search_query).sort([("_id", -1)]).skip(int(skip)).limit(int(limit))
     # Querying the collection using the search query, sorting by descending order of _id, and applying skip and limit
-    client.close()
-    return document  # Returning the query result
\ No newline at end of file
+    return document  # Returning the query result
+
+
+# Async (motor) variants of the helpers used on the chat request path. They share the
+# pool settings of the sync helpers above and never block the event loop.
+
+async def aget_agent_data(agent_id):
+    agent_data = config_cache.get(AGENT, agent_id)
+    if agent_data is None:
+        db = get_async_database()
+        agent_data = await db[settings.MONGODB_COLLECTION_AGENT].find_one({"_id": ObjectId(agent_id)})
+        config_cache.set(AGENT, agent_id, agent_data)
+    return agent_data
+
+
+async def aget_environment_data(env_id):
+    env_data = config_cache.get(ENVIRONMENT, env_id)
+    if env_data is None:
+        db = get_async_database()
+        env_data = await db[settings.MONGODB_COLLECTION_AGENT_STUDIO].find_one({"_id": ObjectId(env_id)})
+        config_cache.set(ENVIRONMENT, env_id, env_data)
+    return env_data
+
+
+async def asave_ai_request(request_data):
+    db = get_async_database()
+    request_data['created_at'] = datetime.now()
+    result = await db[settings.MONGODB_COLLECTION_AGENT_CHAT].insert_one(request_data)
+    return str(result.inserted_id)
+
+
+async def afetch_ai_requests_data_by_user_id(query):
+    db = get_async_database()
+    return await db[settings.MONGODB_COLLECTION_AGENT_CHAT].find(query).to_list(length=None)
+
+
+async def afetch_manage_data(search_query, skip, limit):
+    db = get_async_database()
+    return await db[settings.MONGODB_COLLECTION_DATA_MANAGEMENT].find_one(search_query, skip=skip, limit=limit)
+
+
+async def afetch_rag_data(search_query, skip, limit):
+    db = get_async_database()
+    cursor = db[settings.MONGODB_COLLECTION_RAG_CONFIGS].find(search_query).sort([("_id", -1)]).skip(int(skip)).limit(int(limit))
+    return await cursor.to_list(length=int(limit) or None)
+
+
+async def aget_manage_data_by_rag_id(rag_id):
+    manage_data = config_cache.get(DATA_MANAGEMENT, rag_id)
+    if manage_data is None:
+        manage_data = await afetch_manage_data(search_query={"rag_id": rag_id}, skip=0, limit=1)
+        config_cache.set(DATA_MANAGEMENT, rag_id, manage_data)
+    return manage_data
+
+
+async def aget_rag_config(rag_id):
+    rag_data = config_cache.get(RAG_CONFIG, rag_id)
+    if rag_data is None:
+        db = get_async_database()
+        rag_data = await db[settings.MONGODB_COLLECTION_RAG_CONFIGS].find_one({"_id": ObjectId(rag_id)})
+        config_cache.set(RAG_CONFIG, rag_id, rag_data)
+    return rag_data
+
+
+async def afetch_user_details(query):
+    db = get_async_database()
+    return await db[settings.MONGODB_COLLECTION_USER].find_one(query)
+
+
+async def aupdate_user_credit(query, update_data):
+    db = get_async_database()
+    result = await db[settings.MONGODB_COLLECTION_USER].update_one(query, {"$set": {"credit": update_data['credit']}})
+    return str(result.modified_count)
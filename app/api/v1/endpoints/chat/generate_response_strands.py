@@ -9,6 +9,7 @@ import os
 
 from datetime import datetime
 from app.api.v1.endpoints.chat.db_helper import (get_agent_data as fetch_ai_agent_data, fetch_ai_requests_data, get_environment_data, fetch_ai_requests_data_by_user_id)
+from app.api.v1.endpoints.chat.db_helper import (aget_agent_data, aget_environment_data, afetch_ai_requests_data_by_user_id, aget_manage_data_by_rag_id, aget_rag_config, asave_ai_request)
 
 from bson import ObjectId
 import requests
@@ -22,9 +23,13 @@ import json
 import time
 import openai
 from together import Together as Together_client
-from qdrant_client import QdrantClient
+from qdrant_client import QdrantClient, AsyncQdrantClient
+from qdrant_client.http import models
+from cachetools import TTLCache
+from phi.vectordb.bm25 import SPARSE_VECTOR_NAME, bm25_encoder
+from phi.vectordb.quantization import quantization_search_params
 import traceback
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from zep_cloud.client import Zep
 import time
 import json
@@ -32,7 +37,7 @@ import os
 import requests
 import traceback
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from app.core.config import settings
 
 from strands import Agent, tool
@@ -43,6 +48,10 @@ from strands.agent.conversation_manager import SlidingWindowConversationManager
 from strands.agent.state import AgentState
 from qdrant_client import QdrantClient
 from app.schemas.strands_agents import GenerateAgentChatSchema
+from app.api.v1.endpoints.chat.tool_registry import ToolRegistry
+from app.api.v1.endpoints.chat.rerank import build_rerank_stage
+from app.manage_data.tenancy import search_target, tenant_filter
+from app.db.embedding_cache import embedding_cache
 
 import cohere
 
@@ -60,16 +69,199 @@ zep_client = Zep(
 
 
 cohere_client = cohere.ClientV2(api_key=os.getenv("COHERE_API_KEY"))
+async_cohere_client = cohere.AsyncClientV2(api_key=os.getenv("COHERE_API_KEY"))
+rerank_stage = build_rerank_stage(async_cohere_client)
 
 openai.api_type = "openai"
 open_ai_client = OpenAI()
+async_open_ai_client = AsyncOpenAI()
+
+# Shared across requests so the chat path reuses one HTTP connection pool to Qdrant
+async_qdrant_client = AsyncQdrantClient(
+    api_key=settings.QDRANT_API_KEY,
+    url=settings.QDRANT_API_URL
+)
 
 def get_openai_embedding(text: str, model = "text-embedding-ada-002") -> list[float]:
-    user_embedding = open_ai_client.embeddings.create(
-        input=text,
-        model=model
+    def _embed():
+        user_embedding = open_ai_client.embeddings.create(
+            input=text,
+            model=model
+        )
+        return user_embedding.data[0].embedding
+
+    return embedding_cache.get_or_compute(text, f"openai/{model}", _embed)
+
+
+async def aget_openai_embedding(text: str, model = "text-embedding-ada-002") -> list[float]:
+    async def _embed():
+        user_embedding = await async_open_ai_client.embeddings.create(
+            input=text,
+            model=model
+        )
+        return user_embedding.data[0].embedding
+
+    return await embedding_cache.aget_or_compute(text, f"openai/{model}", _embed)
+
+
+# Whether a collection stores BM25 sparse vectors; re-checked every few minutes so newly
+# (re)created collections pick up hybrid search
+_sparse_collections = TTLCache(maxsize=1024, ttl=300)
+
+
+async def _collection_has_sparse(collection_name: str) -> bool:
+    has_sparse = _sparse_collections.get(collection_name)
+    if has_sparse is None:
+        try:
+            info = await async_qdrant_client.get_collection(collection_name)
+            has_sparse = SPARSE_VECTOR_NAME in (info.config.params.sparse_vectors or {})
+        except Exception as e:
+            print(f"[ERROR] Could not read collection config for {collection_name}: {e}")
+            return False
+        _sparse_collections[collection_name] = has_sparse
+    return has_sparse
+
+
+async def search_knowledge_base(
+        collection_name: str,
+        query: str,
+        query_embedding: list[float],
+        search_type: str = settings.RAG_SEARCH_TYPE,
+        limit: int = 15,
+        score_threshold: float = 0.4,
+        tenant: Optional[str] = None
+) -> list:
+    """
+    Dense search, or dense + BM25 fused with reciprocal rank fusion when search_type is
+    "hybrid" and the collection stores sparse vectors. The score threshold applies to
+    the dense candidates; BM25 candidates are kept so exact-term matches (SKUs, error
+    codes) reach the reranker even when their embedding is not close.
+
+    In a shared collection, tenant (the rag_id) restricts every candidate list to that
+    knowledge base.
+    """
+    query_filter = tenant_filter(tenant)
+    # Quantized collections: oversample with the quantized vectors, rescore with the originals
+    search_params = quantization_search_params(
+        settings.QDRANT_QUANTIZATION,
+        rescore=settings.QDRANT_QUANTIZATION_RESCORE,
+        oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING
     )
-    return user_embedding.data[0].embedding
+    if search_type == "hybrid" and await _collection_has_sparse(collection_name):
+        indices, values = bm25_encoder.encode_query(query)
+        prefetch = [
+            models.Prefetch(
+                query=query_embedding,
+                filter=query_filter,
+                params=search_params,
+                limit=limit,
+                score_threshold=score_threshold
+            )
+        ]
+        if indices:
+            prefetch.append(
+                models.Prefetch(
+                    query=models.SparseVector(indices=indices, values=values),
+                    using=SPARSE_VECTOR_NAME,
+                    filter=query_filter,
+                    limit=limit
+                )
+            )
+        response = await async_qdrant_client.query_points(
+            collection_name=collection_name,
+            prefetch=prefetch,
+            query=models.FusionQuery(fusion=models.Fusion.RRF),
+            limit=limit,
+            with_payload=True,
+            with_vectors=False
+        )
+        return response.points
+
+    return await async_qdrant_client.search(
+        collection_name=collection_name,
+        query_vector=query_embedding,
+        query_filter=query_filter,
+        search_params=search_params,
+        limit=limit,
+        score_threshold=score_threshold,
+        with_payload=True,
+        with_vectors=False
+    )
+
+
+async def retrieve_rag_context(rag_id: str, message: str) -> str:
+    """
+    Fetch the RAG configuration, search the knowledge base and rerank the hits for the user message.
+
+    Every step (Mongo, OpenAI embeddings, Qdrant, rerank) is awaited on async clients or a thread
+    pool, so a slow lookup does not stall other requests on the same worker. The reranker comes from
+    the RAG config's "reranker" field (see rerank.py), defaulting to settings.RERANK_DEFAULT.
+
+    Returns:
+        str: The reranked chunks joined into a single context string, or "" if nothing relevant was found.
+    """
+    rag_context = ""
+    try:
+        print("[DEBUG] Fetching manage data for RAG...")
+        manage_data, rag_data = await asyncio.gather(
+            aget_manage_data_by_rag_id(rag_id),
+            aget_rag_config(rag_id)
+        )
+        manage_data_id = str(manage_data['_id'])
+        top_k = rag_data.get('top_k_similarity', 3)
+        rag_model = rag_data.get('embedding_model', 'text-embedding-ada-002')
+
+        print(f"[DEBUG] manage_data: {list(manage_data)}, manage_data_id: {manage_data_id}, rag_model: {rag_model}")
+
+        print(f"[DEBUG] Generating embedding for user query: {message[:100]}...")
+        query_embedding = await aget_openai_embedding(message, model = rag_model)
+        print(f"[DEBUG] Generated query embedding, dimension: {len(query_embedding)}")
+
+        embedding_id, tenant = search_target(rag_id, manage_data_id)
+        print(f"[DEBUG] Searching Qdrant collection: {embedding_id}")
+
+        search_results = await search_knowledge_base(
+            embedding_id,
+            message,
+            query_embedding,
+            search_type=rag_data.get('search_type') or settings.RAG_SEARCH_TYPE,
+            tenant=tenant
+        )
+
+        print(f"[DEBUG] Found {len(search_results)} relevant chunks")
+
+        relevant_contexts = []
+        for result in search_results:
+            score = result.score
+            content = result.payload.get('page_content', '')
+
+            print(f"[DEBUG] Chunk score: {score:.3f}, preview: {content[:100]}...")
+            if content.strip():
+                relevant_contexts.append(content)
+
+        if not relevant_contexts:
+            print("[DEBUG] No relevant context found above threshold")
+            return rag_context
+
+        reranker = rag_data.get('reranker')
+        reranked = await rerank_stage.rerank(message, relevant_contexts, top_n=top_k, name=reranker)
+
+        final_chunks = []
+
+        for idx, score in reranked:
+            final_chunks.append(relevant_contexts[idx])
+            print(f"[DEBUG] Reranked chunk score: {score:.3f}, preview: {relevant_contexts[idx]}...")
+
+        if final_chunks:
+            rag_context += "\n\n---\n\n".join(final_chunks)
+            print(f"[DEBUG] Final RAG context length: {len(rag_context)} characters")
+        else:
+            print("[DEBUG] No relevant context found above threshold")
+
+    except Exception as e:
+        print(f"[ERROR] RAG context retrieval error: {e}")
+
+    return rag_context
 
 
 os.environ['OPENAI_API_TYPE'] = "openai"
@@ -273,11 +465,16 @@ def create_tool(tool_config, user_id, url=None, method=None):
         raise ValueError(f"Tool '{tool_name}' not found in tools_list")
 
 
-def create_strands_tools(tool_configs: List[Dict], user_id: str = None) -> List:
+def create_strands_tools(tool_configs: List[Dict], user_id: str = None) -> Tuple[List, bool]:
     """
     Convert tool configurations to Strands-compatible tools using strands_agents.tools.
+    Tools that fail to construct are left out.
+
+    Returns:
+        tuple: (tools, complete) where complete is False if any tool failed to construct.
     """
     strands_tools = []
+    complete = True
     for config in tool_configs:
         tool_name = config.get('name', '')
         try:
@@ -285,8 +482,13 @@ def create_strands_tools(tool_configs: List[Dict], user_id: str = None) -> List:
             if tool_instance:
                 strands_tools.append(tool_instance)
         except Exception as e:
+            complete = False
             print(f"[ERROR] Could not create tool '{tool_name}': {e}")
-    return strands_tools
+    return strands_tools, complete
+
+
+# Tool sets are built once per distinct environment tool config and shared across chat turns
+tool_registry = ToolRegistry(factory=create_strands_tools)
 
 
 def get_strands_model(model_vendor_client_id: int, llm_config: Dict) -> Any:
@@ -338,7 +540,7 @@ async def generate_rag_response_strands(
             }
 
         print("[DEBUG] Fetching agent data...")
-        gpt_data = fetch_ai_agent_data(agent_id=request.agent_id)
+        gpt_data = await aget_agent_data(agent_id=request.agent_id)
         print(f"[DEBUG] gpt_data: {gpt_data}")
 
         if not gpt_data:
@@ -347,7 +549,7 @@ async def generate_rag_response_strands(
 
         gpt_details = gpt_data
 
-        agent_environment = get_environment_data(env_id=gpt_data['environment'])
+        agent_environment = await aget_environment_data(env_id=gpt_data['environment'])
 
         agent_tools = agent_environment['tools']
         tools = []
@@ -382,7 +584,7 @@ async def generate_rag_response_strands(
         is_memory_enable = any(obj.get('type') == 'MEMORY' for obj in agent_features)
 
         print("[DEBUG] Creating Strands tools...")
-        config_tools = create_strands_tools(tools)
+        config_tools = tool_registry.get(tools)
         print(f"[DEBUG] config_tools: {config_tools}")
 
         message = request.message
@@ -397,76 +599,7 @@ async def generate_rag_response_strands(
                 break
         
         if rag_id:
-            try:
-                print("[DEBUG] Fetching manage data for RAG...")
-                query = {"rag_id": rag_id}
-                manage_data = fetch_manage_data(search_query=query, skip=0, limit=1)
-                rag_data = fetch_rag_data({"_id": ObjectId(rag_id)}, 0, 1)
-                rag_id = str(manage_data['_id'])
-                rag_data = list(rag_data)[0]
-                top_k = rag_data.get('top_k_similarity', 3)
-                print(rag_data)
-                rag_model = rag_data.get('embedding_model', 'text-embedding-ada-002')
-
-                print(f"[DEBUG] manage_data: {list(manage_data)}, rag_id: {rag_id}, rag_model: {rag_model}")
-
-                print(f"[DEBUG] Generating embedding for user query: {message[:100]}...")
-                query_embedding = get_openai_embedding(message, model = rag_model)
-                print(f"[DEBUG] Generated query embedding, dimension: {len(query_embedding)}")
-                
-                embedding_id = f"embedding_{rag_id}"
-                print(f"[DEBUG] Searching Qdrant collection: {embedding_id}")
-                
-                client = QdrantClient(
-                    api_key=settings.QDRANT_API_KEY,
-                    url=settings.QDRANT_API_URL
-                )
-                
-                search_results = client.search(
-                    collection_name=embedding_id,
-                    query_vector=query_embedding,
-                    limit=15,
-                    score_threshold=0.4,
-                    with_payload=True,
-                    with_vectors=False
-                )
-
-                print(f"[DEBUG] Found {len(search_results)} relevant chunks")
-
-                relevant_contexts = []
-                for result in search_results:
-                    score = result.score
-                    content = result.payload.get('page_content', '')
-                    
-                    print(f"[DEBUG] Chunk score: {score:.3f}, preview: {content[:100]}...")
-                    print(len(content))
-                    if content.strip():
-                        relevant_contexts.append(content)
-
-                reranked_data = cohere_client.v2.rerank(
-                    model="rerank-english-v3.0",
-                    documents=relevant_contexts,
-                    query=message,
-                    top_n=top_k
-                )
-
-                final_chunks = []
-
-                for doc in reranked_data.results:
-                    idx = doc.index
-                    if doc.relevance_score > 0.1:
-                        final_chunks.append(relevant_contexts[idx])
-                        print(f"[DEBUG] Reranked chunk score: {doc.relevance_score:.3f}, preview: {relevant_contexts[idx]}...")
-
-                if final_chunks:
-                    rag_context += "\n\n---\n\n".join(final_chunks)
-                    print(f"[DEBUG] Final RAG context length: {len(rag_context)} characters")
-                else:
-                    print("[DEBUG] No relevant context found above threshold")
-                    
-            except Exception as e:
-                print(f"[ERROR] RAG context retrieval error: {e}")
-                # Optional: Add fallback to keyword search here if needed
+            rag_context = await retrieve_rag_context(rag_id=rag_id, message=message)
 
         print("[DEBUG] Building system prompt...")
         if rag_context:
@@ -508,7 +641,7 @@ async def generate_rag_response_strands(
             print("[DEBUG] Loading memory for agent...")
             try:
                 memory_query = {"session_id": request.session_id}
-                memory_details = fetch_ai_requests_data_by_user_id(query=memory_query)
+                memory_details = await afetch_ai_requests_data_by_user_id(query=memory_query)
                 print(f"[DEBUG] memory_details: {memory_details}")
                 for memory in memory_details:
                     initial_messages.extend([
@@ -594,7 +727,7 @@ async def generate_rag_response_strands(
         }
 
         print(f"[DEBUG] Saving AI request data: {data}")
-        save_ai_request(request_data=data)
+        await asave_ai_request(request_data=data)
 
         total_duration = time.time() - function_start_time
         print(f"[DEBUG] Total execution time: {total_duration:.2f} seconds")
@@ -637,7 +770,7 @@ async def generate_rag_response_strands(
                     "input_token_count": len(request.message)
                 }
                 print(f"[DEBUG] Saving error data: {data}")
-                save_ai_request(request_data=data)
+                await asave_ai_request(request_data=data)
 
             return {"text": f"An unexpected error occurred: {str(e)}"}
 
@@ -672,7 +805,7 @@ async def generate_rag_response_strands_streaming_v2(
             return
 
         print("[DEBUG] Fetching agent data...")
-        gpt_data = fetch_ai_agent_data(agent_id=request.agent_id)
+        gpt_data = await aget_agent_data(agent_id=request.agent_id)
         print(f"[DEBUG] gpt_data: {gpt_data}")
 
         if not gpt_data:
@@ -686,7 +819,7 @@ async def generate_rag_response_strands_streaming_v2(
 
         gpt_details = gpt_data
 
-        agent_environment = get_environment_data(env_id=gpt_data['environment'])
+        agent_environment = await aget_environment_data(env_id=gpt_data['environment'])
         name = gpt_details['name']
         print(f"[DEBUG] Agent name: {name}")
 
@@ -721,7 +854,7 @@ async def generate_rag_response_strands_streaming_v2(
         is_memory_enable = any(obj.get('type') == 'SHORT_TERM_MEMORY' for obj in agent_features)
 
         print("[DEBUG] Creating Strands tools...")
-        config_tools = create_strands_tools(tools, user_id)
+        config_tools = tool_registry.get(tools, user_id)
         print(f"[DEBUG] config_tools: {config_tools}")
 
         message = request.message
@@ -736,74 +869,7 @@ async def generate_rag_response_strands_streaming_v2(
                 break
 
         if rag_id:
-            try:
-                print("[DEBUG] Fetching manage data for RAG...")
-                query = {"rag_id": rag_id}
-                manage_data = fetch_manage_data(search_query=query, skip=0, limit=1)
-                rag_data = fetch_rag_data({"_id": ObjectId(rag_id)}, 0, 1)
-                rag_id = str(manage_data['_id'])
-                rag_data = list(rag_data)[0]
-                top_k = rag_data.get('top_k_similarity', 3)
-                rag_model = rag_data.get('embedding_model', 'text-embedding-ada-002')
-
-                print(f"[DEBUG] manage_data: {list(manage_data)}, rag_id: {rag_id}, rag_model: {rag_model}")
-
-                print(f"[DEBUG] Generating embedding for user query: {message[:100]}...")
-                query_embedding = get_openai_embedding(message, model = rag_model)
-                print(f"[DEBUG] Generated query embedding, dimension: {len(query_embedding)}")
-                
-                embedding_id = f"embedding_{rag_id}"
-                print(f"[DEBUG] Searching Qdrant collection: {embedding_id}")
-                
-                client = QdrantClient(
-                    api_key=settings.QDRANT_API_KEY,
-                    url=settings.QDRANT_API_URL
-                )
-                
-                search_results = client.search(
-                    collection_name=embedding_id,
-                    query_vector=query_embedding,
-                    limit=15,
-                    score_threshold=0.4,
-                    with_payload=True,
-                    with_vectors=False
-                )
-
-                print(f"[DEBUG] Found {len(search_results)} relevant chunks")
-
-                relevant_contexts = []
-                for result in search_results:
-                    score = result.score
-                    content = result.payload.get('page_content', '')
-                    
-                    print(f"[DEBUG] Chunk score: {score:.3f}, preview: {content[:100]}...")
-                    print(len(content))
-                    if content.strip():
-                        relevant_contexts.append(content)
-
-                reranked_data = cohere_client.v2.rerank(
-                    model="rerank-english-v3.0",
-                    documents=relevant_contexts,
-                    query=message,
-                    top_n=top_k
-                )
-
-                final_chunks = []
-
-                for doc in reranked_data.results:
-                    idx = doc.index
-                    if doc.relevance_score > 0.1:
-                        final_chunks.append(relevant_contexts[idx])
-                        print(f"[DEBUG] Reranked chunk score: {doc.relevance_score:.3f}, preview: {relevant_contexts[idx]}...")
-
-                if final_chunks:
-                    rag_context += "\n\n---\n\n".join(final_chunks)
-                    print(f"[DEBUG] Final RAG context length: {len(rag_context)} characters")
-                else:
-                    print("[DEBUG] No relevant context found above threshold")
-                    
-            except Exception as e:
-                print(f"[ERROR] RAG context retrieval error: {e}")
+            rag_context = await retrieve_rag_context(rag_id=rag_id, message=message)
 
         print("[DEBUG] Building system prompt...")
         if schema and rag_id:
@@ -845,7 +911,7 @@ async def generate_rag_response_strands_streaming_v2(
             print("[DEBUG] Loading memory for agent...")
             try:
                 memory_query = {"session_id": request.session_id}
-                memory_details = fetch_ai_requests_data_by_user_id(query=memory_query)
+                memory_details = await afetch_ai_requests_data_by_user_id(query=memory_query)
                 print(f"[DEBUG] memory_details: {memory_details}")
                 for memory in memory_details:
                     initial_messages.extend([
@@ -942,7 +1008,7 @@ async def generate_rag_response_strands_streaming_v2(
         }
 
         print(f"[DEBUG] Saving AI request data: {data}")
-        save_ai_request(request_data=data)
+        await asave_ai_request(request_data=data)
 
         total_duration = time.time() - function_start_time
         print(f"[DEBUG] Total execution time: {total_duration:.2f} seconds")
@@ -977,7 +1043,7 @@ async def generate_rag_response_strands_streaming_v2(
                 "input_token_count": len(request.message)
             }
             print(f"[DEBUG] Saving error data: {data}")
-            save_ai_request(request_data=data)
+            await asave_ai_request(request_data=data)
 
             yield f"data:An unexpected error occurred: {str(e)}"
 
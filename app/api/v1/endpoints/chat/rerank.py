@@ -0,0 +1,234 @@
+import asyncio
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Rerankers selectable per RAG config through its "reranker" field
+COHERE = "cohere"
+CROSS_ENCODER = "cross_encoder"
+LEXICAL = "lexical"
+NONE = "none"
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class Reranker:
+    """
+    Reorders retrieved chunks for a query.
+
+    rerank() returns (document index, score) pairs, best first, already filtered by
+    min_score and truncated to top_n.
+    """
+
+    name: str = NONE
+    min_score: Optional[float] = None
+    # False once the reranker is known not to work here (e.g. its model failed to load)
+    available: bool = True
+
+    async def _score(self, query: str, documents: List[str], top_n: int) -> List[Tuple[int, float]]:
+        return [(i, 0.0) for i in range(len(documents))][:top_n]
+
+    async def rerank(self, query: str, documents: List[str], top_n: int) -> List[Tuple[int, float]]:
+        if not documents:
+            return []
+        ranked = await self._score(query, documents, top_n)
+        if self.min_score is not None:
+            ranked = [(index, score) for index, score in ranked if score > self.min_score]
+        return ranked[:top_n]
+
+
+class CohereReranker(Reranker):
+    name = COHERE
+
+    def __init__(self, client, model: str = "rerank-english-v3.0", min_score: float = 0.1):
+        self.client = client
+        self.model = model
+        self.min_score = min_score
+
+    async def _score(self, query: str, documents: List[str], top_n: int) -> List[Tuple[int, float]]:
+        response = await self.client.rerank(model=self.model, documents=documents, query=query, top_n=top_n)
+        return [(result.index, result.relevance_score) for result in response.results]
+
+
+class CrossEncoderReranker(Reranker):
+    """
+    Local cross-encoder (sentence-transformers >= 4.1, optionally on the ONNX backend) scored on
+    CPU. Scoring is batched and runs on a small shared thread pool so it never blocks
+    the event loop. The model is loaded lazily on first use.
+    """
+
+    name = CROSS_ENCODER
+
+    def __init__(
+            self,
+            model_name: str = settings.RERANK_LOCAL_MODEL,
+            backend: str = settings.RERANK_LOCAL_BACKEND,
+            batch_size: int = settings.RERANK_LOCAL_BATCH_SIZE,
+            max_workers: int = settings.RERANK_LOCAL_THREADS,
+            min_score: Optional[float] = settings.RERANK_LOCAL_MIN_SCORE
+    ):
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.min_score = min_score
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rerank")
+        self._model = None
+        self._load_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._model is None:
+            with self._lock:
+                # A failed load is not retried: it is logged once and the reranker marked unavailable
+                if self._load_error is not None:
+                    raise self._load_error
+                if self._model is None:
+                    try:
+                        from sentence_transformers import CrossEncoder
+
+                        start_time = time.perf_counter()
+                        self._model = CrossEncoder(self.model_name, backend=self.backend)
+                    except Exception as e:
+                        self._load_error = e
+                        self.available = False
+                        print(f"[ERROR] Could not load reranker {self.model_name} ({self.backend}), disabling it: {e}")
+                        raise
+                    print(f"[DEBUG] Loaded reranker {self.model_name} ({self.backend}) in {time.perf_counter() - start_time:.2f}s")
+        return self._model
+
+    def _predict(self, query: str, documents: List[str]) -> List[float]:
+        model = self._load()
+        # predict applies a sigmoid to single-label models, so scores are already 0..1 and min_score is model independent
+        scores = model.predict([(query, document) for document in documents], batch_size=self.batch_size)
+        return [float(score) for score in scores]
+
+    async def _score(self, query: str, documents: List[str], top_n: int) -> List[Tuple[int, float]]:
+        loop = asyncio.get_running_loop()
+        scores = await loop.run_in_executor(self._executor, self._predict, query, documents)
+        return sorted(enumerate(scores), key=lambda item: item[1], reverse=True)
+
+
+class LexicalReranker(Reranker):
+    """
+    Dependency-free fallback: BM25 scores over the candidate set, diversified with MMR
+    (maximal marginal relevance) so near-duplicate chunks do not crowd out the context.
+    """
+
+    name = LEXICAL
+
+    def __init__(self, mmr_lambda: float = 0.7, k1: float = 1.5, b: float = 0.75):
+        self.mmr_lambda = mmr_lambda
+        self.k1 = k1
+        self.b = b
+
+    def _bm25(self, query_terms: List[str], documents: List[List[str]]) -> List[float]:
+        avg_length = sum(len(document) for document in documents) / len(documents) or 1.0
+        document_frequency = Counter(term for document in documents for term in set(document))
+        scores = []
+        for document in documents:
+            term_counts = Counter(document)
+            score = 0.0
+            for term in set(query_terms):
+                frequency = term_counts.get(term)
+                if not frequency:
+                    continue
+                idf = math.log(1 + (len(documents) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+                score += idf * frequency * (self.k1 + 1) / (
+                    frequency + self.k1 * (1 - self.b + self.b * len(document) / avg_length)
+                )
+            scores.append(score)
+        return scores
+
+    @staticmethod
+    def _jaccard(a: set, b: set) -> float:
+        return len(a & b) / len(a | b) if a and b else 0.0
+
+    async def _score(self, query: str, documents: List[str], top_n: int) -> List[Tuple[int, float]]:
+        tokens = [_tokenize(document) for document in documents]
+        relevance = self._bm25(_tokenize(query), tokens)
+        top = max(relevance) or 1.0
+        relevance = [score / top for score in relevance]
+        token_sets = [set(document) for document in tokens]
+
+        selected: List[Tuple[int, float]] = []
+        candidates = set(range(len(documents)))
+        while candidates and len(selected) < top_n:
+            def mmr(index: int) -> float:
+                redundancy = max((self._jaccard(token_sets[index], token_sets[j]) for j, _ in selected), default=0.0)
+                return self.mmr_lambda * relevance[index] - (1 - self.mmr_lambda) * redundancy
+
+            best = max(candidates, key=mmr)
+            selected.append((best, relevance[best]))
+            candidates.remove(best)
+        return selected
+
+
+class RerankStage:
+    """
+    Picks a reranker per request and falls back to the lexical reranker when the
+    selected one is unavailable (missing optional dependency, API error), so a rerank
+    failure never drops the RAG context. Keeps per-reranker latency stats.
+    """
+
+    def __init__(self, rerankers: Dict[str, Reranker], default: str = settings.RERANK_DEFAULT):
+        self.rerankers = rerankers
+        self.default = default
+        self.fallback = rerankers.get(LEXICAL) or LexicalReranker()
+        self._calls = defaultdict(int)
+        self._failures = defaultdict(int)
+        self._seconds = defaultdict(float)
+
+    def resolve(self, name: Optional[str]) -> Reranker:
+        reranker = self.rerankers.get(name or self.default) or self.rerankers.get(self.default) or self.fallback
+        return reranker if reranker.available else self.fallback
+
+    async def _timed(self, reranker: Reranker, query: str, documents: List[str], top_n: int) -> List[Tuple[int, float]]:
+        start_time = time.perf_counter()
+        try:
+            return await reranker.rerank(query, documents, top_n)
+        finally:
+            self._calls[reranker.name] += 1
+            self._seconds[reranker.name] += time.perf_counter() - start_time
+
+    async def rerank(self, query: str, documents: List[str], top_n: int, name: Optional[str] = None) -> List[Tuple[int, float]]:
+        reranker = self.resolve(name)
+        try:
+            return await self._timed(reranker, query, documents, top_n)
+        except Exception as e:
+            self._failures[reranker.name] += 1
+            if reranker is self.fallback:
+                raise
+            print(f"[ERROR] Reranker {reranker.name} failed, falling back to {self.fallback.name}: {e}")
+            return await self._timed(self.fallback, query, documents, top_n)
+
+    def stats(self) -> dict:
+        return {
+            "default": self.default,
+            "rerankers": {
+                name: {
+                    "calls": self._calls[name],
+                    "failures": self._failures[name],
+                    "avg_ms": round(self._seconds[name] * 1000 / self._calls[name], 3) if self._calls[name] else 0.0,
+                }
+                for name in set(self._calls) | set(self._failures)
+            },
+        }
+
+
+def build_rerank_stage(cohere_client) -> RerankStage:
+    return RerankStage({
+        COHERE: CohereReranker(cohere_client),
+        CROSS_ENCODER: CrossEncoderReranker(),
+        LEXICAL: LexicalReranker(),
+        NONE: Reranker(),
+    })
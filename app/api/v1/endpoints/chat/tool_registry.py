@@ -0,0 +1,92 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from cachetools import LRUCache
+
+
+class ToolRegistry:
+    """
+    Builds each environment's Strands tool set once and reuses it across chat turns.
+
+    Tool sets are keyed by a hash of the environment's tool configs, so editing an
+    environment's tools produces a new key and a fresh build; stale sets simply age
+    out of the LRU. Toolkits only hold their config and the decorated tool functions,
+    so the same instances can be handed to concurrent agents.
+
+    The factory returns (tools, complete). Incomplete sets, where a toolkit failed to
+    construct (e.g. a transient network error), are returned but not cached, so the next
+    turn tries to build the missing tools again.
+    """
+
+    def __init__(self, factory: Callable[[List[Dict], str], Tuple[List, bool]], maxsize: int = 256):
+        self._factory = factory
+        self._tool_sets = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.builds = 0
+        self.partial_builds = 0
+        self.build_seconds = 0.0
+
+    @staticmethod
+    def config_key(tool_configs: List[Dict], user_id: str = None) -> str:
+        # user_id is only baked into "custom_tool" instances, so other tool sets are shared across users
+        if not any(config.get('name') == "custom_tool" for config in tool_configs):
+            user_id = None
+        payload = json.dumps({"tools": tool_configs, "user_id": user_id}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, tool_configs: List[Dict], user_id: str = None) -> List:
+        key = self.config_key(tool_configs, user_id)
+        with self._lock:
+            tool_set = self._tool_sets.get(key)
+            if tool_set is not None:
+                self.hits += 1
+                return list(tool_set)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Build outside the registry lock so one slow toolkit does not block other environments
+        with key_lock:
+            try:
+                with self._lock:
+                    tool_set = self._tool_sets.get(key)
+                    if tool_set is not None:
+                        self.hits += 1
+                        return list(tool_set)
+
+                start_time = time.perf_counter()
+                tool_set, complete = self._factory(tool_configs, user_id)
+                build_duration = time.perf_counter() - start_time
+                print(f"[DEBUG] Built tool set {key[:12]} in {build_duration * 1000:.1f} ms")
+
+                with self._lock:
+                    if complete:
+                        self._tool_sets[key] = tool_set
+                    else:
+                        self.partial_builds += 1
+                    self.builds += 1
+                    self.build_seconds += build_duration
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+        return list(tool_set)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tool_sets.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "cached_tool_sets": len(self._tool_sets),
+                "hits": self.hits,
+                "builds": self.builds,
+                # Builds with a tool that failed to construct, not cached
+                "partial_builds": self.partial_builds,
+                "avg_build_ms": round(self.build_seconds * 1000 / self.builds, 3) if self.builds else 0.0,
+                # Construction time avoided by serving cached tool sets
+                "saved_build_ms": round(self.build_seconds * 1000 / self.builds * self.hits, 3) if self.builds else 0.0,
+            }
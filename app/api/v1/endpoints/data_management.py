@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from motor.motor_asyncio import AsyncIOMotorClient
 from typing import Optional, List
@@ -6,29 +7,37 @@ from bson import ObjectId
 
 from app.core.config import settings
 from app.db.mongodb import get_database
+from app.db.config_cache import invalidate_rag
 from app.schemas.data_management import (
     CreateManageDataSchema,
     ManageDataResponse,
     UpdateManageDataSchema,
     ManageDataListResponse,
     DataSourceType,
-    DataStatus
+    DataStatus,
+    IngestionJobResponse
 )
-import uuid
-from app.manage_data.read_file_content import file_data
-from app.manage_data.website_scrapper import scrap_website
-from qdrant_client.http.models import PointStruct, VectorParams
+from app.manage_data.read_file_content import file_scope, files_data
+from app.manage_data.incremental import (
+    IncrementalSync,
+    drop_legacy_points,
+    ensure_collection,
+    merge_reports,
+    prune_record,
+    record_scope
+)
+from app.manage_data.ingestion_pipeline import IngestionPipeline, embed_texts
+from app.manage_data.tenancy import knowledge_base_target
+from app.manage_data.website_scrapper import scrap_website, website_scope
+from app.manage_data.ingestion_queue import IngestionQueue, IngestionQueueFull
+from phi.vectordb.bm25 import bm25_encoder
 from qdrant_client import QdrantClient
-from uuid import uuid4
 import sys
 from app.core.config import settings
 import os
 from app.core.auth_middlerware import decode_jwt_token, GuestTokenResp
 
 os.environ["OPENAI_API_KEY"] = settings.OPENAI_API_KEY
-from openai import OpenAI
-
-client = OpenAI()
 
 QDRANT_URL = settings.QDRANT_API_URL
 QDRANT_API_KEY = settings.QDRANT_API_KEY
@@ -39,9 +48,6 @@ qdrant_client = QdrantClient(
     timeout=300
 )
 
-import threading
-from typing import Optional, Union
-
 
 def process_data_source(
         source_type: DataSourceType,
@@ -51,54 +57,104 @@ def process_data_source(
         raw_text: Optional[str] = None,
         max_crawl_depth: Optional[int] = 1,
         max_crawl_page: Optional[int] = 1,
-        dynamic_wait: Optional[int] = 5
-) -> None:
-    """Process different types of data sources in a separate thread"""
+        dynamic_wait: Optional[int] = 5,
+        data_id: Optional[str] = None,
+        progress=None
+) -> dict:
+    """
+    Process different types of data sources. Runs on an ingestion queue worker.
+
+    Points are tagged with data_id, the data record being ingested. Once its sources are
+    stored, the record's points from sources it no longer has are deleted, including all of
+    them when its source type changed; other records of the knowledge base are not touched.
+
+    Returns:
+        dict: Incremental ingestion report with skipped, embedded and deleted chunk counts.
+    """
+    embedding_id, tenant = knowledge_base_target(rag_object_id)
     if source_type == DataSourceType.FILE and files:
-        for _file in files:
-            file_data(url=_file, rag_manage_id=rag_object_id)
+        # Files are downloaded, parsed in the parse process pool and embedded concurrently
+        results = files_data(files, rag_manage_id=rag_object_id, progress=progress, data_id=data_id)
+        prune_record(
+            qdrant_client, embedding_id, data_id, keep_scopes=[file_scope(_file, data_id) for _file in files],
+            tenant=tenant
+        )
+        return merge_reports([file_report for _, _, file_report in results])
 
     elif source_type == DataSourceType.WEBSITE and website_url:
-        scrap_website(rag_object_id, website_url, "1", max_crawl_depth, max_crawl_page, dynamic_wait)
+        sync_report = scrap_website(
+            rag_object_id, website_url, "1", max_crawl_depth, max_crawl_page, dynamic_wait, progress=progress,
+            data_id=data_id
+        )
+        prune_record(
+            qdrant_client, embedding_id, data_id, keep_scopes=[website_scope(website_url, data_id)], tenant=tenant
+        )
+        return sync_report
 
     elif source_type == DataSourceType.RAW_TEXT and raw_text:
-        embedding_id = f"{str(rag_object_id)}"
-
-        if not qdrant_client.collection_exists(embedding_id):
-            qdrant_client.create_collection(
-                collection_name=embedding_id,
-                vectors_config=VectorParams(size=1536, distance='Cosine')
-            )
+        has_sparse = ensure_collection(qdrant_client, embedding_id, multitenant=tenant is not None)
 
         try:
-            if raw_text:
-                metadata = {'title': raw_text}
-                points = []
-                resp = _create_embeddings(raw_text)
-                p_uuid = str(uuid.uuid4())
-                points.append(
-                    PointStruct(id=p_uuid, vector=resp.embedding,
-                                payload={"metadata": metadata, "page_content": raw_text})
-                )
-                qdrant_client.upsert(
-                    collection_name=embedding_id,
-                    points=points
-                )
+            # Scoped to the data record: submitting the same text again is skipped, and editing it
+            # replaces the point of the previous text instead of adding one next to it
+            drop_legacy_points(qdrant_client, embedding_id, tenant=tenant)
+            scope = record_scope("raw_text", data_id)
+            sync = IncrementalSync(
+                qdrant_client, embedding_id, scope=scope, source_type="raw_text", tenant=tenant, data_id=data_id
+            )
+            with IngestionPipeline(
+                    qdrant_client, embedding_id, embed_texts, progress=progress,
+                    sparse_encoder=bm25_encoder if has_sparse else None
+            ) as pipeline:
+                sync.add(pipeline, raw_text, {'title': raw_text})
+            sync_report = sync.finish()
+            prune_record(qdrant_client, embedding_id, data_id, keep_scopes=[scope], tenant=tenant)
+            return sync_report
         except Exception as e:
             exc_type, exc_obj, exc_tb = sys.exc_info()
             print(f"An error occurred on line {exc_tb.tb_lineno}: {str(exc_obj)}")
             raise Exception("Error processing raw text")
 
-    return True
+    return {"skipped": 0, "embedded": 0, "deleted": 0}
+
 
+ingestion_queue = IngestionQueue(
+    handler=process_data_source,
+    max_workers=settings.INGESTION_MAX_WORKERS,
+    max_pending=settings.INGESTION_MAX_PENDING,
+    max_attempts=settings.INGESTION_MAX_ATTEMPTS,
+    backoff_seconds=settings.INGESTION_RETRY_BACKOFF_SECONDS,
+    stale_after_seconds=settings.INGESTION_STALE_JOB_SECONDS
+)
+
+
+def _ingestion_params(data) -> dict:
+    return {
+        'files': data.files,
+        'website_url': data.website_url,
+        'raw_text': data.raw_text,
+        "max_crawl_depth": data.max_crawl_depth,
+        "max_crawl_page": data.max_crawl_page,
+        "dynamic_wait": data.dynamic_wait
+    }
 
-def _create_embeddings(input: str):
-    results = client.embeddings.create(
-        input=[input],
-        model="text-embedding-ada-002"
+
+async def _enqueue_ingestion(db, source_type, rag_object_id, data_id: str, params: dict) -> str:
+    """Queue an ingestion job and link it to the data management record"""
+    try:
+        # enqueue writes the job with pymongo, keep it off the event loop
+        job_id = await asyncio.to_thread(ingestion_queue.enqueue, source_type, rag_object_id, data_id, params)
+    except IngestionQueueFull as e:
+        await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_DATA_MANAGEMENT].update_one(
+            {"_id": ObjectId(data_id)},
+            {"$set": {"status": DataStatus.FAILED, "error_message": str(e), "processed_at": datetime.now()}}
+        )
+        raise HTTPException(status_code=503, detail=str(e))
+    await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_DATA_MANAGEMENT].update_one(
+        {"_id": ObjectId(data_id)},
+        {"$set": {"job_id": job_id}}
     )
-    content = results.data[0]
-    return content
+    return job_id
 
 
 router = APIRouter()
@@ -138,32 +194,24 @@ async def create_data_management(
     else:
         raise HTTPException(status_code=400, detail="No data source provided")
 
-    # Start processing in a separate thread
-    process_thread = threading.Thread(
-        target=process_data_source,
-        args=(source_type, rag_object_id),
-        kwargs={
-            'files': data.files,
-            'website_url': data.website_url,
-            'raw_text': data.raw_text,
-            "max_crawl_depth": data.max_crawl_depth,
-            "max_crawl_page": data.max_crawl_page,
-            "dynamic_wait": data.dynamic_wait
-        }
-    )
-    process_thread.start()
-
-    # Create document
+    # Create document; the ingestion job moves it to processing and then completed or failed
     new_data = {
         **data.model_dump(exclude_none=True),
         "source_type": source_type,
-        "status": DataStatus.COMPLETED,
+        "status": DataStatus.PENDING,
+        "error_message": None,
+        "processed_at": None,
         "created_at": datetime.now(),
         "updated_at": datetime.now(),
         "user_id": user_id
     }
     update_data = {
-        **data.model_dump(exclude_none=True)
+        **data.model_dump(exclude_none=True),
+        "source_type": source_type,
+        "status": DataStatus.PENDING,
+        "error_message": None,
+        "processed_at": None,
+        "updated_at": datetime.now()
     }
 
     existing_data_management = await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_DATA_MANAGEMENT].find_one(
@@ -181,11 +229,14 @@ async def create_data_management(
                 "$set": update_data
             }
         )
+    invalidate_rag(data.rag_id)
 
-    # Get and return the created document
     created_data = await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_DATA_MANAGEMENT].find_one(
         {"rag_id": data.rag_id}
     )
+    created_data["job_id"] = await _enqueue_ingestion(
+        db, source_type, rag_object_id, str(created_data["_id"]), _ingestion_params(data)
+    )
     created_data["id"] = str(created_data.pop("_id"))
     created_data.pop("user_id", None)
 
@@ -237,6 +288,35 @@ async def list_data_management(
     }
 
 
+@router.get("/jobs/{job_id}", response_model=IngestionJobResponse)
+async def get_ingestion_job(
+        job_id: str = Path(..., description="The ID of the ingestion job"),
+        db: AsyncIOMotorClient = Depends(get_database),
+        user_data: GuestTokenResp = Depends(decode_jwt_token)
+):
+    """Get the status and per-stage progress of an ingestion job"""
+    user_id = user_data['email']
+    try:
+        job_object_id = ObjectId(job_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid job ID format")
+
+    job = await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_INGESTION_JOBS].find_one({"_id": job_object_id})
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
+
+    # Jobs are visible to the owner of the data management record they belong to
+    owner = await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_DATA_MANAGEMENT].find_one(
+        {"_id": ObjectId(job["data_id"]), "user_id": user_id}, {"_id": 1}
+    )
+    if not owner:
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
+
+    job["id"] = str(job.pop("_id"))
+    job.pop("params", None)
+    return job
+
+
 @router.get("/{data_id}", response_model=ManageDataResponse)
 async def get_data_management(
         data_id: str = Path(..., description="The ID of the data management request"),
@@ -291,6 +371,7 @@ async def delete_data_management(
         "_id": data_object_id,
         "user_id": "1"
     })
+    invalidate_rag(existing_data.get("rag_id"))
 
     if result.deleted_count == 0:
         raise HTTPException(status_code=400, detail="Delete failed")
@@ -338,24 +419,13 @@ async def update_data_management(
     else:
         raise HTTPException(status_code=400, detail="No data source provided")
 
-    # Start processing in a separate thread
-    process_thread = threading.Thread(
-        target=process_data_source,
-        args=(source_type, rag_object_id),
-        kwargs={
-            'files': data.files,
-            'website_url': data.website_url,
-            'raw_text': data.raw_text,
-            "max_crawl_depth": data.max_crawl_depth,
-            "max_crawl_page": data.max_crawl_page,
-            "dynamic_wait": data.dynamic_wait
-        }
-    )
-    process_thread.start()
-
     # Update document
     update_data = {
         **data.model_dump(exclude_none=True),
+        "source_type": source_type,
+        "status": DataStatus.PENDING,
+        "error_message": None,
+        "processed_at": None,
         "updated_at": datetime.now()
     }
 
@@ -363,14 +433,19 @@ async def update_data_management(
         {"_id": data_object_id},
         {"$set": update_data}
     )
+    invalidate_rag(existing_data.get("rag_id"))
+    invalidate_rag(data.rag_id)
 
     if result.modified_count == 0:
         raise HTTPException(status_code=400, detail="Update failed")
 
+    job_id = await _enqueue_ingestion(db, source_type, rag_object_id, data.data_id, _ingestion_params(data))
+
     # Get and return the updated document
     updated_data = await db[settings.MONGODB_DB_NAME][settings.MONGODB_COLLECTION_DATA_MANAGEMENT].find_one(
         {"_id": data_object_id}
     )
+    updated_data["job_id"] = job_id
     updated_data["id"] = str(updated_data.pop("_id"))
     updated_data.pop("user_id", None)
 
@@ -18,10 +18,9 @@ import base64
 from typing import List, Optional
 from pydantic import BaseModel
 import asyncio
-from pymongo import MongoClient
+from app.db.mongodb import get_sync_client
 
-sync_db = MongoClient(settings.MONGODB_CLUSTER_URL)  # or your MongoDB URI
-# sync_db = client[settings.MONGODB_DB_NAME]
+sync_db = get_sync_client()  # shared, pooled client from app.db.mongodb
 
 
 
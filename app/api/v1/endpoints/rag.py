@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException, Depends, Path
 from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timezone
-from app.schemas.rag.schema import RAGConfigCreate, RAGConfigResponse
+from app.schemas.rag.schema import RAGConfigCreate, RAGConfigResponse, RerankerName, SearchType
 from app.core.config import settings
 from app.db.mongodb import get_database
+from app.db.config_cache import invalidate_rag
 from typing import Optional, List
 from bson import ObjectId
 from pydantic import BaseModel
@@ -26,6 +27,8 @@ class RAGConfigUpdate(BaseModel):
     llm_embedding_model: Optional[str] = None
     llm_api_key: Optional[str] = None
     top_k_similarity: Optional[int] = None
+    reranker: Optional[RerankerName] = None
+    search_type: Optional[SearchType] = None
 
     class Config:
         extra = "forbid"
@@ -164,6 +167,7 @@ async def update_rag_config(
         {"_id": rag_object_id},
         {"$set": update_data}
     )
+    invalidate_rag(updates.rag_id)
 
     if result.modified_count == 0:
         raise HTTPException(status_code=400, detail="Update failed")
@@ -207,6 +211,7 @@ async def delete_rag_config(
         "_id": rag_object_id,
         "user_id": "1"
     })
+    invalidate_rag(rag_id)
 
     if result.deleted_count == 0:
         raise HTTPException(status_code=400, detail="Delete failed")
@@ -5,16 +5,15 @@ from app.core.config import settings
 from datetime import datetime
 from openai import OpenAI
 from app.core.config import settings
-from pymongo import MongoClient
+from app.db.mongodb import get_sync_client
 from starlette.responses import JSONResponse
 from app.schemas.strands_agents import GenerateAgentChatSchema
 from app.api.v1.endpoints.chat.generate_response_strands import generate_rag_response_strands, generate_rag_response_strands_streaming_v2
 from fastapi.responses import StreamingResponse
 from bson import ObjectId
 from app.core.auth_middlerware import decode_jwt_token, GuestTokenResp
-from app.api.v1.endpoints.chat.agent_chat import fetch_ai_agent_data
-sync_db = MongoClient(settings.MONGODB_CLUSTER_URL)  # or your MongoDB URI
-# sync_db = client[settings.MONGODB_DB_NAME]
+from app.api.v1.endpoints.chat.db_helper import aget_agent_data
+sync_db = get_sync_client()  # shared, pooled client from app.db.mongodb
 
 
 
@@ -34,7 +33,7 @@ async def generate_data_strands(
     response_id = str(ObjectId())
 
     # Fetch agent data using the agent ID from the request
-    gpt_data = fetch_ai_agent_data(agent_id=body.agent_id)
+    gpt_data = await aget_agent_data(agent_id=body.agent_id)
 
     email_id = gpt_data['user_id']
     email_query = {
@@ -33,6 +33,76 @@ class Settings(BaseSettings):
     MONGODB_COLLECTION_RAG_LOGS: str = os.environ.get("MONGODB_COLLECTION_RAG_LOGS")
     MONGODB_COLLECTION_AGENT_WAITLIST: str = os.environ.get("MONGODB_COLLECTION_AGENT_WAITLIST")
     MONGODB_COLLECTION_CONTACT_US: str = os.environ.get("MONGODB_COLLECTION_CONTACT_US")
+    # MongoDB connection pool settings (shared by the sync and async clients)
+    MONGODB_MAX_POOL_SIZE: int = int(os.environ.get("MONGODB_MAX_POOL_SIZE", 100))
+    MONGODB_MIN_POOL_SIZE: int = int(os.environ.get("MONGODB_MIN_POOL_SIZE", 0))
+    MONGODB_MAX_IDLE_TIME_MS: int = int(os.environ.get("MONGODB_MAX_IDLE_TIME_MS", 300000))
+    MONGODB_CONNECT_TIMEOUT_MS: int = int(os.environ.get("MONGODB_CONNECT_TIMEOUT_MS", 10000))
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = int(os.environ.get("MONGODB_SERVER_SELECTION_TIMEOUT_MS", 10000))
+    MONGODB_SOCKET_TIMEOUT_MS: int = int(os.environ.get("MONGODB_SOCKET_TIMEOUT_MS", 30000))
+    # Agent / environment / RAG config document cache
+    CONFIG_CACHE_MAXSIZE: int = int(os.environ.get("CONFIG_CACHE_MAXSIZE", 1024))
+    CONFIG_CACHE_TTL_SECONDS: int = int(os.environ.get("CONFIG_CACHE_TTL_SECONDS", 60))
+    # Query embedding cache; EMBEDDING_CACHE_BACKEND is "", "sqlite" or "mongo"
+    EMBEDDING_CACHE_MAXSIZE: int = int(os.environ.get("EMBEDDING_CACHE_MAXSIZE", 10000))
+    EMBEDDING_CACHE_BACKEND: str = os.environ.get("EMBEDDING_CACHE_BACKEND", "")
+    EMBEDDING_CACHE_SQLITE_PATH: str = os.environ.get("EMBEDDING_CACHE_SQLITE_PATH", "embedding_cache.sqlite")
+    MONGODB_COLLECTION_EMBEDDING_CACHE: str = os.environ.get("MONGODB_COLLECTION_EMBEDDING_CACHE", "embedding_cache")
+    # Tool result cache; TOOL_CACHE_BACKEND is "" or "mongo", TOOL_CACHE_TTLS is a JSON object of
+    # tool name -> TTL seconds overriding the toolkit defaults (0 disables caching for a tool)
+    TOOL_CACHE_MAXSIZE: int = int(os.environ.get("TOOL_CACHE_MAXSIZE", 2048))
+    TOOL_CACHE_BACKEND: str = os.environ.get("TOOL_CACHE_BACKEND", "")
+    TOOL_CACHE_TTLS: str = os.environ.get("TOOL_CACHE_TTLS", "{}")
+    MONGODB_COLLECTION_TOOL_CACHE: str = os.environ.get("MONGODB_COLLECTION_TOOL_CACHE", "tool_cache")
+
+    # Data management ingestion job queue
+    MONGODB_COLLECTION_INGESTION_JOBS: str = os.environ.get("MONGODB_COLLECTION_INGESTION_JOBS", "ingestion_jobs")
+    INGESTION_MAX_WORKERS: int = int(os.environ.get("INGESTION_MAX_WORKERS", 4))
+    INGESTION_MAX_PENDING: int = int(os.environ.get("INGESTION_MAX_PENDING", 100))
+    INGESTION_MAX_ATTEMPTS: int = int(os.environ.get("INGESTION_MAX_ATTEMPTS", 3))
+    INGESTION_RETRY_BACKOFF_SECONDS: float = float(os.environ.get("INGESTION_RETRY_BACKOFF_SECONDS", 5))
+    INGESTION_STALE_JOB_SECONDS: int = int(os.environ.get("INGESTION_STALE_JOB_SECONDS", 1800))
+    # Pipelined chunk -> embed -> upsert ingestion
+    INGESTION_EMBED_BATCH_SIZE: int = int(os.environ.get("INGESTION_EMBED_BATCH_SIZE", 64))
+    INGESTION_EMBED_CONCURRENCY: int = int(os.environ.get("INGESTION_EMBED_CONCURRENCY", 4))
+    INGESTION_UPSERT_BATCH_SIZE: int = int(os.environ.get("INGESTION_UPSERT_BATCH_SIZE", 256))
+    INGESTION_UPSERT_CONCURRENCY: int = int(os.environ.get("INGESTION_UPSERT_CONCURRENCY", 2))
+    INGESTION_LOG_BATCH_SIZE: int = int(os.environ.get("INGESTION_LOG_BATCH_SIZE", 100))
+    # Ingestion logs keep at most this much of a file's or page's text
+    INGESTION_LOG_CONTENT_MAX_CHARS: int = int(os.environ.get("INGESTION_LOG_CONTENT_MAX_CHARS", 100000))
+    # Chunking for ingestion, see phi.document.chunking; "separator" matches the previous splitter's output
+    INGESTION_CHUNK_STRATEGY: str = os.environ.get("INGESTION_CHUNK_STRATEGY", "separator")
+    INGESTION_CHUNK_SIZE: int = int(os.environ.get("INGESTION_CHUNK_SIZE", 5000))
+    INGESTION_CHUNK_OVERLAP: int = int(os.environ.get("INGESTION_CHUNK_OVERLAP", 0))
+    # File parsing worker processes (0 = one per CPU) and per-file parse timeout
+    INGESTION_PARSE_PROCESSES: int = int(os.environ.get("INGESTION_PARSE_PROCESSES", 0))
+    INGESTION_PARSE_TIMEOUT_SECONDS: int = int(os.environ.get("INGESTION_PARSE_TIMEOUT_SECONDS", 600))
+    # Sitemap discovery: sitemaps fetched at once, and a cap on the urls collected (0 = no cap)
+    SITEMAP_FETCH_CONCURRENCY: int = int(os.environ.get("SITEMAP_FETCH_CONCURRENCY", 8))
+    SITEMAP_MAX_URLS: int = int(os.environ.get("SITEMAP_MAX_URLS", 0))
+    # RAG rerank stage; RERANK_DEFAULT is "cohere", "cross_encoder", "lexical" or "none"
+    RERANK_DEFAULT: str = os.environ.get("RERANK_DEFAULT", "cohere")
+    RERANK_LOCAL_MODEL: str = os.environ.get("RERANK_LOCAL_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+    RERANK_LOCAL_BACKEND: str = os.environ.get("RERANK_LOCAL_BACKEND", "onnx")
+    RERANK_LOCAL_BATCH_SIZE: int = int(os.environ.get("RERANK_LOCAL_BATCH_SIZE", 32))
+    RERANK_LOCAL_THREADS: int = int(os.environ.get("RERANK_LOCAL_THREADS", 2))
+    RERANK_LOCAL_MIN_SCORE: float = float(os.environ.get("RERANK_LOCAL_MIN_SCORE", 0.1))
+    # RAG retrieval: "vector" or "hybrid" (dense + BM25 with RRF, for collections with sparse vectors).
+    # Hybrid is opt-in, per RAG config through its "search_type" field or for every RAG through this variable
+    RAG_SEARCH_TYPE: str = os.environ.get("RAG_SEARCH_TYPE", "vector")
+    # Store every knowledge base in shared collections filtered by a rag_id payload instead of
+    # one collection per RAG; knowledge bases are spread over SHARDS collections by rag_id
+    QDRANT_SHARED_COLLECTIONS: bool = os.environ.get("QDRANT_SHARED_COLLECTIONS", "false").lower() == "true"
+    QDRANT_SHARED_COLLECTION_NAME: str = os.environ.get("QDRANT_SHARED_COLLECTION_NAME", "knowledge_base")
+    QDRANT_SHARED_COLLECTION_SHARDS: int = int(os.environ.get("QDRANT_SHARED_COLLECTION_SHARDS", 1))
+    # Vector storage for new collections: QDRANT_QUANTIZATION is "none", "scalar" (int8) or "binary";
+    # with QDRANT_VECTORS_ON_DISK the original vectors are kept on disk and only read for rescoring
+    QDRANT_QUANTIZATION: str = os.environ.get("QDRANT_QUANTIZATION", "none")
+    QDRANT_QUANTIZATION_ALWAYS_RAM: bool = os.environ.get("QDRANT_QUANTIZATION_ALWAYS_RAM", "true").lower() == "true"
+    QDRANT_QUANTIZATION_RESCORE: bool = os.environ.get("QDRANT_QUANTIZATION_RESCORE", "true").lower() == "true"
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = float(os.environ.get("QDRANT_QUANTIZATION_OVERSAMPLING", 2.0))
+    QDRANT_VECTORS_ON_DISK: bool = os.environ.get("QDRANT_VECTORS_ON_DISK", "false").lower() == "true"
+    CONFIG_CACHE_WATCH_CHANGES: bool = os.environ.get("CONFIG_CACHE_WATCH_CHANGES", "false").lower() == "true"
     # WhatsApp Settings
     WHATSAPP_ACCESS_TOKEN: str = os.environ.get("WHATSAPP_ACCESS_TOKEN")
     WHATSAPP_PHONE_NUMBER_ID: str = os.environ.get("WHATSAPP_PHONE_NUMBER_ID")
@@ -58,6 +128,12 @@ class Settings(BaseSettings):
     SENDGRID_FROM_EMAIL: str = "hello@theunderdogcrew.com"
     ADMIN_EMAIL: str = "hello@theunderdogcrew.com"
     FIRECRAWL_API_KEY: str = os.environ.get("FIRECRAWL_API_KEY")
+    # Seconds between status checks of a firecrawl crawl; scraped pages are ingested after each check
+    FIRECRAWL_POLL_SECONDS: float = float(os.environ.get("FIRECRAWL_POLL_SECONDS", 2))
+    # Browsers shared by Crawl4aiTools: max browsers, pages open per browser, crawls before a restart
+    CRAWL4AI_BROWSERS: int = int(os.environ.get("CRAWL4AI_BROWSERS", 2))
+    CRAWL4AI_PAGES_PER_BROWSER: int = int(os.environ.get("CRAWL4AI_PAGES_PER_BROWSER", 4))
+    CRAWL4AI_RECYCLE_AFTER: int = int(os.environ.get("CRAWL4AI_RECYCLE_AFTER", 200))
 
 
     
@@ -0,0 +1,139 @@
+import asyncio
+import copy
+import threading
+from collections import defaultdict
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+
+AGENT = "agent"
+ENVIRONMENT = "environment"
+RAG_CONFIG = "rag_config"
+DATA_MANAGEMENT = "data_management"
+
+
+class ConfigCache:
+    """
+    Bounded LRU + TTL cache for rarely changing configuration documents
+    (agents, environments, RAG configs, data management records).
+
+    Entries are keyed by (namespace, id). Callers get a deep copy so mutating a
+    returned document never leaks into the cache.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._hits = defaultdict(int)
+        self._misses = defaultdict(int)
+        self._invalidations = defaultdict(int)
+
+    def get(self, namespace: str, key: str):
+        with self._lock:
+            value = self._cache.get((namespace, str(key)))
+            if value is None:
+                self._misses[namespace] += 1
+                return None
+            self._hits[namespace] += 1
+        return copy.deepcopy(value)
+
+    def set(self, namespace: str, key: str, value) -> None:
+        if value is None:
+            return
+        with self._lock:
+            self._cache[(namespace, str(key))] = copy.deepcopy(value)
+
+    def invalidate(self, namespace: str, key: str = None) -> None:
+        """
+        Drop one entry, or every entry of the namespace when no key is given.
+        """
+        with self._lock:
+            if key is not None:
+                self._cache.pop((namespace, str(key)), None)
+            else:
+                for cache_key in [k for k in self._cache.keys() if k[0] == namespace]:
+                    self._cache.pop(cache_key, None)
+            self._invalidations[namespace] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            namespaces = set(self._hits) | set(self._misses) | set(self._invalidations)
+            per_namespace = {}
+            for namespace in namespaces:
+                hits, misses = self._hits[namespace], self._misses[namespace]
+                per_namespace[namespace] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "invalidations": self._invalidations[namespace],
+                    "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                }
+            return {
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl_seconds": self._cache.ttl,
+                "namespaces": per_namespace,
+            }
+
+
+config_cache = ConfigCache(
+    maxsize=settings.CONFIG_CACHE_MAXSIZE,
+    ttl=settings.CONFIG_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_agent(agent_id) -> None:
+    config_cache.invalidate(AGENT, agent_id)
+
+
+def invalidate_environment(env_id) -> None:
+    config_cache.invalidate(ENVIRONMENT, env_id)
+
+
+def invalidate_rag(rag_id) -> None:
+    """
+    RAG configs and their data management records are both keyed by rag_id.
+    """
+    config_cache.invalidate(RAG_CONFIG, rag_id)
+    config_cache.invalidate(DATA_MANAGEMENT, rag_id)
+
+
+async def watch_config_changes(db) -> None:
+    """
+    Invalidate cache entries written by other workers, using a Mongo change stream.
+
+    Requires a replica set (Atlas clusters qualify). Data management records are
+    cached by rag_id, which is not part of a delete event, so any change there
+    clears that whole namespace.
+    """
+    namespaces = {
+        settings.MONGODB_COLLECTION_AGENT: AGENT,
+        settings.MONGODB_COLLECTION_AGENT_STUDIO: ENVIRONMENT,
+        settings.MONGODB_COLLECTION_RAG_CONFIGS: RAG_CONFIG,
+        settings.MONGODB_COLLECTION_DATA_MANAGEMENT: DATA_MANAGEMENT,
+    }
+    pipeline = [
+        {"$match": {
+            "ns.coll": {"$in": list(namespaces)},
+            "operationType": {"$in": ["update", "replace", "delete"]}
+        }}
+    ]
+    while True:
+        try:
+            async with db.watch(pipeline) as stream:
+                async for change in stream:
+                    namespace = namespaces.get(change["ns"]["coll"])
+                    if namespace == DATA_MANAGEMENT:
+                        config_cache.invalidate(DATA_MANAGEMENT)
+                    elif namespace is not None:
+                        config_cache.invalidate(namespace, change["documentKey"]["_id"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[ERROR] Config cache change stream error: {e}")
+            config_cache.clear()
+            await asyncio.sleep(5)
@@ -0,0 +1,15 @@
+from app.core.config import settings
+from app.db.mongodb import get_sync_database
+from phi.embedder.cache import default_embedding_cache, SqliteEmbeddingStore, MongoEmbeddingStore
+
+# The app and phi's vector db query paths share phi's process-wide embedding cache;
+# this module only applies the app's sizing and persistent-tier settings to it.
+embedding_cache = default_embedding_cache
+embedding_cache.maxsize = settings.EMBEDDING_CACHE_MAXSIZE
+
+if settings.EMBEDDING_CACHE_BACKEND == "sqlite":
+    embedding_cache.store = SqliteEmbeddingStore(settings.EMBEDDING_CACHE_SQLITE_PATH)
+elif settings.EMBEDDING_CACHE_BACKEND == "mongo":
+    embedding_cache.store = MongoEmbeddingStore(
+        get_sync_database()[settings.MONGODB_COLLECTION_EMBEDDING_CACHE]
+    )
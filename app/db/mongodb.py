@@ -1,12 +1,139 @@
+import threading
+import time
+from collections import defaultdict
+
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient, monitoring
 from app.core.config import settings
 
 
+class CommandLatencyListener(monitoring.CommandListener):
+    """
+    Records per-command counters and latency for every MongoDB operation
+    issued through the pooled clients.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {"count": 0, "failures": 0, "total_ms": 0.0, "max_ms": 0.0})
+
+    def _record(self, command_name, duration_micros, failed=False):
+        duration_ms = duration_micros / 1000.0
+        with self._lock:
+            stats = self._stats[command_name]
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            if failed:
+                stats["failures"] += 1
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event.command_name, event.duration_micros)
+
+    def failed(self, event):
+        self._record(event.command_name, event.duration_micros, failed=True)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {
+                    **stats,
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 3) if stats["count"] else 0.0,
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class PoolEventListener(monitoring.ConnectionPoolListener):
+    """
+    Counts connections opened by the pool, i.e. the handshakes (TCP + TLS + auth)
+    actually paid, versus connections checked out of the pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.checkouts = 0
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_closed += 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checkouts += 1
+
+    def connection_checked_in(self, event):
+        pass
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "connections_created": self.connections_created,
+                "connections_closed": self.connections_closed,
+                "checkouts": self.checkouts,
+            }
+
+
+command_listener = CommandLatencyListener()
+pool_listener = PoolEventListener()
+
+
+def _client_options() -> dict:
+    """
+    Pool sizing and timeouts shared by the sync (pymongo) and async (motor) clients.
+    """
+    return {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGODB_MAX_IDLE_TIME_MS,
+        "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "socketTimeoutMS": settings.MONGODB_SOCKET_TIMEOUT_MS,
+        "event_listeners": [command_listener, pool_listener],
+    }
+
+
 class MongoDB:
     client: AsyncIOMotorClient = None
+    sync_client: MongoClient = None
 
 
 db = MongoDB()
+_sync_client_lock = threading.Lock()
 
 
 async def get_database() -> AsyncIOMotorClient:
@@ -14,9 +141,69 @@ async def get_database() -> AsyncIOMotorClient:
 
 
 async def connect_to_mongo():
-    db.client = AsyncIOMotorClient(settings.mongodb_connection_string)
+    db.client = AsyncIOMotorClient(settings.mongodb_connection_string, **_client_options())
 
 
 async def close_mongo_connection():
     if db.client:
         db.client.close()
+        db.client = None
+    close_sync_client()
+
+
+def get_sync_client() -> MongoClient:
+    """
+    Return the process-wide pymongo client, creating it on first use.
+
+    pymongo clients are thread-safe and keep their own connection pool, so a single
+    instance is shared by all sync helpers and background threads.
+    """
+    if db.sync_client is None:
+        with _sync_client_lock:
+            if db.sync_client is None:
+                db.sync_client = MongoClient(
+                    settings.MONGODB_CLUSTER_URL or settings.mongodb_connection_string,
+                    **_client_options()
+                )
+    return db.sync_client
+
+
+def get_sync_database():
+    """
+    Return the application database on the shared sync client.
+    """
+    return get_sync_client()[settings.MONGODB_DB_NAME]
+
+
+def get_async_database():
+    """
+    Return the application database on the shared motor client.
+    """
+    if db.client is None:
+        db.client = AsyncIOMotorClient(settings.mongodb_connection_string, **_client_options())
+    return db.client[settings.MONGODB_DB_NAME]
+
+
+def close_sync_client():
+    with _sync_client_lock:
+        if db.sync_client is not None:
+            db.sync_client.close()
+            db.sync_client = None
+
+
+def get_mongo_stats() -> dict:
+    """
+    Pool configuration, connection counters and per-operation latency for both clients.
+    """
+    return {
+        "pool": {
+            "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+            "min_pool_size": settings.MONGODB_MIN_POOL_SIZE,
+            "connect_timeout_ms": settings.MONGODB_CONNECT_TIMEOUT_MS,
+            "server_selection_timeout_ms": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            "socket_timeout_ms": settings.MONGODB_SOCKET_TIMEOUT_MS,
+            **pool_listener.snapshot(),
+        },
+        "operations": command_listener.snapshot(),
+        "collected_at": time.time(),
+    }
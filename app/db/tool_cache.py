@@ -0,0 +1,16 @@
+import json
+
+from app.core.config import settings
+from app.db.mongodb import get_sync_database
+from phi.tools.cache import default_tool_cache, MongoToolResultStore
+
+# phi and strands toolkits cache pure lookups in phi's process-wide tool result cache;
+# this module only applies the app's sizing, TTL overrides and shared tier to it.
+tool_cache = default_tool_cache
+tool_cache.maxsize = settings.TOOL_CACHE_MAXSIZE
+
+for tool_name, ttl in json.loads(settings.TOOL_CACHE_TTLS or "{}").items():
+    tool_cache.set_ttl(tool_name, float(ttl))
+
+if settings.TOOL_CACHE_BACKEND == "mongo":
+    tool_cache.store = MongoToolResultStore(get_sync_database()[settings.MONGODB_COLLECTION_TOOL_CACHE])
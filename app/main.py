@@ -1,12 +1,25 @@
+import asyncio
+
 from fastapi import FastAPI
 from app.api.v1.endpoints import agent_environment, rag, data_management, whatsapp_msg, agent, profile, file_upload, agent_app, dashboard, subscription, contact_us, image_generation, strands_agents
 from app.api.v1.endpoints.chat import agent_chat
+from app.api.v1.endpoints.chat.generate_response_strands import tool_registry, rerank_stage
 from app.core.config import settings
-from app.db.mongodb import connect_to_mongo, close_mongo_connection
+from app.db.mongodb import connect_to_mongo, close_mongo_connection, get_mongo_stats, get_async_database
+from app.db.config_cache import config_cache, watch_config_changes
+from app.db.embedding_cache import embedding_cache
+from app.db.tool_cache import tool_cache
+from app.manage_data.file_parser import shutdown_parse_pool
+from strands_agents.tools.crawl4ai_tools import default_browser_pool
 from fastapi.middleware.cors import CORSMiddleware
 
 app = FastAPI(title=settings.PROJECT_NAME)
 
+# Browsers are started by the first crawl, so size the shared pool before any request
+default_browser_pool.size = settings.CRAWL4AI_BROWSERS
+default_browser_pool.pages_per_browser = settings.CRAWL4AI_PAGES_PER_BROWSER
+default_browser_pool.recycle_after = settings.CRAWL4AI_RECYCLE_AFTER
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -36,11 +49,67 @@ app.include_router(image_generation.router, prefix=f"{settings.API_V1_STR}/image
 app.include_router(strands_agents.router, prefix=f"{settings.API_V1_STR}/strands-agents", tags=["strands-agents"])
 
 
+config_cache_watcher: asyncio.Task = None
+
+
 @app.on_event("startup")
 async def startup_db_client():
+    global config_cache_watcher
     await connect_to_mongo()
+    if settings.CONFIG_CACHE_WATCH_CHANGES:
+        config_cache_watcher = asyncio.create_task(watch_config_changes(get_async_database()))
+    # Start the ingestion workers and pick up jobs left over from a previous run
+    try:
+        resumed = await asyncio.to_thread(data_management.ingestion_queue.resume_pending)
+        print(f"[DEBUG] Ingestion queue started, resumed {resumed} pending jobs")
+    except Exception as e:
+        print(f"[ERROR] Could not resume ingestion jobs: {e}")
 
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if config_cache_watcher is not None:
+        config_cache_watcher.cancel()
+    shutdown_parse_pool()
+    await asyncio.to_thread(default_browser_pool.close)
     await close_mongo_connection()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/mongo", tags=["metrics"])
+async def mongo_metrics():
+    return get_mongo_stats()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/config-cache", tags=["metrics"])
+async def config_cache_metrics():
+    return config_cache.stats()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/tool-registry", tags=["metrics"])
+async def tool_registry_metrics():
+    return tool_registry.stats()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/embedding-cache", tags=["metrics"])
+async def embedding_cache_metrics():
+    return embedding_cache.stats()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/tool-cache", tags=["metrics"])
+async def tool_cache_metrics():
+    return tool_cache.stats()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/rerank", tags=["metrics"])
+async def rerank_metrics():
+    return rerank_stage.stats()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/ingestion-queue", tags=["metrics"])
+async def ingestion_queue_metrics():
+    return data_management.ingestion_queue.stats()
+
+
+@app.get(f"{settings.API_V1_STR}/metrics/browser-pool", tags=["metrics"])
+async def browser_pool_metrics():
+    return default_browser_pool.stats()
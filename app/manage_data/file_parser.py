@@ -0,0 +1,146 @@
+import json
+import multiprocessing
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from llama_parse import LlamaParse
+import pymupdf
+import pymupdf4llm
+from app.core.config import settings
+
+# This module is imported by the parse worker processes: keep it free of database and
+# Qdrant clients so starting a worker stays cheap.
+
+parser = LlamaParse(
+    api_key=settings.LLAMA_CLOUD_API_KEY,  # can also be set in your env as LLAMA_CLOUD_API_KEY
+    result_type="markdown",  # "markdown" and "text" are available
+    num_workers=4,  # if multiple files passed, split in `num_workers` API calls
+    verbose=True,
+    language="en",  # Optionally you can define a language, default=en
+)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class ParseTimeout(Exception):
+    pass
+
+
+def iter_parsed_pages(path):
+    """
+    Yield the markdown of each page. LlamaParse returns one document per page; the local
+    fallback converts one page at a time so large PDFs are never rendered in one go.
+    """
+    try:
+        documents = parser.load_data(path)
+    except ParseTimeout:
+        # The file's time is used up, the fallback would run without a timeout
+        raise
+    except Exception as e:
+        print(f"[ERROR] LlamaParse failed, falling back to pymupdf4llm: {e}")
+        documents = None
+
+    if documents is not None:
+        for document in documents:
+            yield document.text
+        return
+
+    pdf = pymupdf.open(path)
+    try:
+        for page_number in range(pdf.page_count):
+            yield pymupdf4llm.to_markdown(pdf, pages=[page_number])
+    finally:
+        pdf.close()
+
+
+def _raise_timeout(signum, frame):
+    raise ParseTimeout()
+
+
+def parse_file(path, pages_path, timeout=None):
+    """
+    Parse a downloaded file, appending each page to pages_path (one JSON string per line) as
+    soon as it is parsed, so the parent can chunk and embed while parsing continues and no
+    page list is held or pickled. Runs in a parse worker process; timeout (seconds) is
+    enforced with SIGALRM, which interrupts the worker's main thread.
+
+    Returns:
+        int: Number of pages written.
+    """
+    use_alarm = bool(timeout) and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(int(timeout))
+    try:
+        count = 0
+        with open(pages_path, "w", encoding="utf-8") as pages_file:
+            for page in iter_parsed_pages(path):
+                pages_file.write(json.dumps(page) + "\n")
+                pages_file.flush()
+                count += 1
+        return count
+    except ParseTimeout:
+        raise TimeoutError(f"Parsing {path} took longer than {timeout}s")
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+def iter_spooled_pages(pages_path, future, poll_interval=0.05):
+    """
+    Yield the pages parse_file writes to pages_path while its future is still running, then
+    raise its error, if any. A line is only read once complete, so pages are never split.
+    """
+    partial = ""
+    with open(pages_path, encoding="utf-8") as pages_file:
+        while True:
+            # Checked before reading, so pages written before the worker finished are not missed
+            finished = future.done()
+            for line in iter(pages_file.readline, ""):
+                if line.endswith("\n"):
+                    yield json.loads(partial + line)
+                    partial = ""
+                else:
+                    partial += line
+            if finished:
+                break
+            time.sleep(poll_interval)
+    future.result()
+
+
+def get_parse_pool():
+    """
+    Process pool shared by every ingestion worker, so parsing uses all cores instead of
+    the GIL-bound thread of one job. Workers are spawned, not forked, because the API
+    process holds client threads and sockets that must not be copied.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.INGESTION_PARSE_PROCESSES or None,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def reset_parse_pool(pool):
+    """Drop a pool whose worker died (BrokenProcessPool); the next call creates a new one"""
+    global _pool
+    with _pool_lock:
+        # Another job may already have replaced it
+        if _pool is pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def shutdown_parse_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
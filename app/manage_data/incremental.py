@@ -0,0 +1,243 @@
+import hashlib
+import uuid
+from typing import Dict, List, Optional, Set
+
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    HnswConfigDiff,
+    IsEmptyCondition,
+    KeywordIndexParams,
+    MatchAny,
+    MatchValue,
+    Modifier,
+    PayloadField,
+    PayloadSchemaType,
+    PointIdsList,
+    SparseVectorParams,
+    VectorParams,
+)
+
+from app.core.config import settings
+from phi.vectordb.bm25 import SPARSE_VECTOR_NAME
+from phi.vectordb.quantization import quantization_config
+
+# Fixed namespace so the same (scope, chunk) always maps to the same point id
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c3f0e-2a55-4c1e-9a53-0d5c1b1f8e21")
+
+SCOPE_FIELD = "ingest_scope"
+TYPE_FIELD = "ingest_type"
+HASH_FIELD = "content_hash"
+# Knowledge base a point belongs to in shared (multitenant) collections, see tenancy.py
+TENANT_FIELD = "rag_id"
+# Data management record that ingested the point
+DATA_ID_FIELD = "data_id"
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def tenant_scope(scope: str, tenant: Optional[str] = None) -> str:
+    """Scope used for point ids; shared collections qualify it so tenants never share ids"""
+    return scope if tenant is None else f"{tenant}\x00{scope}"
+
+
+def record_scope(scope: str, data_id: Optional[str] = None) -> str:
+    """Scope of a source within one data record, so the records of a knowledge base never share points"""
+    return scope if data_id is None else f"{data_id}:{scope}"
+
+
+def chunk_point_id(scope: str, text: str, tenant: Optional[str] = None) -> str:
+    """Deterministic point id: unchanged chunks of a source keep their id across runs"""
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{tenant_scope(scope, tenant)}\x00{content_hash(text)}"))
+
+
+def tenant_conditions(tenant: Optional[str] = None) -> List[FieldCondition]:
+    """Filter conditions restricting a shared collection to one knowledge base (none per-collection)"""
+    if tenant is None:
+        return []
+    return [FieldCondition(key=TENANT_FIELD, match=MatchValue(value=tenant))]
+
+
+def ensure_collection(qdrant_client, collection_name: str, size: int = 1536, multitenant: bool = False) -> bool:
+    """
+    Create the collection (without dropping existing points) and index the scope fields.
+    New collections also get a BM25 sparse vector for hybrid search.
+
+    Shared collections (multitenant=True) index the tenant field as a tenant key and only
+    build per-tenant HNSW graphs (payload_m, m=0): every search on them is filtered by
+    tenant, so a global graph would cost memory without ever being used.
+
+    Vector storage follows QDRANT_QUANTIZATION and QDRANT_VECTORS_ON_DISK; it only applies
+    to collections created from now on.
+
+    Returns:
+        bool: True if the collection stores sparse vectors. Collections created before
+        hybrid search only have the dense vector; they keep working dense-only.
+    """
+    if not qdrant_client.collection_exists(collection_name):
+        qdrant_client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(size=size, distance='Cosine', on_disk=settings.QDRANT_VECTORS_ON_DISK),
+            sparse_vectors_config={SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)},
+            hnsw_config=HnswConfigDiff(payload_m=16, m=0) if multitenant else None,
+            quantization_config=quantization_config(
+                settings.QDRANT_QUANTIZATION, always_ram=settings.QDRANT_QUANTIZATION_ALWAYS_RAM
+            )
+        )
+    indexes = [(field, PayloadSchemaType.KEYWORD) for field in (SCOPE_FIELD, TYPE_FIELD, DATA_ID_FIELD)]
+    if multitenant:
+        indexes.insert(0, (TENANT_FIELD, KeywordIndexParams(type="keyword", is_tenant=True)))
+    for field, schema in indexes:
+        try:
+            qdrant_client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field,
+                field_schema=schema
+            )
+        except Exception as e:
+            # Index already exists
+            print(f"[DEBUG] Payload index {field} on {collection_name}: {e}")
+    info = qdrant_client.get_collection(collection_name)
+    return SPARSE_VECTOR_NAME in (info.config.params.sparse_vectors or {})
+
+
+def drop_legacy_points(qdrant_client, collection_name: str, tenant: Optional[str] = None) -> None:
+    """
+    Delete points written before incremental ingestion (random ids, no scope) or before
+    points recorded their data record, which would otherwise be duplicated by the first
+    incremental run or never be pruned.
+    """
+    qdrant_client.delete(
+        collection_name=collection_name,
+        points_selector=FilterSelector(
+            filter=Filter(
+                must=tenant_conditions(tenant),
+                should=[
+                    IsEmptyCondition(is_empty=PayloadField(key=SCOPE_FIELD)),
+                    IsEmptyCondition(is_empty=PayloadField(key=DATA_ID_FIELD))
+                ]
+            )
+        ),
+        wait=True
+    )
+
+
+def prune_record(
+        qdrant_client, collection_name: str, data_id: Optional[str], keep_scopes: List[str],
+        tenant: Optional[str] = None
+) -> None:
+    """
+    Delete every point of a data record whose scope is no longer part of it: sources dropped
+    from the record, and everything it ingested before its source type changed.
+    """
+    if data_id is None:
+        return
+    qdrant_client.delete(
+        collection_name=collection_name,
+        points_selector=FilterSelector(
+            filter=Filter(
+                must=[FieldCondition(key=DATA_ID_FIELD, match=MatchValue(value=data_id)), *tenant_conditions(tenant)],
+                must_not=[FieldCondition(key=SCOPE_FIELD, match=MatchAny(any=keep_scopes))]
+            )
+        ),
+        wait=True
+    )
+
+
+def merge_reports(reports: List[Dict]) -> Dict:
+    merged = {"skipped": 0, "embedded": 0, "deleted": 0}
+    for report in reports:
+        for key in merged:
+            merged[key] += report.get(key, 0)
+    return merged
+
+
+class IncrementalSync:
+    """
+    Diff one source (a website crawl or a file) against what is already stored.
+
+    Every chunk gets a content-hash point id scoped to its source. Chunks whose id is
+    already in the collection are skipped, new or changed ones go to the pipeline for
+    embedding, and ids of the scope that were not seen this run are deleted in finish(),
+    after the pipeline has stored the new chunks.
+
+    In a shared collection, tenant is the knowledge base's rag_id: it is stored on every
+    point, qualifies the point ids and restricts the diff to that knowledge base. data_id,
+    the data record being ingested, is stored on every point for prune_record; scope should
+    include it (see record_scope).
+
+    Usage:
+        sync = IncrementalSync(qdrant_client, collection, scope="website:https://...", source_type="website")
+        with IngestionPipeline(...) as pipeline:
+            for chunk, metadata in chunks:
+                sync.add(pipeline, chunk, metadata)
+        report = sync.finish()
+    """
+
+    def __init__(
+            self, qdrant_client, collection_name: str, scope: str, source_type: str, tenant: Optional[str] = None,
+            data_id: Optional[str] = None
+    ):
+        self.qdrant_client = qdrant_client
+        self.collection_name = collection_name
+        self.scope = scope
+        self.source_type = source_type
+        self.tenant = tenant
+        self.data_id = data_id
+        self.existing: Set[str] = self._load_existing()
+        self.seen: Set[str] = set()
+        self.skipped = 0
+        self.embedded = 0
+
+    def _load_existing(self) -> Set[str]:
+        ids: Set[str] = set()
+        offset = None
+        while True:
+            points, offset = self.qdrant_client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=Filter(
+                    must=[FieldCondition(key=SCOPE_FIELD, match=MatchValue(value=self.scope)),
+                          *tenant_conditions(self.tenant)]
+                ),
+                limit=1000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
+            )
+            ids.update(str(point.id) for point in points)
+            if offset is None:
+                return ids
+
+    def add(self, pipeline, text: str, metadata: Dict) -> Optional[str]:
+        if not text or not text.strip():
+            return None
+        point_id = chunk_point_id(self.scope, text, self.tenant)
+        if point_id in self.seen:
+            return point_id
+        self.seen.add(point_id)
+        if point_id in self.existing:
+            self.skipped += 1
+            return point_id
+        payload = {SCOPE_FIELD: self.scope, TYPE_FIELD: self.source_type, HASH_FIELD: content_hash(text)}
+        if self.tenant is not None:
+            payload[TENANT_FIELD] = self.tenant
+        if self.data_id is not None:
+            payload[DATA_ID_FIELD] = self.data_id
+        pipeline.add(text, metadata, point_id=point_id, payload=payload)
+        self.embedded += 1
+        return point_id
+
+    def finish(self) -> Dict:
+        vanished = list(self.existing - self.seen)
+        for i in range(0, len(vanished), 1000):
+            self.qdrant_client.delete(
+                collection_name=self.collection_name,
+                points_selector=PointIdsList(points=vanished[i:i + 1000]),
+                wait=True
+            )
+        report = {"skipped": self.skipped, "embedded": self.embedded, "deleted": len(vanished)}
+        print(f"[DEBUG] Incremental ingestion {self.scope}: {report}")
+        return report
@@ -0,0 +1,196 @@
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from openai import OpenAI
+from qdrant_client.http.models import PointStruct, SparseVector
+
+from app.core.config import settings
+from phi.document.chunking import get_chunker, get_span_chunker
+from phi.vectordb.bm25 import SPARSE_VECTOR_NAME, Bm25Encoder
+
+_openai_client = None
+
+# Shared chunker for app ingestion (text -> iterator of chunks)
+chunk_text = get_chunker(
+    settings.INGESTION_CHUNK_STRATEGY,
+    chunk_size=settings.INGESTION_CHUNK_SIZE,
+    overlap=settings.INGESTION_CHUNK_OVERLAP
+)
+# Same chunks with their offsets, for chunking streamed pages with iter_stream_chunks
+chunk_spans = get_span_chunker(
+    settings.INGESTION_CHUNK_STRATEGY,
+    chunk_size=settings.INGESTION_CHUNK_SIZE,
+    overlap=settings.INGESTION_CHUNK_OVERLAP
+)
+
+
+def embed_texts(texts: List[str], model: str = "text-embedding-ada-002") -> List[List[float]]:
+    """Embed a batch of texts in one OpenAI request"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    results = _openai_client.embeddings.create(input=texts, model=model)
+    return [item.embedding for item in sorted(results.data, key=lambda item: item.index)]
+
+
+class IngestionPipeline:
+    """
+    Chunk -> batched embed -> bulk upsert pipeline for one Qdrant collection.
+
+    Chunks are buffered into embedding batches as they arrive. Each batch is embedded
+    on a bounded embed pool and the resulting points are upserted on a bounded upsert
+    pool, so crawling/parsing, embedding and Qdrant writes overlap instead of running
+    one page at a time. Back-pressure comes from semaphores: add() blocks once
+    embed_concurrency batches are in flight.
+
+    Points use the same payload layout as langchain's QdrantVectorStore
+    ({"page_content", "metadata"}), so retrieval code does not change.
+
+    Usage:
+        with IngestionPipeline(qdrant_client, "collection", embed_fn) as pipeline:
+            for text, metadata in chunks:
+                pipeline.add(text, metadata)
+    """
+
+    def __init__(
+            self,
+            qdrant_client,
+            collection_name: str,
+            embed_fn: Callable[[List[str]], List[List[float]]],
+            embed_batch_size: int = settings.INGESTION_EMBED_BATCH_SIZE,
+            embed_concurrency: int = settings.INGESTION_EMBED_CONCURRENCY,
+            upsert_batch_size: int = settings.INGESTION_UPSERT_BATCH_SIZE,
+            upsert_concurrency: int = settings.INGESTION_UPSERT_CONCURRENCY,
+            progress: Optional[Callable] = None,
+            sparse_encoder: Optional[Bm25Encoder] = None
+    ):
+        self.qdrant_client = qdrant_client
+        self.collection_name = collection_name
+        self.embed_fn = embed_fn
+        self.embed_batch_size = embed_batch_size
+        self.upsert_batch_size = upsert_batch_size
+        self.report = progress or (lambda *args, **kwargs: None)
+        # When set, points also get a BM25 sparse vector for hybrid search
+        self.sparse_encoder = sparse_encoder
+
+        self._embed_pool = ThreadPoolExecutor(max_workers=embed_concurrency, thread_name_prefix="ingest-embed")
+        self._upsert_pool = ThreadPoolExecutor(max_workers=upsert_concurrency, thread_name_prefix="ingest-upsert")
+        self._embed_slots = threading.BoundedSemaphore(embed_concurrency)
+        self._upsert_slots = threading.BoundedSemaphore(upsert_concurrency * 2)
+        self._buffer: List[tuple] = []
+        self._futures = []
+        self._lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self.chunks = 0
+        self.embedded = 0
+        self.upserted = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._shutdown()
+        return False
+
+    def add(self, text: str, metadata: Dict, point_id: Optional[str] = None, payload: Optional[Dict] = None) -> None:
+        """
+        Queue one chunk. payload holds extra top-level payload fields stored next to
+        page_content and metadata.
+        """
+        if self._error is not None:
+            raise self._error
+        if not text or not text.strip():
+            return
+        self._buffer.append((point_id or str(uuid.uuid4()), text, metadata, payload or {}))
+        self.chunks += 1
+        if len(self._buffer) >= self.embed_batch_size:
+            self._submit_embed()
+
+    def close(self) -> None:
+        """Flush the last batch, wait for every stage and re-raise the first error"""
+        try:
+            if self._buffer:
+                self._submit_embed()
+            # Embed futures submit upsert futures, so wait until the list stops growing
+            while True:
+                with self._lock:
+                    pending = [future for future in self._futures if not future.done()]
+                if not pending:
+                    break
+                for future in pending:
+                    future.exception()
+            if self._error is not None:
+                raise self._error
+            self.report("embed", done=self.embedded, total=self.chunks)
+            self.report("upsert", done=self.upserted, total=self.chunks)
+        finally:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        self._embed_pool.shutdown(wait=True)
+        self._upsert_pool.shutdown(wait=True)
+
+    def _track(self, future) -> None:
+        with self._lock:
+            self._futures.append(future)
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self._error is None:
+                self._error = error
+
+    def _submit_embed(self) -> None:
+        batch, self._buffer = self._buffer, []
+        self._embed_slots.acquire()
+        self.report("chunk", done=self.chunks)
+        self._track(self._embed_pool.submit(self._embed_batch, batch))
+
+    def _embed_batch(self, batch: List[tuple]) -> None:
+        try:
+            if self._error is not None:
+                return
+            vectors = self.embed_fn([text for _, text, _, _ in batch])
+            points = [
+                PointStruct(
+                    id=point_id,
+                    vector=self._point_vector(text, vector),
+                    payload={**extra, "page_content": text, "metadata": metadata}
+                )
+                for (point_id, text, metadata, extra), vector in zip(batch, vectors)
+            ]
+            with self._lock:
+                self.embedded += len(points)
+                embedded = self.embedded
+            self.report("embed", done=embedded, total=self.chunks)
+            for i in range(0, len(points), self.upsert_batch_size):
+                self._upsert_slots.acquire()
+                self._track(self._upsert_pool.submit(self._upsert_batch, points[i:i + self.upsert_batch_size]))
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._embed_slots.release()
+
+    def _point_vector(self, text: str, vector: List[float]):
+        if self.sparse_encoder is None:
+            return vector
+        indices, values = self.sparse_encoder.encode_document(text)
+        return {"": vector, SPARSE_VECTOR_NAME: SparseVector(indices=indices, values=values)}
+
+    def _upsert_batch(self, points: List[PointStruct]) -> None:
+        try:
+            if self._error is not None:
+                return
+            self.qdrant_client.upsert(collection_name=self.collection_name, points=points, wait=True)
+            with self._lock:
+                self.upserted += len(points)
+                upserted = self.upserted
+            self.report("upsert", done=upserted, total=self.chunks)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._upsert_slots.release()
@@ -0,0 +1,219 @@
+import queue
+import threading
+import traceback
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from bson import ObjectId
+
+from app.core.config import settings
+from app.db.mongodb import get_sync_database
+from app.db.config_cache import invalidate_rag
+from app.schemas.data_management import DataSourceType, DataStatus
+
+# Ingestion stages, in the order a job moves through them
+STAGES = ["download", "parse", "chunk", "embed", "upsert"]
+
+
+class IngestionQueueFull(Exception):
+    """Raised when the pending-job limit is reached."""
+
+
+class IngestionQueue:
+    """
+    Bounded worker pool for data management ingestion.
+
+    Every job is persisted in Mongo (status, attempts, current stage and per-stage
+    progress) so the API can report real progress and unfinished jobs are picked up
+    again after a restart. A fixed number of worker threads drain a bounded queue, so
+    a burst of uploads cannot spawn unbounded threads; failed jobs are retried with
+    exponential backoff.
+    """
+
+    def __init__(
+            self,
+            handler: Callable,
+            max_workers: int = 4,
+            max_pending: int = 100,
+            max_attempts: int = 3,
+            backoff_seconds: float = 5.0,
+            stale_after_seconds: int = 1800
+    ):
+        self.handler = handler
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=max_pending)
+        self._workers = []
+        self._lock = threading.Lock()
+        self._active = 0
+
+    @property
+    def jobs(self):
+        return get_sync_database()[settings.MONGODB_COLLECTION_INGESTION_JOBS]
+
+    def start(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for i in range(self.max_workers):
+                worker = threading.Thread(target=self._worker, name=f"ingestion-worker-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def enqueue(self, source_type: DataSourceType, rag_object_id: ObjectId, data_id: str, params: dict) -> str:
+        """
+        Persist a job and queue it for the workers.
+
+        Returns:
+            str: The job id.
+
+        Raises:
+            IngestionQueueFull: If max_pending jobs are already waiting.
+        """
+        self.start()
+        now = datetime.now()
+        job = {
+            "rag_id": str(rag_object_id),
+            "data_id": data_id,
+            "source_type": DataSourceType(source_type).value,
+            "params": params,
+            "status": DataStatus.PENDING.value,
+            "stage": None,
+            "progress": {},
+            "attempts": 0,
+            "max_attempts": self.max_attempts,
+            "error_message": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        job_id = str(self.jobs.insert_one(job).inserted_id)
+        try:
+            self._queue.put_nowait(job_id)
+        except queue.Full:
+            self._finish(job_id, DataStatus.FAILED, "Ingestion queue is full")
+            raise IngestionQueueFull("Too many ingestion jobs pending, please retry later")
+        return job_id
+
+    def resume_pending(self) -> int:
+        """
+        Re-queue jobs left behind by a previous process. Jobs stuck in processing
+        without a progress update for stale_after_seconds are treated as abandoned.
+        """
+        self.start()
+        self.jobs.update_many(
+            {
+                "status": DataStatus.PROCESSING.value,
+                "updated_at": {"$lt": datetime.now() - timedelta(seconds=self.stale_after_seconds)}
+            },
+            {"$set": {"status": DataStatus.PENDING.value, "updated_at": datetime.now()}}
+        )
+        resumed = 0
+        for job in self.jobs.find({"status": DataStatus.PENDING.value}, {"_id": 1}):
+            try:
+                self._queue.put_nowait(str(job["_id"]))
+                resumed += 1
+            except queue.Full:
+                break
+        return resumed
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        return self.jobs.find_one({"_id": ObjectId(job_id)})
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "active": self._active,
+            "queued": self._queue.qsize(),
+            "max_pending": self._queue.maxsize,
+        }
+
+    def _worker(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            with self._lock:
+                self._active += 1
+            try:
+                self._run(job_id)
+            except Exception as e:
+                print(f"[ERROR] Ingestion worker error for job {job_id}: {e}")
+            finally:
+                with self._lock:
+                    self._active -= 1
+                self._queue.task_done()
+
+    def _progress(self, job_id: str) -> Callable:
+        def report(stage: str, done: Optional[int] = None, total: Optional[int] = None) -> None:
+            update = {"stage": stage, "updated_at": datetime.now()}
+            if done is not None:
+                update[f"progress.{stage}.done"] = done
+            if total is not None:
+                update[f"progress.{stage}.total"] = total
+            self.jobs.update_one({"_id": ObjectId(job_id)}, {"$set": update})
+
+        return report
+
+    def _set_data_status(self, job: dict, status: DataStatus, error_message: Optional[str] = None) -> None:
+        update = {"status": status.value, "error_message": error_message, "updated_at": datetime.now()}
+        if status in (DataStatus.COMPLETED, DataStatus.FAILED):
+            update["processed_at"] = datetime.now()
+        get_sync_database()[settings.MONGODB_COLLECTION_DATA_MANAGEMENT].update_one(
+            {"_id": ObjectId(job["data_id"])}, {"$set": update}
+        )
+        invalidate_rag(job["rag_id"])
+
+    def _finish(self, job_id: str, status: DataStatus, error_message: Optional[str] = None) -> None:
+        self.jobs.update_one(
+            {"_id": ObjectId(job_id)},
+            {"$set": {
+                "status": status.value,
+                "error_message": error_message,
+                "finished_at": datetime.now(),
+                "updated_at": datetime.now()
+            }}
+        )
+
+    def _run(self, job_id: str) -> None:
+        job = self.jobs.find_one_and_update(
+            {"_id": ObjectId(job_id), "status": DataStatus.PENDING.value},
+            {
+                "$set": {"status": DataStatus.PROCESSING.value, "started_at": datetime.now(), "updated_at": datetime.now()},
+                "$inc": {"attempts": 1}
+            },
+            return_document=True
+        )
+        if job is None:
+            return
+        self._set_data_status(job, DataStatus.PROCESSING)
+
+        try:
+            result = self.handler(
+                DataSourceType(job["source_type"]),
+                ObjectId(job["rag_id"]),
+                data_id=job["data_id"],
+                progress=self._progress(job_id),
+                **job["params"]
+            )
+        except Exception as e:
+            traceback.print_exc()
+            if job["attempts"] < job.get("max_attempts", self.max_attempts):
+                delay = self.backoff_seconds * (2 ** (job["attempts"] - 1))
+                print(f"[ERROR] Ingestion job {job_id} failed (attempt {job['attempts']}), retrying in {delay}s: {e}")
+                self.jobs.update_one(
+                    {"_id": ObjectId(job_id)},
+                    {"$set": {"status": DataStatus.PENDING.value, "error_message": str(e), "updated_at": datetime.now()}}
+                )
+                timer = threading.Timer(delay, self._queue.put, args=(job_id,))
+                timer.daemon = True
+                timer.start()
+                return
+            self._finish(job_id, DataStatus.FAILED, str(e))
+            self._set_data_status(job, DataStatus.FAILED, str(e))
+            return
+
+        if isinstance(result, dict):
+            # e.g. the incremental ingestion report (chunks skipped / embedded / deleted)
+            self.jobs.update_one({"_id": ObjectId(job_id)}, {"$set": {"result": result}})
+        self._finish(job_id, DataStatus.COMPLETED)
+        self._set_data_status(job, DataStatus.COMPLETED)
@@ -3,29 +3,33 @@ from PyPDF2 import PdfReader
 from io import BytesIO
 import json
 import os
-from os.path import join, dirname
-from llama_parse import LlamaParse
-import pymupdf4llm
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings
-from langchain_qdrant import QdrantVectorStore
+import queue
+import tempfile
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from qdrant_client import QdrantClient
 from app.core.config import settings
-from langchain.schema import Document
 from datetime import datetime
 from app.api.v1.endpoints.chat.db_helper import save_website_scrapper_logs, update_website_scrapper_logs
+from app.manage_data.file_parser import get_parse_pool, iter_spooled_pages, parse_file, reset_parse_pool
+from app.manage_data.ingestion_pipeline import IngestionPipeline, chunk_spans, embed_texts
+from phi.document.chunking import iter_stream_chunks
+from phi.vectordb.bm25 import bm25_encoder
+from app.manage_data.incremental import IncrementalSync, drop_legacy_points, ensure_collection, record_scope
+from app.manage_data.tenancy import knowledge_base_target
 
 qdrant_api_url = settings.QDRANT_API_URL
 qdrant_api_key = settings.QDRANT_API_KEY
-llama_cloud_api_key = settings.LLAMA_CLOUD_API_KEY
-
-parser = LlamaParse(
-    api_key=llama_cloud_api_key,  # can also be set in your env as LLAMA_CLOUD_API_KEY
-    result_type="markdown",  # "markdown" and "text" are available
-    num_workers=4,  # if multiple files passed, split in `num_workers` API calls
-    verbose=True,
-    language="en",  # Optionally you can define a language, default=en
+
+qdrant_client = QdrantClient(
+    url=qdrant_api_url,
+    api_key=qdrant_api_key,
+    timeout=300
 )
 
+# Logs keep at most this much of a file's text
+LOG_CONTENT_MAX_CHARS = settings.INGESTION_LOG_CONTENT_MAX_CHARS
+
 
 def read_file_from_url(url):
     # Send a GET request to download the file
@@ -52,20 +56,16 @@ def read_file_from_url(url):
                 return "Unsupported file type"
 
 
-def read_pdf(content):
-    # Use BytesIO to load the content as a file-like object
-    pdf_content = BytesIO(content)
-
-    # Read the PDF content
-    reader = PdfReader(pdf_content)
-    text = ''
+def iter_pdf_pages(pdf):
+    """Yield the text of each page; pages are parsed one at a time"""
+    reader = PdfReader(pdf)
+    for page in reader.pages:
+        yield page.extract_text() or ""
 
-    # Extract text from all the pages
-    for page_num in range(len(reader.pages)):
-        page = reader.pages[page_num]
-        text += page.extract_text()
 
-    return text
+def read_pdf(content):
+    # Use BytesIO to load the content as a file-like object
+    return "".join(iter_pdf_pages(BytesIO(content)))
 
 
 def read_json(content):
@@ -77,58 +77,180 @@ def read_json(content):
         return "Invalid JSON content"
 
 
-# Example usage
-def file_data(url, rag_manage_id):
-    # Make a GET request to the URL
-    response = requests.get(url)
+def download_to_file(url, path, chunk_size=1 << 20):
+    """Stream a download to disk so the file is never held in memory"""
+    size = 0
+    with requests.get(url, stream=True, timeout=300) as response:
+        response.raise_for_status()
+        with open(path, 'wb') as file:
+            for block in response.iter_content(chunk_size=chunk_size):
+                file.write(block)
+                size += len(block)
+    return size
+
+
+class _Preview:
+    """Bounded preview of the parsed content, kept for the logs; collected while pages stream past"""
+
+    def __init__(self):
+        self.parts = []
+        self.length = 0
+
+    def collect(self, pages):
+        for page in pages:
+            if self.length < LOG_CONTENT_MAX_CHARS:
+                self.parts.append(page[:LOG_CONTENT_MAX_CHARS - self.length])
+                self.length += len(self.parts[-1])
+            yield page
+
+    def text(self):
+        return "\n".join(self.parts)
+
+
+def _temp_path(rag_manage_id, suffix):
+    fd, path = tempfile.mkstemp(prefix=f"{rag_manage_id}_", suffix=suffix)
+    os.close(fd)
+    return path
 
-    # Local path where you want to save the file (including the file name)
-    local_filename = join(dirname(__file__)) + "/" + str(rag_manage_id) + ".pdf"
 
-    # Open the local file in write-binary mode and save the content
-    with open(local_filename, 'wb') as file:
-        file.write(response.content)
+def files_data(urls, rag_manage_id, progress=None, data_id=None):
+    """
+    Ingest files into the RAG collection incrementally: chunks already stored for a file
+    are skipped and chunks that disappeared from it are deleted.
 
-    page_content = ""
+    A download thread streams each file to a temp file and hands it to the parse process
+    pool as soon as it is on disk, so files are parsed in parallel (one per core) while the
+    rest are still downloading. Workers write pages to a spool file as they parse them and
+    this thread chunks them into one embedding pipeline as they appear, file by file in
+    download order, so chunking and embedding overlap with downloading and parsing and no
+    file is ever held in memory whole.
+
+    A file that fails to download or parse (including the per-file timeout) is logged
+    as FAILED; the other files are still ingested and the error is raised at the end, so
+    a retry of the job only re-embeds what is missing. Chunks a failed file already
+    streamed are kept, but its vanished chunks are not deleted.
+
+    progress is an optional callback(stage, done=None, total=None) used by the ingestion
+    queue to record per-stage progress. data_id is the data record the files belong to.
+
+    Returns:
+        list: (url, content preview, report) per file, where report counts
+        skipped/embedded/deleted chunks.
+    """
+    report = progress or (lambda *args, **kwargs: None)
+    collection_name, tenant = knowledge_base_target(rag_manage_id)
+    has_sparse = ensure_collection(qdrant_client, collection_name, multitenant=tenant is not None)
+    drop_legacy_points(qdrant_client, collection_name, tenant=tenant)
+
+    paths = []
+    futures = []
+    errors = {}
+    results = []
+    syncs = []
+    downloaded = queue.Queue()
+    stop = threading.Event()
+    pool = get_parse_pool()
+
+    def download_all():
+        try:
+            for index, url in enumerate(urls):
+                if stop.is_set():
+                    break
+                report("download", done=index, total=len(urls))
+                save_website_scrapper_logs(data={
+                    "rag_id": rag_manage_id,
+                    "created_at": datetime.now(),
+                    "link": url,
+                    "page_content": "",
+                    "status": "INPROGRESS"
+                })
+                path = _temp_path(rag_manage_id, ".pdf")
+                pages_path = _temp_path(rag_manage_id, ".pages")
+                paths.extend([path, pages_path])
+                try:
+                    download_to_file(url, path)
+                    future = pool.submit(parse_file, path, pages_path, settings.INGESTION_PARSE_TIMEOUT_SECONDS)
+                    futures.append(future)
+                    downloaded.put((url, pages_path, future))
+                except Exception as e:
+                    errors[url] = e
+            report("download", done=len(urls), total=len(urls))
+        finally:
+            downloaded.put(None)
+
+    downloader = threading.Thread(target=download_all, name="file-downloads", daemon=True)
+    downloader.start()
     try:
-        documents = parser.load_data(local_filename)
-        for _i in documents:
-            if page_content == "":
-                page_content = _i.text
-            else:
-                page_content = page_content + "\n" + _i.text
-    except:
-        page_content = pymupdf4llm.to_markdown(local_filename)
-
-    generate_logs = {
-        "rag_id": rag_manage_id,
-        "created_at": datetime.now(),
-        "link": url,
-        "page_content": "",
-        "status": "INPROGRESS"
-    }
-    save_website_scrapper_logs(data=generate_logs)
-
-    text_splitter = CharacterTextSplitter(separator="\n\n", chunk_size=5000, chunk_overlap=0, length_function=len)
-    docs = [Document(page_content=page_content, metadata={"source": url})]
-    text_chunks = text_splitter.split_documents(docs)
-
-    QdrantVectorStore.from_documents(
-        text_chunks,
-        embedding=OpenAIEmbeddings(model="text-embedding-ada-002"),
-        url=qdrant_api_url,
-        api_key=qdrant_api_key,
-        prefer_grpc=True,
-        collection_name=f"{str(rag_manage_id)}",
-        force_recreate=True,
-    )
-    print(f'File downloaded and saved as {local_filename}')
-    update_logs = {
-        "rag_id": rag_manage_id,
-        "link": url,
-        "page_content": page_content,
-        "status": "SUCCESS"
-    }
-    update_website_scrapper_logs(data=update_logs)
-    os.remove(local_filename)
-    return page_content, page_content
+        with IngestionPipeline(
+                qdrant_client, collection_name, embed_texts, progress=report,
+                sparse_encoder=bm25_encoder if has_sparse else None
+        ) as pipeline:
+            parsed = 0
+            for url, pages_path, future in iter(downloaded.get, None):
+                sync = IncrementalSync(
+                    qdrant_client, collection_name, scope=file_scope(url, data_id), source_type="file",
+                    tenant=tenant, data_id=data_id
+                )
+                preview = _Preview()
+                try:
+                    pages = preview.collect(iter_spooled_pages(pages_path, future))
+                    for chunk in iter_stream_chunks(pages, chunk_spans, settings.INGESTION_CHUNK_SIZE):
+                        sync.add(pipeline, chunk, {"source": url})
+                except BrokenProcessPool as e:
+                    # A worker died (e.g. out of memory); the next job gets a fresh pool
+                    reset_parse_pool(pool)
+                    errors[url] = e
+                except Exception as e:
+                    errors[url] = e
+                else:
+                    syncs.append((url, preview.text(), sync))
+                parsed += 1
+                report("parse", done=parsed, total=len(urls))
+        # Vanished chunks are deleted only once the new ones are stored
+        for url, page_content, sync in syncs:
+            results.append((url, page_content, sync.finish()))
+    finally:
+        stop.set()
+        downloader.join()
+        for future in futures:
+            future.cancel()
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    for url, page_content, _ in results:
+        print(f'File ingested from {url}')
+        update_website_scrapper_logs(data={
+            "rag_id": rag_manage_id,
+            "link": url,
+            "page_content": page_content,
+            "status": "SUCCESS"
+        })
+    for url, e in errors.items():
+        print(f"[ERROR] Failed to ingest file {url}: {e}")
+        update_website_scrapper_logs(data={
+            "rag_id": rag_manage_id,
+            "link": url,
+            "page_content": "",
+            "status": "FAILED"
+        })
+    if errors:
+        raise RuntimeError(f"{len(errors)} of {len(urls)} files failed: {', '.join(errors)}")
+    return results
+
+
+def file_data(url, rag_manage_id, progress=None, data_id=None):
+    """
+    Ingest one file, see files_data.
+
+    Returns:
+        tuple: (content preview, report) where report counts skipped/embedded/deleted chunks.
+    """
+    _, page_content, sync_report = files_data([url], rag_manage_id, progress=progress, data_id=data_id)[0]
+    return page_content, sync_report
+
+
+def file_scope(url, data_id=None):
+    return record_scope(f"file:{url}", data_id)
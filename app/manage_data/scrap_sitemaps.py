@@ -1,8 +1,21 @@
-import requests
-from urllib.parse import urljoin
+import asyncio
+import hashlib
 import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import httpx
+import requests
 from bs4 import BeautifulSoup
-import hashlib
+
+from app.core.config import settings
+from phi.utils.run_async import run_awaitable
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+GZIP_MAGIC = b"\x1f\x8b"
 
 
 def generate_embedding(text):
@@ -10,93 +23,172 @@ def generate_embedding(text):
     return int(hashlib.sha256(text.encode('utf-8')).hexdigest(), 16) % (10 ** 8)
 
 
-def is_xml(response):
-    return 'xml' in response.headers.get('Content-Type', '')
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+class SitemapParser:
+    """
+    Incremental sitemap parser: feed it the body in chunks as it downloads. Gzipped sitemaps
+    (.xml.gz) are detected by their magic bytes and decompressed on the fly, and every
+    <url>/<sitemap> entry is dropped once read, so huge sitemaps are parsed in constant memory.
+    """
+
+    def __init__(self):
+        self.sitemaps = []
+        self.urls = []
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._root = None
+        self._decompressor = None
+        self._sniffed = False
 
+    def feed(self, data):
+        if not self._sniffed and data:
+            self._sniffed = True
+            if data.startswith(GZIP_MAGIC):
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._decompressor is not None:
+            data = self._decompressor.decompress(data)
+        self._parser.feed(data)
+        self._read_events()
 
-def fetch_url(url, headers):
-    try:
-        response = requests.get(url, headers=headers, allow_redirects=True)
-        response.raise_for_status()  # Raise an HTTPError for bad responses
-        print("Data found...!!!")
-        return response
-    except requests.RequestException as e:
-        print(f"Error accessing {url}: {e}")
-    return None
+    def close(self):
+        if self._decompressor is not None:
+            self._parser.feed(self._decompressor.flush())
+        self._parser.close()
+        self._read_events()
 
+    def _read_events(self):
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._root = element
+                continue
+            name = _local_name(element.tag)
+            if name not in ('url', 'sitemap'):
+                continue
+            for child in element:
+                if _local_name(child.tag) == 'loc' and child.text:
+                    (self.urls if name == 'url' else self.sitemaps).append(child.text.strip())
+                    break
+            # Entries are complete once ended: drop them so the tree never grows
+            self._root.clear()
 
-def parse_sitemap(url, headers):
-    response = fetch_url(url, headers)
-    if response and is_xml(response):
+
+async def _fetch_sitemap(client, url, semaphore):
+    """Stream and parse one sitemap. Returns (child sitemaps, page urls)."""
+    async with semaphore:
         try:
-            root = ET.fromstring(response.content)
-            namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-            sitemap_urls = []
-            actual_urls = []
-            # Find all <sitemap> entries
-            for sitemap in root.findall('ns:sitemap', namespace):
-                loc = sitemap.find('ns:loc', namespace)
-                if loc is not None:
-                    sitemap_urls.append(loc.text)
-            # Find all <url> entries
-            for url in root.findall('ns:url', namespace):
-                loc = url.find('ns:loc', namespace)
-                if loc is not None:
-                    actual_urls.append(loc.text)
-            return sitemap_urls, actual_urls
-        except ET.ParseError as e:
-            print(f"Error parsing XML from {url}: {e}")
-    return [], []
-
-
-def find_all_urls(domain):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+            async with client.stream('GET', url) as response:
+                response.raise_for_status()
+                # Missing sitemaps are often answered with the site's HTML page
+                if 'html' in response.headers.get('Content-Type', ''):
+                    return [], []
+                parser = SitemapParser()
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                parser.close()
+                return parser.sitemaps, parser.urls
+        except (httpx.HTTPError, ET.ParseError, zlib.error) as e:
+            print(f"Error reading sitemap {url}: {e}")
+            return [], []
 
-    sitemap_urls = [
-        f"{domain}/sitemap.xml",
-        f"{domain}/sitemap_index.xml",
-        f"{domain}/robots.txt"
+
+async def _robots_sitemaps(client, domain, semaphore):
+    async with semaphore:
+        try:
+            response = await client.get(f"{domain}/robots.txt")
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"Error accessing {domain}/robots.txt: {e}")
+            return []
+    return [
+        urljoin(domain, line.split(':', 1)[1].strip())
+        for line in response.text.splitlines()
+        if line.lower().startswith('sitemap:')
     ]
 
-    discovered_sitemaps = set()
-    actual_urls = set()
 
-    def discover_sitemaps(url):
-        if url in discovered_sitemaps:
+async def afind_all_urls(domain, concurrency=None, max_urls=None):
+    """
+    Collect the page urls listed in a site's sitemaps: sitemap.xml, sitemap_index.xml and the
+    sitemaps named in robots.txt, following nested sitemap indexes. Child sitemaps are fetched
+    concurrently (at most concurrency at a time) and each sitemap is fetched once.
+
+    max_urls stops the walk once that many urls are collected (0 or None = no cap).
+    """
+    concurrency = concurrency or settings.SITEMAP_FETCH_CONCURRENCY
+    max_urls = settings.SITEMAP_MAX_URLS if max_urls is None else max_urls
+    domain = domain.rstrip('/')
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    seen = set()
+    actual_urls = {}
+
+    def is_full():
+        return bool(max_urls) and len(actual_urls) >= max_urls
+
+    async def walk(url):
+        if url in seen or is_full():
             return
-        discovered_sitemaps.add(url)
+        seen.add(url)
         print("url", url)
-        sitemap_urls, urls = parse_sitemap(url, headers)
-        actual_urls.update(urls)
-        for sitemap in sitemap_urls:
-            discover_sitemaps(sitemap)
-
-    # Check standard sitemap URLs
-    for url in sitemap_urls[:2]:
-        print(f"url: {url}")
-        response = fetch_url(url, headers)
-        if response and is_xml(response):
-            discover_sitemaps(url)
-            break
-
-    # Check robots.txt for sitemap URL
-    robots_response = fetch_url(sitemap_urls[2], headers)
-    if robots_response:
-        for line in robots_response.text.splitlines():
-            if line.lower().startswith('sitemap:'):
-                sitemap_url = line.split(':', 1)[1].strip()
-                full_sitemap_url = urljoin(domain, sitemap_url)
-                discover_sitemaps(full_sitemap_url)
+        sitemap_urls, urls = await _fetch_sitemap(client, url, semaphore)
+        for page_url in urls:
+            if is_full():
+                break
+            actual_urls.setdefault(page_url, None)
+        await asyncio.gather(*(walk(sitemap) for sitemap in sitemap_urls))
+
+    async def walk_robots():
+        await asyncio.gather(*(walk(sitemap) for sitemap in await _robots_sitemaps(client, domain, semaphore)))
+
+    limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+    async with httpx.AsyncClient(headers=HEADERS, follow_redirects=True, timeout=30, limits=limits) as client:
+        await asyncio.gather(walk(f"{domain}/sitemap.xml"), walk(f"{domain}/sitemap_index.xml"), walk_robots())
 
     return list(actual_urls)
 
 
+def find_all_urls(domain, concurrency=None, max_urls=None):
+    """Sync version of afind_all_urls"""
+    return run_awaitable(afind_all_urls(domain, concurrency=concurrency, max_urls=max_urls))
+
+
 def clean_and_extract_content(url):
     # Fetch webpage content
     response = requests.get(url)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    return extract_content(response.content, url)
+
+
+def extract_contents(urls, max_workers=8):
+    """
+    Fetch and extract many pages in parallel, see clean_and_extract_content.
+
+    Returns:
+        list: (url, (structured_content, metadata, markdown_content)) per url, in order;
+        the result is None for pages that failed.
+    """
+    def _extract(url):
+        try:
+            return url, clean_and_extract_content(url)
+        except Exception as e:
+            print(f"[ERROR] Failed to extract {url}: {e}")
+            return url, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_extract, urls))
+
+
+def extract_content(content, url):
+    # lxml is several times faster than html.parser on large pages
+    soup = BeautifulSoup(content, 'lxml')
+
+    # Read the metadata before the meta tags are removed below
+    title = soup.title.get_text(strip=True) if soup.title else ''
+    description_tag = soup.find('meta', attrs={'name': 'description'})
+    description = description_tag.get('content', '').strip() if description_tag else ''
+    html_tag = soup.find('html')
+    language = html_tag.get('lang', '') if html_tag else ''
 
     # Remove non-content elements
     for tag in soup(
@@ -128,7 +220,6 @@ def clean_and_extract_content(url):
 
     # Define tags of interest for content extraction
     content_tags = ['p', 'span', 'li', 'article', 'section', 'div']  # Exclude 'div' from the list
-    title = soup.title.string.strip() if soup.title else ''
 
     # Iterate over elements to organize them under section start tags
     for element in soup.find_all(['h1', 'h2', 'p', 'span', 'li', 'article', 'section', 'div', 'h3', 'h4', 'h5']):
@@ -161,11 +252,6 @@ def clean_and_extract_content(url):
                     }
                     current_section['content'].append(content_data)
 
-    # Extract metadata
-    description = soup.find('meta', attrs={'name': 'description'})['content'].strip() if soup.find('meta', attrs={
-        'name': 'description'}) else ''
-    language = soup.find('html')['lang'] if soup.find('html') and 'lang' in soup.find('html').attrs else ''
-
     # Construct metadata object
     metadata = {
         "source": url,
@@ -0,0 +1,215 @@
+"""
+Where a knowledge base lives in Qdrant, and migration to shared collections.
+
+Per-collection mode (the default) keeps one collection per RAG config. With
+QDRANT_SHARED_COLLECTIONS every knowledge base is stored in one of
+QDRANT_SHARED_COLLECTION_SHARDS shared collections, chosen by a stable hash of its
+rag_id, and every point carries an indexed rag_id payload (TENANT_FIELD) that all reads,
+diffs and deletes filter on. Changing the shard count moves knowledge bases to other
+collections, so run the migration again afterwards.
+
+Migrate existing per-RAG collections (idempotent, safe to re-run):
+    python -m app.manage_data.tenancy [--rag-id ID ...] [--delete-source] [--dry-run]
+"""
+
+import argparse
+import re
+import uuid
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from qdrant_client.http.models import Filter, PointStruct, SparseVector
+
+from app.core.config import settings
+from app.manage_data.incremental import (
+    CHUNK_ID_NAMESPACE,
+    SCOPE_FIELD,
+    TENANT_FIELD,
+    chunk_point_id,
+    ensure_collection,
+    tenant_conditions
+)
+from phi.vectordb.bm25 import SPARSE_VECTOR_NAME, bm25_encoder
+
+_OBJECT_ID = re.compile(r"^[0-9a-f]{24}$")
+_SEARCH_COLLECTION_PREFIX = "embedding_"
+
+
+def shared_collection_name(rag_id) -> str:
+    shards = max(1, settings.QDRANT_SHARED_COLLECTION_SHARDS)
+    if shards == 1:
+        return settings.QDRANT_SHARED_COLLECTION_NAME
+    return f"{settings.QDRANT_SHARED_COLLECTION_NAME}_{zlib.crc32(str(rag_id).encode('utf-8')) % shards}"
+
+
+def knowledge_base_target(rag_id) -> Tuple[str, Optional[str]]:
+    """
+    Collection and tenant to ingest a RAG config's knowledge base into.
+
+    Returns:
+        tuple: (collection name, tenant). tenant is None in per-collection mode, where
+        the collection is named after the rag_id.
+    """
+    if settings.QDRANT_SHARED_COLLECTIONS:
+        return shared_collection_name(rag_id), str(rag_id)
+    return str(rag_id), None
+
+
+def search_target(rag_id: str, manage_data_id: str) -> Tuple[str, Optional[str]]:
+    """Collection and tenant to search for a RAG config, see knowledge_base_target"""
+    if settings.QDRANT_SHARED_COLLECTIONS:
+        return shared_collection_name(rag_id), str(rag_id)
+    return f"{_SEARCH_COLLECTION_PREFIX}{manage_data_id}", None
+
+
+def tenant_filter(tenant: Optional[str]) -> Optional[Filter]:
+    conditions = tenant_conditions(tenant)
+    return Filter(must=conditions) if conditions else None
+
+
+def _rag_id_for_collection(db, collection_name: str) -> Optional[str]:
+    """
+    rag_id of a per-RAG collection: ingestion names them after the rag_id, the search path
+    reads embedding_<data management id>.
+    """
+    if _OBJECT_ID.match(collection_name):
+        if db[settings.MONGODB_COLLECTION_RAG_CONFIGS].find_one({"_id": ObjectId(collection_name)}, {"_id": 1}):
+            return collection_name
+        return None
+    if collection_name.startswith(_SEARCH_COLLECTION_PREFIX):
+        manage_data_id = collection_name[len(_SEARCH_COLLECTION_PREFIX):]
+        if _OBJECT_ID.match(manage_data_id):
+            manage_data = db[settings.MONGODB_COLLECTION_DATA_MANAGEMENT].find_one(
+                {"_id": ObjectId(manage_data_id)}, {"rag_id": 1}
+            )
+            if manage_data and manage_data.get("rag_id"):
+                return str(manage_data["rag_id"])
+    return None
+
+
+def _dense_and_sparse(vector) -> Tuple[List[float], Optional[SparseVector]]:
+    if isinstance(vector, dict):
+        return vector.get(""), vector.get(SPARSE_VECTOR_NAME)
+    return vector, None
+
+
+def _migrated_point(point, tenant: str) -> Optional[PointStruct]:
+    dense, sparse = _dense_and_sparse(point.vector)
+    if dense is None:
+        return None
+    payload = dict(point.payload or {})
+    payload[TENANT_FIELD] = tenant
+    text = payload.get("page_content") or ""
+    scope = payload.get(SCOPE_FIELD)
+    if scope:
+        # Same id the incremental sync computes for this chunk in the shared collection
+        point_id = chunk_point_id(scope, text, tenant)
+    else:
+        # Legacy point: keep it distinct per tenant; the next ingestion replaces it
+        point_id = str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{tenant}\x00{point.id}"))
+    if sparse is None and text:
+        indices, values = bm25_encoder.encode_document(text)
+        sparse = SparseVector(indices=indices, values=values)
+    vector = {"": dense}
+    if sparse is not None:
+        vector[SPARSE_VECTOR_NAME] = sparse
+    return PointStruct(id=point_id, vector=vector, payload=payload)
+
+
+def migrate_collection(
+        qdrant_client, source: str, rag_id: str, delete_source: bool = False, batch_size: int = 256
+) -> Dict:
+    """
+    Copy one per-RAG collection into its shared collection. Point ids are deterministic,
+    so a re-run overwrites instead of duplicating. The source is only deleted when every
+    point was copied.
+
+    Returns:
+        dict: source, target, copied (distinct points), skipped (points without a dense
+        vector) and deleted.
+    """
+    target = shared_collection_name(rag_id)
+    info = qdrant_client.get_collection(source)
+    vectors = info.config.params.vectors
+    size = (vectors.get("") if isinstance(vectors, dict) else vectors).size
+    ensure_collection(qdrant_client, target, size=size, multitenant=True)
+
+    copied = set()
+    skipped = 0
+    offset = None
+    while True:
+        points, offset = qdrant_client.scroll(
+            collection_name=source,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        batch = [migrated for migrated in (_migrated_point(point, rag_id) for point in points) if migrated]
+        skipped += len(points) - len(batch)
+        if batch:
+            qdrant_client.upsert(collection_name=target, points=batch, wait=True)
+            copied.update(migrated.id for migrated in batch)
+        if offset is None:
+            break
+
+    deleted = False
+    if delete_source and skipped == 0:
+        stored = qdrant_client.count(collection_name=target, count_filter=tenant_filter(rag_id), exact=True).count
+        # Chunks repeated within a source share one id, so compare against distinct ids
+        if stored >= len(copied):
+            qdrant_client.delete_collection(source)
+            deleted = True
+    report = {"source": source, "target": target, "copied": len(copied), "skipped": skipped, "deleted": deleted}
+    print(f"[DEBUG] Migrated collection: {report}")
+    return report
+
+
+def migrate_to_shared_collections(
+        qdrant_client, db, rag_ids: Optional[Iterable[str]] = None, delete_source: bool = False,
+        dry_run: bool = False
+) -> List[Dict]:
+    """Migrate every per-RAG collection (or only those of rag_ids) to shared collections"""
+    wanted = {str(rag_id) for rag_id in rag_ids} if rag_ids else None
+    shared_prefix = settings.QDRANT_SHARED_COLLECTION_NAME
+    reports = []
+    for collection in qdrant_client.get_collections().collections:
+        name = collection.name
+        if name == shared_prefix or name.startswith(f"{shared_prefix}_"):
+            continue
+        rag_id = _rag_id_for_collection(db, name)
+        if rag_id is None or (wanted is not None and rag_id not in wanted):
+            continue
+        if dry_run:
+            reports.append({"source": name, "target": shared_collection_name(rag_id), "rag_id": rag_id})
+            continue
+        try:
+            reports.append(migrate_collection(qdrant_client, name, rag_id, delete_source=delete_source))
+        except Exception as e:
+            print(f"[ERROR] Failed to migrate collection {name}: {e}")
+            reports.append({"source": name, "error": str(e)})
+    return reports
+
+
+def main():
+    from qdrant_client import QdrantClient
+    from app.db.mongodb import get_sync_database
+
+    arg_parser = argparse.ArgumentParser(description="Migrate per-RAG Qdrant collections to shared collections")
+    arg_parser.add_argument("--rag-id", action="append", dest="rag_ids", help="Only migrate this RAG (repeatable)")
+    arg_parser.add_argument("--delete-source", action="store_true", help="Delete each collection once copied")
+    arg_parser.add_argument("--dry-run", action="store_true", help="List what would be migrated")
+    args = arg_parser.parse_args()
+
+    qdrant_client = QdrantClient(url=settings.QDRANT_API_URL, api_key=settings.QDRANT_API_KEY, timeout=300)
+    reports = migrate_to_shared_collections(
+        qdrant_client, get_sync_database(), rag_ids=args.rag_ids, delete_source=args.delete_source,
+        dry_run=args.dry_run
+    )
+    for report in reports:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
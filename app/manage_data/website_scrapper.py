@@ -1,17 +1,21 @@
 import requests
 import os
-from langchain_community.embeddings import OpenAIEmbeddings
+import time
 from datetime import datetime
-from langchain_qdrant import QdrantVectorStore
-from langchain.text_splitter import CharacterTextSplitter
 from app.manage_data.scrap_sitemaps import find_all_urls, clean_and_extract_content
-from langchain.text_splitter import CharacterTextSplitter
 import re
 from qdrant_client.http.models import PointStruct, VectorParams
 from qdrant_client import QdrantClient
 from openai import OpenAI
-from langchain_core.documents import Document
-from app.api.v1.endpoints.chat.db_helper import save_website_scrapper_logs, update_website_scrapper_logs, update_data_management_logs
+from app.api.v1.endpoints.chat.db_helper import (
+    save_website_scrapper_logs_bulk,
+    update_data_management_logs,
+    update_website_scrapper_logs_status
+)
+from app.manage_data.ingestion_pipeline import IngestionPipeline, chunk_text, embed_texts
+from phi.vectordb.bm25 import bm25_encoder
+from app.manage_data.incremental import IncrementalSync, drop_legacy_points, ensure_collection, record_scope
+from app.manage_data.tenancy import knowledge_base_target
 from firecrawl import FirecrawlApp, ScrapeOptions
 from app.core.config import settings
 
@@ -22,8 +26,6 @@ firecrawl_app = FirecrawlApp(api_key=FIRECRAWL_API_KEY)
 client = OpenAI()
 import uuid
 
-embeddings = OpenAIEmbeddings(model="text-embedding-ada-002")
-
 os.environ["OPENAI_API_KEY"] = settings.OPENAI_API_KEY
 os.environ["OPENAI_API_TYPE"] = "openai"
 qdrant_api_url = settings.QDRANT_API_URL
@@ -90,38 +92,69 @@ def process_element(element):
     return markdown
 
 
-def scrap_website(account_id, knowledge_source, user_id, max_crawl_depth: int = 1, max_crawl_page: int = 1, dynamic_wait: int = 5):
+def crawl_pages(url, report, **crawl_options):
+    """
+    Start a firecrawl crawl and yield its pages as they are scraped, polling the crawl status
+    every FIRECRAWL_POLL_SECONDS. Raises if the crawl fails or is cancelled.
+    """
+    crawl_job = firecrawl_app.async_crawl_url(url, **crawl_options)
+    if not crawl_job.success:
+        raise Exception(f"Could not start crawl of {url}: {crawl_job.error}")
+    seen = set()
+    while True:
+        crawl_status = firecrawl_app.check_crawl_status(crawl_job.id)
+        # Every check returns all pages scraped so far, only the new ones are yielded
+        for page in crawl_status.data or []:
+            page_url = page.metadata['url']
+            if page_url not in seen:
+                seen.add(page_url)
+                yield page
+        report("download", done=len(seen), total=max(crawl_status.total or 0, len(seen)))
+        if crawl_status.status == "completed":
+            return
+        if crawl_status.status in ("failed", "cancelled"):
+            raise Exception(f"Crawl of {url} {crawl_status.status}")
+        time.sleep(settings.FIRECRAWL_POLL_SECONDS)
+
+
+def website_scope(knowledge_source, data_id=None):
+    return record_scope(f"website:{knowledge_source}", data_id)
+
+
+def scrap_website(account_id, knowledge_source, user_id, max_crawl_depth: int = 1, max_crawl_page: int = 1, dynamic_wait: int = 5, progress=None, data_id=None):
     print("inside scrap data")
+    report = progress or (lambda *args, **kwargs: None)
     final_url = []
-    embedding_id = f"{str(account_id)}"
-
-    # Define chunk size and overlap based on recommendations
-    chunk_size = 5000
-    # separators = ["\n", "\n\n", "\r", "\r\n", "\n\r", "\t", " ", "  "]
-    chunk_overlap = 0  # 100-150 tokens overlap
-
-    # Define the text splitter
-    text_splitter = CharacterTextSplitter(separator="\n\n", chunk_size=chunk_size, chunk_overlap=chunk_overlap,
-                                          length_function=len)
+    embedding_id, tenant = knowledge_base_target(account_id)
 
     scrap_data_id = account_id
     print(f"scrap_data_id {scrap_data_id}")
 
-    if qdrant_client.collection_exists(embedding_id):
-        qdrant_client.delete_collection(embedding_id)
-        print(f"Collection deleted in Qdrant.........!!!!!!!!! {embedding_id}")
+    # Refreshes are incremental: the collection is kept and only new or changed chunks are embedded
+    scope = website_scope(knowledge_source, data_id)
+    has_sparse = ensure_collection(
+        qdrant_client, embedding_id, size=embeddings_dimension, multitenant=tenant is not None
+    )
+    drop_legacy_points(qdrant_client, embedding_id, tenant=tenant)
+    sync = IncrementalSync(
+        qdrant_client, embedding_id, scope=scope, source_type="website", tenant=tenant, data_id=data_id
+    )
 
-    if not qdrant_client.collection_exists(embedding_id):
-        qdrant_client.create_collection(
-            collection_name=embedding_id,
-            vectors_config=VectorParams(size=embeddings_dimension, distance='Cosine')
-        )
-        print(f"Collection created in Qdrant.........!!!!!!!!! {embedding_id}")
+    # Page logs are written INPROGRESS in batches while pages stream in, and get the final status at the end
+    page_logs = []
+    log_ids = []
+
+    def flush_page_logs():
+        log_ids.extend(save_website_scrapper_logs_bulk(page_logs))
+        page_logs.clear()
 
+    status = "FAILED"
     try:
         url = knowledge_source  # Replace with the actual URL
-        crawl_result = firecrawl_app.crawl_url(
-            url, 
+        report("download")
+        pages = crawl_pages(
+            url,
+            report,
             limit=max_crawl_page,
             max_depth=max_crawl_depth,
             scrape_options=ScrapeOptions(
@@ -129,49 +162,52 @@ def scrap_website(account_id, knowledge_source, user_id, max_crawl_depth: int =
                 maxAge=3600000  # Use cached data if less than 1 hour old
             )
         )
-        for page in crawl_result.data:
-            url = page.metadata['url']
-            final_url.append(url)
-            metadata = page.metadata
-            content_data = page.markdown
-            generate_logs = {
-                "rag_id": account_id,
-                "created_at": datetime.now(),
-                "link": url,
-                "page_content": "",
-                "status": "INPROGRESS"
-            }
-            save_website_scrapper_logs(data=generate_logs)
-            print("Loader completed")
-            p_uuid = str(uuid.uuid4())
-            cleaned_doc = Document(page_content=content_data, metadata=metadata)
-            # Split the cleaned text into chunks
-            text_chunks = text_splitter.split_documents([cleaned_doc])
-            QdrantVectorStore.from_documents(
-                text_chunks,
-                embeddings,
-                ids=[p_uuid],
-                url=qdrant_api_url,
-                api_key=qdrant_api_key,
-                prefer_grpc=True,
-                collection_name=embedding_id,
-                force_recreate=False,
-            )
-            print(f"data stored in qdrant {embedding_id}")
-            update_logs = {
-                "rag_id": account_id,
-                "link": url,
-                "page_content": content_data,
-                "status": "SUCCESS"
-            }
-            update_website_scrapper_logs(data=update_logs)
+
+        # Pages are chunked and handed to the pipeline as each status check returns them, so
+        # embedding and upserts of scraped pages overlap with the rest of the crawl
+        total_pages = 0
+        with IngestionPipeline(
+                qdrant_client, embedding_id, embed_texts, progress=report,
+                sparse_encoder=bm25_encoder if has_sparse else None
+        ) as pipeline:
+            for page in pages:
+                total_pages += 1
+                url = page.metadata['url']
+                final_url.append(url)
+                metadata = page.metadata
+                content_data = page.markdown or ""
+                for chunk in chunk_text(content_data):
+                    sync.add(pipeline, chunk, metadata)
+                page_logs.append({
+                    "rag_id": account_id,
+                    "created_at": datetime.now(),
+                    "link": url,
+                    "page_content": content_data[:settings.INGESTION_LOG_CONTENT_MAX_CHARS],
+                    "status": "INPROGRESS",
+                })
+                if len(page_logs) >= settings.INGESTION_LOG_BATCH_SIZE:
+                    flush_page_logs()
+        print("Loader completed")
+        if not total_pages:
+            # Never diff against an empty crawl, it would delete the whole knowledge base
+            raise Exception(f"Crawl of {knowledge_source} returned no pages")
+        sync_report = sync.finish()
+        print(f"data stored in qdrant {embedding_id}: {pipeline.upserted} chunks from {total_pages} pages")
+        status = "SUCCESS"
     except Exception as e:
         print("e", e)
-    update_data_management_logs(
-        data = {
-            "rag_id": str(account_id),
-            "files": final_url,
-        }
-    )
+        # Re-raise so the ingestion job is marked failed (and retried) instead of completed
+        raise
+    finally:
+        # One insert per INGESTION_LOG_BATCH_SIZE pages instead of an insert and an update per page
+        flush_page_logs()
+        for i in range(0, len(log_ids), settings.INGESTION_LOG_BATCH_SIZE):
+            update_website_scrapper_logs_status(log_ids[i:i + settings.INGESTION_LOG_BATCH_SIZE], status)
+        update_data_management_logs(
+            data = {
+                "rag_id": str(account_id),
+                "files": final_url,
+            }
+        )
     print(f'File Scrapped Successfully')
-    return True
+    return sync_report
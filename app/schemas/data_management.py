@@ -54,6 +54,7 @@ class ManageDataResponse(BaseModel):
     dynamic_wait: Optional[int] = None
     raw_text: Optional[str] = None
     error_message: Optional[str] = Field(default=None, description="Error message if processing failed")
+    job_id: Optional[str] = Field(default=None, description="ID of the latest ingestion job")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     processed_at: Optional[datetime] = None
@@ -62,6 +63,28 @@ class ManageDataResponse(BaseModel):
         from_attributes = True
         use_enum_values = True
 
+class IngestionJobResponse(BaseModel):
+    """Schema for an ingestion job and its per-stage progress"""
+    id: str
+    rag_id: str
+    data_id: str
+    source_type: DataSourceType
+    status: DataStatus
+    stage: Optional[str] = Field(default=None, description="Stage currently being processed")
+    progress: dict = Field(default_factory=dict, description="Per-stage {done, total} counters")
+    attempts: int = 0
+    max_attempts: int = 0
+    result: Optional[dict] = Field(default=None, description="Handler result, e.g. chunks skipped/embedded/deleted")
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+        use_enum_values = True
+
 class ManageDataListResponse(BaseModel):
     """Schema for listing multiple data management requests"""
     total: int
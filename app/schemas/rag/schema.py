@@ -1,5 +1,8 @@
 from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional
+from typing import Literal, Optional
+
+RerankerName = Literal["cohere", "cross_encoder", "lexical", "none"]
+SearchType = Literal["vector", "hybrid"]
 
 
 class RAGConfigCreate(BaseModel):
@@ -18,6 +21,14 @@ class RAGConfigCreate(BaseModel):
         ge=1,
         description="Number of top similar documents to retrieve"
     )
+    reranker: Optional[RerankerName] = Field(
+        default=None,
+        description="Rerank stage for retrieved chunks, defaults to the server setting"
+    )
+    search_type: Optional[SearchType] = Field(
+        default=None,
+        description="Dense-only or hybrid dense + BM25 retrieval, defaults to the server setting"
+    )
 
 
 class RAGConfigResponse(BaseModel):
@@ -30,6 +41,8 @@ class RAGConfigResponse(BaseModel):
     vector_store_api_key: str
     llm_api_key: str
     top_k_similarity: int
+    reranker: Optional[RerankerName] = None
+    search_type: Optional[SearchType] = None
     created_at: str = Field(..., description="Timestamp when the configuration was created")
 
     class Config:
@@ -27,6 +27,23 @@ class Document(BaseModel):
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    @staticmethod
+    def embed_batch(documents: List["Document"], embedder: Optional[Embedder] = None) -> None:
+        """Embed many documents with batched embedding requests.
+        Documents that already have an embedding (e.g. embedded ahead of the insert by aload) are kept as is.
+        """
+
+        documents = [document for document in documents if document.embedding is None]
+        if not documents:
+            return
+        _embedder = embedder or documents[0].embedder
+        if _embedder is None:
+            raise ValueError("No embedder provided")
+
+        embeddings, usages = _embedder.get_embeddings_batch_and_usage([document.content for document in documents])
+        for document, embedding, usage in zip(documents, embeddings, usages):
+            document.embedding, document.usage = embedding, usage
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
 
@@ -0,0 +1,251 @@
+"""
+Text chunking shared by phi readers and app ingestion.
+
+Every strategy is a single forward scan over the text with precompiled patterns and
+C-level string searches (no per-character Python loops), and yields chunks lazily.
+
+Strategies:
+    character: fixed-size windows cut at the last whitespace, with optional overlap
+    separator: split on a separator and greedily merge pieces up to chunk_size
+               (same output as langchain's CharacterTextSplitter)
+    token:     fixed-size windows of tiktoken tokens, with optional overlap
+    markdown:  split at headings, merge small sections and window large ones
+"""
+
+import re
+from typing import Callable, Iterator, List, Optional, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+_MARKDOWN_HEADING = re.compile(r"^#{1,6}[ \t]+\S", re.MULTILINE)
+_BREAK_CHARS = (" ", "\n", "\r", "\t")
+
+CHARACTER = "character"
+SEPARATOR = "separator"
+TOKEN = "token"
+MARKDOWN = "markdown"
+
+
+def clean_text(text: str) -> str:
+    """Collapse every run of whitespace into a single space in one pass"""
+    return _WHITESPACE.sub(" ", text)
+
+
+def _last_break(text: str, start: int, end: int) -> int:
+    """Index of the last whitespace in text[start:end], or -1"""
+    return max(text.rfind(char, start, end) for char in _BREAK_CHARS)
+
+
+def iter_character_chunks(text: str, chunk_size: int, overlap: int = 0) -> Iterator[str]:
+    """
+    Windows of at most chunk_size characters, ending before the last whitespace so
+    words are not split. A window without whitespace is cut at chunk_size.
+    """
+    for _, chunk in iter_character_spans(text, chunk_size, overlap):
+        yield chunk
+
+
+def iter_character_spans(text: str, chunk_size: int, overlap: int = 0) -> Iterator[Tuple[int, str]]:
+    """iter_character_chunks, with the offset of each chunk in text"""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    overlap = max(0, min(overlap, chunk_size - 1))
+    length = len(text)
+    start = 0
+    while start < length:
+        end = start + chunk_size
+        if end < length:
+            cut = _last_break(text, start + 1, end + 1)
+            if cut > start:
+                end = cut
+        else:
+            end = length
+        yield start, text[start:end]
+        if end >= length:
+            return
+        # Never before the window start: a negative offset would make rfind count from the end
+        next_start = max(end - overlap, start) if overlap else end
+        if overlap:
+            # Start the overlap on a word boundary
+            boundary = _last_break(text, next_start, end)
+            if boundary >= next_start and boundary + 1 < end:
+                next_start = boundary + 1
+        start = max(next_start, start + 1)
+
+
+def _split_with_offsets(text: str, separator: str) -> Iterator[Tuple[int, str]]:
+    """text.split(separator) (or its characters, without a separator) with the offset of each piece"""
+    if not separator:
+        yield from enumerate(text)
+        return
+    separator_length = len(separator)
+    start = 0
+    while True:
+        end = text.find(separator, start)
+        if end == -1:
+            yield start, text[start:]
+            return
+        yield start, text[start:end]
+        start = end + separator_length
+
+
+def iter_separator_chunks(text: str, chunk_size: int, overlap: int = 0, separator: str = "\n\n") -> Iterator[str]:
+    """
+    Split on separator and greedily merge consecutive pieces (joined by the separator)
+    while they fit in chunk_size. Pieces longer than chunk_size are emitted as they are.
+    """
+    for _, chunk in iter_separator_spans(text, chunk_size, overlap, separator):
+        yield chunk
+
+
+def iter_separator_spans(
+    text: str, chunk_size: int, overlap: int = 0, separator: str = "\n\n"
+) -> Iterator[Tuple[int, str]]:
+    """
+    iter_separator_chunks, with the offset in text of each chunk's first piece. Chunks are
+    stripped, so the offset is where scanning resumes, not where the chunk text starts.
+    """
+    separator_length = len(separator)
+    current: List[str] = []
+    starts: List[int] = []
+    total = 0
+    for start, piece in _split_with_offsets(text, separator):
+        if not piece:
+            continue
+        piece_length = len(piece)
+        if current and total + piece_length + separator_length > chunk_size:
+            chunk = separator.join(current).strip()
+            if chunk:
+                yield starts[0], chunk
+            # Keep trailing pieces as overlap for the next chunk
+            while current and (
+                total > overlap or (total + piece_length + separator_length > chunk_size and total > 0)
+            ):
+                total -= len(current[0]) + (separator_length if len(current) > 1 else 0)
+                current.pop(0)
+                starts.pop(0)
+        current.append(piece)
+        starts.append(start)
+        total += piece_length + (separator_length if len(current) > 1 else 0)
+    if current:
+        chunk = separator.join(current).strip()
+        if chunk:
+            yield starts[0], chunk
+
+
+def iter_token_chunks(
+    text: str, chunk_size: int, overlap: int = 0, encoding_name: str = "cl100k_base"
+) -> Iterator[str]:
+    """Windows of chunk_size tiktoken tokens; the text is encoded once"""
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError("`tiktoken` not installed")
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    encoding = tiktoken.get_encoding(encoding_name)
+    tokens = encoding.encode(text, disallowed_special=())
+    step = chunk_size - max(0, min(overlap, chunk_size - 1))
+    for start in range(0, len(tokens), step):
+        yield encoding.decode(tokens[start:start + chunk_size])
+        if start + chunk_size >= len(tokens):
+            return
+
+
+def iter_markdown_sections(text: str) -> Iterator[str]:
+    """Sections starting at each markdown heading (text before the first heading is its own section)"""
+    start = 0
+    for match in _MARKDOWN_HEADING.finditer(text):
+        if match.start() > start:
+            yield text[start:match.start()]
+        start = match.start()
+    if start < len(text):
+        yield text[start:]
+
+
+def iter_markdown_chunks(text: str, chunk_size: int, overlap: int = 0) -> Iterator[str]:
+    """
+    Heading-aware chunks: consecutive small sections are merged up to chunk_size, and a
+    section larger than chunk_size is windowed with the character strategy.
+    """
+    buffer: List[str] = []
+    buffered = 0
+    for section in iter_markdown_sections(text):
+        section = section.strip()
+        if not section:
+            continue
+        if buffer and buffered + len(section) + 1 > chunk_size:
+            yield "\n".join(buffer)
+            buffer, buffered = [], 0
+        if len(section) > chunk_size:
+            yield from iter_character_chunks(section, chunk_size, overlap)
+            continue
+        buffer.append(section)
+        buffered += len(section) + 1
+    if buffer:
+        yield "\n".join(buffer)
+
+
+def get_chunker(
+    strategy: str = CHARACTER, chunk_size: int = 3000, overlap: int = 0, separator: str = "\n\n"
+) -> Callable[[str], Iterator[str]]:
+    """Return a text -> chunks function for the given strategy"""
+    if strategy == CHARACTER:
+        return lambda text: iter_character_chunks(text, chunk_size, overlap)
+    if strategy == SEPARATOR:
+        return lambda text: iter_separator_chunks(text, chunk_size, overlap, separator)
+    if strategy == TOKEN:
+        return lambda text: iter_token_chunks(text, chunk_size, overlap)
+    if strategy == MARKDOWN:
+        return lambda text: iter_markdown_chunks(text, chunk_size, overlap)
+    raise ValueError(f"Unknown chunking strategy: {strategy}")
+
+
+def get_span_chunker(
+    strategy: str = CHARACTER, chunk_size: int = 3000, overlap: int = 0, separator: str = "\n\n"
+) -> Callable[[str], Iterator[Tuple[Optional[int], str]]]:
+    """
+    Return a text -> (offset, chunk) function for iter_stream_chunks. The offset is where
+    the chunk starts in text; it is None for strategies that do not track it (token, markdown).
+    """
+    if strategy == CHARACTER:
+        return lambda text: iter_character_spans(text, chunk_size, overlap)
+    if strategy == SEPARATOR:
+        return lambda text: iter_separator_spans(text, chunk_size, overlap, separator)
+    chunker = get_chunker(strategy, chunk_size, overlap, separator)
+    return lambda text: ((None, chunk) for chunk in chunker(text))
+
+
+def iter_stream_chunks(
+    pages: Iterator[str],
+    span_chunker: Callable[[str], Iterator[Tuple[Optional[int], str]]],
+    chunk_size: int,
+    joiner: str = "\n",
+) -> Iterator[str]:
+    """
+    Chunk a stream of pages as they arrive. Only a few chunks of text are buffered.
+
+    The last chunk of each pass may continue on the next page, and with overlap the pieces it
+    carries over from the chunk before depend on how it continues, so the raw buffer from the
+    offset of the second to last chunk is held back and chunked again. With the character and
+    separator strategies the chunks are the same as chunking joiner.join(pages) at once.
+    Strategies without offsets hold back the last chunk itself and may differ at page boundaries.
+    """
+    buffer: Optional[str] = None
+    for page in pages:
+        buffer = page if buffer is None else f"{buffer}{joiner}{page}"
+        if len(buffer) >= 2 * chunk_size:
+            spans = list(span_chunker(buffer))
+            if not spans:
+                buffer = None
+            elif spans[-1][0] is None:
+                for _, chunk in spans[:-1]:
+                    yield chunk
+                buffer = spans[-1][1]
+            elif len(spans) > 2:
+                for _, chunk in spans[:-2]:
+                    yield chunk
+                buffer = buffer[spans[-2][0]:]
+    if buffer:
+        for _, chunk in span_chunker(buffer):
+            yield chunk
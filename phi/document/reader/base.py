@@ -1,64 +1,54 @@
-from typing import Any, List
+from typing import Any, Iterator, List
 
 from pydantic import BaseModel
 
 from phi.document.base import Document
+from phi.document.chunking import CHARACTER, clean_text, get_chunker
 
 
 class Reader(BaseModel):
     chunk: bool = True
     chunk_size: int = 3000
+    # "character", "separator", "token" (chunk_size in tokens) or "markdown", see phi.document.chunking
+    chunk_strategy: str = CHARACTER
+    chunk_overlap: int = 0
     separators: List[str] = ["\n", "\n\n", "\r", "\r\n", "\n\r", "\t", " ", "  "]
 
     def read(self, obj: Any) -> List[Document]:
         raise NotImplementedError
 
-    def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
+    def iter_read(self, obj: Any) -> Iterator[Document]:
+        """Yield documents lazily. Readers that can stream override this; the default reads everything."""
+        yield from self.read(obj)
 
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
+    def iter_read_batches(self, obj: Any, batch_size: int = 100) -> Iterator[List[Document]]:
+        """Yield documents in lists of at most batch_size, so loaders can insert while reading continues"""
+        batch: List[Document] = []
+        for document in self.iter_read(obj):
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
-        return cleaned_text
+    def clean_text(self, text: str) -> str:
+        """Clean the text by collapsing every run of whitespace into a single space"""
+        return clean_text(text)
 
     def chunk_document(self, document: Document) -> List[Document]:
         """Chunk the document content into smaller documents"""
+        return list(self.iter_chunk_document(document))
+
+    def iter_chunk_document(self, document: Document) -> Iterator[Document]:
+        """Yield the chunks of a document one at a time"""
         content = document.content
-        cleaned_content = self.clean_text(content)
-        content_length = len(cleaned_content)
-        chunked_documents: List[Document] = []
-        chunk_number = 1
+        if self.chunk_strategy == CHARACTER:
+            content = self.clean_text(content)
+        chunker = get_chunker(self.chunk_strategy, self.chunk_size, self.chunk_overlap)
         chunk_meta_data = document.meta_data
 
-        start = 0
-        while start < content_length:
-            end = start + self.chunk_size
-
-            # Ensure we're not splitting a word in half
-            if end < content_length:
-                while end > start and cleaned_content[end] not in [" ", "\n", "\r", "\t"]:
-                    end -= 1
-
-            # If the entire chunk is a word, then just split it at self.chunk_size
-            if end == start:
-                end = start + self.chunk_size
-
-            # If the end is greater than the content length, then set it to the content length
-            if end > content_length:
-                end = content_length
-
-            chunk = cleaned_content[start:end]
+        for chunk_number, chunk in enumerate(chunker(content), start=1):
             meta_data = chunk_meta_data.copy()
             meta_data["chunk"] = chunk_number
             chunk_id = None
@@ -67,14 +57,13 @@ class Reader(BaseModel):
             elif document.name:
                 chunk_id = f"{document.name}_{chunk_number}"
             meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
+            # Fields are already valid, so skip pydantic validation for every chunk
+            yield Document.model_construct(
+                id=chunk_id,
+                name=document.name,
+                meta_data=meta_data,
+                content=chunk,
+                embedder=None,
+                embedding=None,
+                usage=None,
             )
-            chunk_number += 1
-            start = end
-        return chunked_documents
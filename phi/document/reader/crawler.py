@@ -0,0 +1,287 @@
+import asyncio
+import inspect
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, Union
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+from phi.utils.log import logger
+
+try:
+    from bs4 import BeautifulSoup  # noqa: F401
+except ImportError:
+    raise ImportError("The `bs4` package is not installed. Please install it via `pip install beautifulsoup4`.")
+
+SKIPPED_EXTENSIONS = (".pdf", ".jpg", ".png")
+
+# Called with the start url, returns more urls of the site to crawl (e.g. from its sitemaps)
+UrlSeeder = Callable[[str], Union[Iterable[str], Awaitable[Iterable[str]]]]
+
+
+class HttpCache:
+    """
+    Pages fetched with an ETag or Last-Modified header, so a later crawl can send a
+    conditional GET and reuse the stored body on 304 Not Modified. Thread safe, LRU bounded.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Optional[str], Optional[str], bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        """Return (etag, last_modified, content) or None"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], content: bytes) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[url] = (etag, last_modified, content)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class _Host:
+    """Per-host politeness state for one crawl"""
+
+    def __init__(self, concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.lock = asyncio.Lock()
+        self.delay = delay
+        self.next_request_at = 0.0
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_loaded = False
+
+
+class WebsiteCrawler:
+    """
+    Async breadth-first crawler for one site.
+
+    Pages are fetched concurrently over one connection pool. Politeness is per host: at most
+    max_concurrency_per_host requests in flight and host_delay seconds between request starts
+    (or the robots.txt Crawl-delay, if longer), and robots.txt rules are honored. All state
+    lives on the instance, so crawlers never share visited urls.
+    """
+
+    def __init__(
+        self,
+        extract: Callable[[BeautifulSoup], str],
+        max_depth: int = 3,
+        max_links: int = 10,
+        max_concurrency: int = 10,
+        max_concurrency_per_host: int = 2,
+        host_delay: float = 1.0,
+        timeout: float = 10,
+        user_agent: str = "phi-website-reader",
+        respect_robots_txt: bool = True,
+        seeder: Optional[UrlSeeder] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        """
+        Args:
+            extract: Returns the main content of a parsed page, pages without content are not returned.
+            max_depth: Depth of the links followed, the start url is depth 1.
+            max_links: Number of pages with content to return.
+            max_concurrency: Requests in flight across all hosts.
+            max_concurrency_per_host: Requests in flight per host.
+            host_delay: Minimum seconds between request starts to one host.
+            timeout: Request timeout in seconds.
+            user_agent: User agent sent with requests and matched against robots.txt.
+            respect_robots_txt: Skip urls robots.txt disallows and honor its Crawl-delay.
+            seeder: Adds urls to crawl besides the links found, e.g. from the site's sitemaps.
+            cache: Cache used for conditional GETs.
+        """
+        self.extract = extract
+        self.max_depth = max_depth
+        self.max_links = max_links
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.host_delay = host_delay
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.respect_robots_txt = respect_robots_txt
+        self.seeder = seeder
+        self.cache = cache
+
+        self._hosts: Dict[str, _Host] = {}
+        self._seen: Set[str] = set()
+        self._results: Dict[str, str] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._primary_domain = ""
+
+    @staticmethod
+    def primary_domain(url: str) -> str:
+        """Primary domain of a url, excluding subdomains"""
+        domain_parts = urlparse(url).netloc.split(".")
+        return ".".join(domain_parts[-2:])
+
+    def _host(self, url: str) -> _Host:
+        netloc = urlparse(url).netloc
+        if netloc not in self._hosts:
+            self._hosts[netloc] = _Host(self.max_concurrency_per_host, self.host_delay)
+        return self._hosts[netloc]
+
+    def _in_scope(self, url: str) -> bool:
+        parsed_url = urlparse(url)
+        return (
+            parsed_url.scheme in ("http", "https")
+            and parsed_url.netloc.endswith(self._primary_domain)
+            and not parsed_url.path.endswith(SKIPPED_EXTENSIONS)
+        )
+
+    def _enqueue(self, url: str, depth: int) -> None:
+        url = urldefrag(url)[0]
+        if depth > self.max_depth or url in self._seen or not self._in_scope(url):
+            return
+        self._seen.add(url)
+        if self._queue is not None:
+            self._queue.put_nowait((url, depth))
+
+    async def _load_robots(self, client: httpx.AsyncClient, url: str, host: _Host) -> None:
+        async with host.lock:
+            if host.robots_loaded:
+                return
+            host.robots_loaded = True
+            parsed_url = urlparse(url)
+            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+            robots = RobotFileParser(robots_url)
+            try:
+                response = await client.get(robots_url)
+            except Exception as e:
+                logger.debug(f"Could not fetch {robots_url}: {e}")
+                return
+            # Same rules as RobotFileParser.read: 401/403 disallow everything, other errors allow everything
+            if response.status_code in (401, 403):
+                robots.disallow_all = True
+            elif response.status_code < 400:
+                robots.parse(response.text.splitlines())
+            else:
+                robots.allow_all = True
+            host.robots = robots
+            crawl_delay = robots.crawl_delay(self.user_agent)
+            if crawl_delay is not None:
+                host.delay = max(host.delay, float(crawl_delay))
+
+    async def _wait_turn(self, host: _Host) -> None:
+        """Space request starts to a host by its delay"""
+        async with host.lock:
+            wait = host.next_request_at - monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            host.next_request_at = monotonic() + host.delay
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+        host = self._host(url)
+        if self.respect_robots_txt:
+            await self._load_robots(client, url, host)
+            if host.robots is not None and not host.robots.can_fetch(self.user_agent, url):
+                logger.debug(f"Skipping {url}: disallowed by robots.txt")
+                return None
+
+        headers: Dict[str, str] = {}
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with host.semaphore:
+            await self._wait_turn(host)
+            logger.debug(f"Crawling: {url}")
+            response = await client.get(url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            return cached[2]
+        response.raise_for_status()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache is not None and (etag or last_modified):
+            self.cache.set(url, etag, last_modified, response.content)
+        return response.content
+
+    def _parse(self, url: str, content: bytes) -> Tuple[str, Iterable[str]]:
+        soup = BeautifulSoup(content, "html.parser")
+        links = [urljoin(url, link["href"]) for link in soup.find_all("a", href=True)]
+        return self.extract(soup), links
+
+    async def _worker(self, client: httpx.AsyncClient) -> None:
+        assert self._queue is not None
+        while True:
+            url, depth = await self._queue.get()
+            try:
+                if len(self._results) >= self.max_links:
+                    continue
+                content = await self._fetch(client, url)
+                if content is None:
+                    continue
+                # Parsing is CPU bound, keep it off the event loop
+                main_content, links = await asyncio.to_thread(self._parse, url, content)
+                if main_content and len(self._results) < self.max_links:
+                    self._results[url] = main_content
+                for link in links:
+                    self._enqueue(link, depth + 1)
+            except Exception as e:
+                logger.debug(f"Failed to crawl: {url}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _seed(self, url: str) -> Iterable[str]:
+        if self.seeder is None:
+            return []
+        try:
+            if inspect.iscoroutinefunction(self.seeder):
+                seeded: Any = await self.seeder(url)
+            else:
+                seeded = await asyncio.to_thread(self.seeder, url)
+                if inspect.isawaitable(seeded):
+                    seeded = await seeded
+            return seeded or []
+        except Exception as e:
+            logger.warning(f"Could not seed urls for {url}: {e}")
+            return []
+
+    async def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
+        """
+        Crawl the site of url.
+
+        Returns:
+            Dict[str, str]: Url -> main content of at most max_links pages, in the order they were crawled.
+        """
+        self._hosts = {}
+        self._seen = set()
+        self._results = {}
+        self._queue = asyncio.Queue()
+        self._primary_domain = self.primary_domain(url)
+
+        self._enqueue(url, starting_depth)
+        # Seeded urls count as links of the start page
+        for seeded_url in await self._seed(url):
+            self._enqueue(seeded_url, starting_depth + 1)
+
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            follow_redirects=True,
+            headers={"User-Agent": self.user_agent},
+        ) as client:
+            workers = [asyncio.ensure_future(self._worker(client)) for _ in range(self.max_concurrency)]
+            try:
+                await self._queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        return dict(self._results)
@@ -1,219 +1,142 @@
+import os
+import tempfile
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import List, Union, IO, Any
+from typing import Callable, List, Union, IO, Any, Iterator
 
 from phi.document.base import Document
 from phi.document.reader.base import Reader
 from phi.utils.log import logger
 
 
-class PDFReader(Reader):
-    """Reader for PDF files"""
+def _pdf_doc_name(pdf: Union[str, Path, IO[Any]]) -> str:
+    try:
+        if isinstance(pdf, str):
+            return pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+        return pdf.name.split(".")[0]
+    except Exception:
+        return "pdf"
 
-    def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
-        if not pdf:
-            raise ValueError("No pdf provided")
 
-        try:
-            from pypdf import PdfReader as DocumentReader  # noqa: F401
-        except ImportError:
-            raise ImportError("`pypdf` not installed")
+def _url_doc_name(url: str) -> str:
+    return url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
 
-        doc_name = ""
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
 
-        logger.info(f"Reading: {doc_name}")
-        doc_reader = DocumentReader(pdf)
-
-        documents = [
-            Document(
-                name=doc_name,
-                id=f"{doc_name}_{page_number}",
-                meta_data={"page": page_number},
-                content=page.extract_text(),
-            )
-            for page_number, page in enumerate(doc_reader.pages, start=1)
-        ]
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
-        return documents
-
-
-class PDFUrlReader(Reader):
-    """Reader for PDF files from URL"""
+@contextmanager
+def _download_pdf(url: str, chunk_size: int = 1 << 20) -> Iterator[str]:
+    """Stream a PDF from a URL to a temp file, yield its path and delete it afterwards"""
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("`httpx` not installed")
 
-    def read(self, url: str) -> List[Document]:
-        if not url:
-            raise ValueError("No url provided")
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as file, httpx.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            for block in response.iter_bytes(chunk_size):
+                file.write(block)
+        yield path
+    finally:
+        os.remove(path)
 
-        from io import BytesIO
 
-        try:
-            import httpx
-        except ImportError:
-            raise ImportError("`httpx` not installed")
+def _ocr_page_text(ocr: Any) -> Callable[[Any], str]:
+    def page_text(page: Any) -> str:
+        text = page.extract_text() or ""
+        images_text_list: List = []
+        for image_object in page.images:
+            # Perform OCR on the image
+            ocr_result, elapse = ocr(image_object.data)
+            # Extract text from OCR result
+            if ocr_result:
+                images_text_list += [item[1] for item in ocr_result]
+        return text + "\n" + "\n".join(images_text_list)
 
-        try:
-            from pypdf import PdfReader as DocumentReader  # noqa: F401
-        except ImportError:
-            raise ImportError("`pypdf` not installed")
+    return page_text
 
-        logger.info(f"Reading: {url}")
-        response = httpx.get(url)
-
-        doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
-
-        documents = [
-            Document(
-                name=doc_name,
-                id=f"{doc_name}_{page_number}",
-                meta_data={"page": page_number},
-                content=page.extract_text(),
-            )
-            for page_number, page in enumerate(doc_reader.pages, start=1)
-        ]
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
-        return documents
-
-
-class PDFImageReader(Reader):
-    """Reader for PDF files with text and images extraction"""
 
-    def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
-        if not pdf:
-            raise ValueError("No pdf provided")
+class PDFReader(Reader):
+    """Reader for PDF files"""
+
+    def _page_text(self) -> Callable[[Any], str]:
+        return lambda page: page.extract_text()
 
+    def _iter_pages(self, pdf: Union[str, Path, IO[Any]], doc_name: str) -> Iterator[Document]:
+        """
+        Parse pages one at a time and yield them (chunked if enabled). pypdf reads pages
+        lazily from the file, so only the current page's text is held in memory.
+        """
         try:
-            import rapidocr_onnxruntime as rapidocr
             from pypdf import PdfReader as DocumentReader  # noqa: F401
         except ImportError:
-            raise ImportError("`pypdf` or `rapidocr_onnxruntime` not installed")
-
-        doc_name = ""
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
-
-        logger.info(f"Reading: {doc_name}")
-        doc_reader = DocumentReader(pdf)
-
-        # Initialize RapidOCR
-        ocr = rapidocr.RapidOCR()
-
-        documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            page_text = page.extract_text() or ""
-            images_text_list: List = []
-
-            for image_object in page.images:
-                image_data = image_object.data
-
-                # Perform OCR on the image
-                ocr_result, elapse = ocr(image_data)
-
-                # Extract text from OCR result
-                if ocr_result:
-                    images_text_list += [item[1] for item in ocr_result]
-
-            images_text: str = "\n".join(images_text_list)
-            content = page_text + "\n" + images_text
+            raise ImportError("`pypdf` not installed")
 
-            documents.append(
-                Document(
+        page_text = self._page_text()
+        # pypdf copies a path's whole file into memory; an open file handle is read on demand
+        with open(pdf, "rb") if isinstance(pdf, (str, Path)) else nullcontext(pdf) as stream:
+            doc_reader = DocumentReader(stream)
+            for page_number, page in enumerate(doc_reader.pages, start=1):
+                document = Document(
                     name=doc_name,
                     id=f"{doc_name}_{page_number}",
                     meta_data={"page": page_number},
-                    content=content,
+                    content=page_text(page),
                 )
-            )
+                if self.chunk:
+                    yield from self.iter_chunk_document(document)
+                else:
+                    yield document
 
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
+    def iter_read(self, pdf: Union[str, Path, IO[Any]]) -> Iterator[Document]:
+        if not pdf:
+            raise ValueError("No pdf provided")
+
+        doc_name = _pdf_doc_name(pdf)
+        logger.info(f"Reading: {doc_name}")
+        yield from self._iter_pages(pdf, doc_name)
 
-        return documents
+    def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
+        return list(self.iter_read(pdf))
 
 
-class PDFUrlImageReader(Reader):
-    """Reader for PDF files from URL with text and images extraction"""
+class PDFUrlReader(PDFReader):
+    """Reader for PDF files from URL"""
 
-    def read(self, url: str) -> List[Document]:
+    def iter_read(self, url: str) -> Iterator[Document]:  # type: ignore[override]
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
-        try:
-            import httpx
-            from pypdf import PdfReader as DocumentReader
-            import rapidocr_onnxruntime as rapidocr
-        except ImportError:
-            raise ImportError("`httpx`, `pypdf` or `rapidocr_onnxruntime` not installed")
-
-        # Read the PDF from the URL
         logger.info(f"Reading: {url}")
-        response = httpx.get(url)
+        # The download is streamed to disk instead of being held in memory
+        with _download_pdf(url) as path:
+            yield from self._iter_pages(path, _url_doc_name(url))
 
-        doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
-        doc_reader = DocumentReader(BytesIO(response.content))
+    def read(self, url: str) -> List[Document]:  # type: ignore[override]
+        return list(self.iter_read(url))
 
-        # Initialize RapidOCR
-        ocr = rapidocr.RapidOCR()
-
-        # Process each page of the PDF
-        documents = []
-        for page_number, page in enumerate(doc_reader.pages, start=1):
-            page_text = page.extract_text() or ""
-            images_text_list = []
 
-            # Extract and process images
-            for image_object in page.images:
-                image_data = image_object.data
+class PDFImageReader(PDFReader):
+    """Reader for PDF files with text and images extraction"""
 
-                # Perform OCR on the image
-                ocr_result, elapse = ocr(image_data)
+    def _page_text(self) -> Callable[[Any], str]:
+        try:
+            import rapidocr_onnxruntime as rapidocr
+        except ImportError:
+            raise ImportError("`pypdf` or `rapidocr_onnxruntime` not installed")
 
-                # Extract text from OCR result
-                if ocr_result:
-                    images_text_list += [item[1] for item in ocr_result]
+        # Initialize RapidOCR
+        return _ocr_page_text(rapidocr.RapidOCR())
 
-            images_text = "\n".join(images_text_list)
-            content = page_text + "\n" + images_text
 
-            # Append the document
-            documents.append(
-                Document(
-                    name=doc_name,
-                    id=f"{doc_name}_{page_number}",
-                    meta_data={"page": page_number},
-                    content=content,
-                )
-            )
+class PDFUrlImageReader(PDFUrlReader):
+    """Reader for PDF files from URL with text and images extraction"""
 
-        # Optionally chunk documents
-        if self.chunk:
-            chunked_documents = []
-            for document in documents:
-                chunked_documents.extend(self.chunk_document(document))
-            return chunked_documents
+    def _page_text(self) -> Callable[[Any], str]:
+        try:
+            import rapidocr_onnxruntime as rapidocr
+        except ImportError:
+            raise ImportError("`httpx`, `pypdf` or `rapidocr_onnxruntime` not installed")
 
-        return documents
+        # Initialize RapidOCR
+        return _ocr_page_text(rapidocr.RapidOCR())
@@ -1,13 +1,10 @@
-import time
-import random
-from typing import Set, Dict, List, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import Dict, List, Optional
 
 from phi.document.base import Document
 from phi.document.reader.base import Reader
+from phi.document.reader.crawler import HttpCache, UrlSeeder, WebsiteCrawler
 from phi.utils.log import logger
-
-import httpx
+from phi.utils.run_async import run_awaitable
 
 try:
     from bs4 import BeautifulSoup  # noqa: F401
@@ -21,18 +18,20 @@ class WebsiteReader(Reader):
     max_depth: int = 3
     max_links: int = 10
 
-    _visited: Set[str] = set()
-    _urls_to_crawl: List[Tuple[str, int]] = []
-
-    def delay(self, min_seconds=1, max_seconds=3):
-        """
-        Introduce a random delay.
-
-        :param min_seconds: Minimum number of seconds to delay. Default is 1.
-        :param max_seconds: Maximum number of seconds to delay. Default is 3.
-        """
-        sleep_time = random.uniform(min_seconds, max_seconds)
-        time.sleep(sleep_time)
+    # Requests in flight across all hosts, and per host
+    max_concurrency: int = 10
+    max_concurrency_per_host: int = 2
+    # Minimum seconds between requests to one host; a longer robots.txt Crawl-delay wins
+    host_delay: float = 1.0
+    respect_robots_txt: bool = True
+    user_agent: str = "phi-website-reader"
+    timeout: float = 10
+    # Returns more urls of the site to crawl, e.g. app.manage_data.scrap_sitemaps.find_all_urls
+    sitemap_seeder: Optional[UrlSeeder] = None
+    # Pages kept for conditional GETs (ETag / Last-Modified) when a site is crawled again
+    cache_size: int = 1024
+
+    _http_cache: Optional[HttpCache] = None
 
     def _get_primary_domain(self, url: str) -> str:
         """
@@ -41,9 +40,7 @@ class WebsiteReader(Reader):
         :param url: The URL to extract the primary domain from.
         :return: The primary domain.
         """
-        domain_parts = urlparse(url).netloc.split(".")
-        # Return primary domain (excluding subdomains)
-        return ".".join(domain_parts[-2:])
+        return WebsiteCrawler.primary_domain(url)
 
     def _extract_main_content(self, soup: BeautifulSoup) -> str:
         """
@@ -65,7 +62,24 @@ class WebsiteReader(Reader):
 
         return ""
 
-    def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
+    def _crawler(self) -> WebsiteCrawler:
+        if self._http_cache is None:
+            self._http_cache = HttpCache(maxsize=self.cache_size)
+        return WebsiteCrawler(
+            extract=self._extract_main_content,
+            max_depth=self.max_depth,
+            max_links=self.max_links,
+            max_concurrency=self.max_concurrency,
+            max_concurrency_per_host=self.max_concurrency_per_host,
+            host_delay=self.host_delay,
+            timeout=self.timeout,
+            user_agent=self.user_agent,
+            respect_robots_txt=self.respect_robots_txt,
+            seeder=self.sitemap_seeder,
+            cache=self._http_cache,
+        )
+
+    async def acrawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
 
@@ -80,74 +94,16 @@ class WebsiteReader(Reader):
         Note:
         The function focuses on extracting the main content by prioritizing content inside common HTML tags
         like `<article>`, `<main>`, and `<div>` with class names such as "content", "main-content", etc.
-        The crawler will also respect the `max_depth` attribute of the WebCrawler class, ensuring it does not
-        crawl deeper than the specified depth.
+        Pages are fetched concurrently within the per-host limits (see WebsiteCrawler), links are followed
+        up to `max_depth` and at most `max_links` pages are returned.
         """
-        num_links = 0
-        crawler_result: Dict[str, str] = {}
-        primary_domain = self._get_primary_domain(url)
-        # Add starting URL with its depth to the global list
-        self._urls_to_crawl.append((url, starting_depth))
-        while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
-
-            # Skip if
-            # - URL is already visited
-            # - does not end with the primary domain,
-            # - exceeds max depth
-            # - exceeds max links
-            if (
-                current_url in self._visited
-                or not urlparse(current_url).netloc.endswith(primary_domain)
-                or current_depth > self.max_depth
-                or num_links >= self.max_links
-            ):
-                continue
-
-            self._visited.add(current_url)
-            self.delay()
-
-            try:
-                logger.debug(f"Crawling: {current_url}")
-                response = httpx.get(current_url, timeout=10)
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Extract main content
-                main_content = self._extract_main_content(soup)
-                if main_content:
-                    crawler_result[current_url] = main_content
-                    num_links += 1
-
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    full_url = urljoin(current_url, link["href"])
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        if full_url not in self._visited and (full_url, current_depth + 1) not in self._urls_to_crawl:
-                            self._urls_to_crawl.append((full_url, current_depth + 1))
-
-            except Exception as e:
-                logger.debug(f"Failed to crawl: {current_url}: {e}")
-                pass
-
-        return crawler_result
+        return await self._crawler().crawl(url, starting_depth=starting_depth)
 
-    def read(self, url: str) -> List[Document]:
-        """
-        Reads a website and returns a list of documents.
-
-        This function first converts the website into a dictionary of URLs and their corresponding content.
-        Then iterates through the dictionary and returns chunks of content.
-
-        :param url: The URL of the website to read.
-        :return: A list of documents.
-        """
+    def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
+        """Sync version of acrawl"""
+        return run_awaitable(self.acrawl(url, starting_depth=starting_depth))
 
-        logger.debug(f"Reading: {url}")
-        crawler_result = self.crawl(url)
+    def _documents(self, url: str, crawler_result: Dict[str, str]) -> List[Document]:
         documents = []
         for crawled_url, crawled_content in crawler_result.items():
             if self.chunk:
@@ -168,3 +124,23 @@ class WebsiteReader(Reader):
                     )
                 )
         return documents
+
+    def read(self, url: str) -> List[Document]:
+        """
+        Reads a website and returns a list of documents.
+
+        This function first converts the website into a dictionary of URLs and their corresponding content.
+        Then iterates through the dictionary and returns chunks of content.
+
+        :param url: The URL of the website to read.
+        :return: A list of documents.
+        """
+
+        logger.debug(f"Reading: {url}")
+        return self._documents(url, self.crawl(url))
+
+    async def aread(self, url: str) -> List[Document]:
+        """Async version of read"""
+
+        logger.debug(f"Reading: {url}")
+        return self._documents(url, await self.acrawl(url))
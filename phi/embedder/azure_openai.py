@@ -1,5 +1,5 @@
 from os import getenv
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from typing_extensions import Literal
 
 from phi.embedder.base import Embedder
@@ -16,6 +16,9 @@ class AzureOpenAIEmbedder(Embedder):
     model: str = "text-embedding-ada-002"
     dimensions: int = 1536
     encoding_format: Literal["float", "base64"] = "float"
+    # Older Azure deployments accept at most 16 inputs per request; lower this for those
+    batch_size: int = 2048
+    max_batch_tokens: Optional[int] = 300000
     user: Optional[str] = None
     api_key: Optional[str] = getenv("AZURE_OPENAI_API_KEY")
     api_version: str = getenv("AZURE_OPENAI_API_VERSION", "2024-02-01")
@@ -53,7 +56,7 @@ class AzureOpenAIEmbedder(Embedder):
             _client_params["azure_ad_token_provider"] = self.azure_ad_token_provider
         return AzureOpenAIClient(**_client_params)
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.model,
@@ -81,3 +84,14 @@ class AzureOpenAIEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            response: CreateEmbeddingResponse = self._response(text=batch)
+            embeddings.extend(data.embedding for data in sorted(response.data, key=lambda d: d.index))
+        return embeddings
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.get_embeddings_batch(texts)
+        return embeddings, [None] * len(embeddings)
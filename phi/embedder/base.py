@@ -1,4 +1,5 @@
-from typing import Optional, Dict, List, Tuple
+import asyncio
+from typing import Optional, Dict, Iterator, List, Tuple
 
 from pydantic import BaseModel, ConfigDict
 
@@ -7,6 +8,10 @@ class Embedder(BaseModel):
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Max number of texts sent in one embeddings request
+    batch_size: int = 100
+    # Max (estimated) tokens sent in one embeddings request, None for no limit
+    max_batch_tokens: Optional[int] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -15,3 +20,49 @@ class Embedder(BaseModel):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts. Providers with a batch endpoint override this to send one request per batch."""
+        return [self.get_embedding(text) for text in texts]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Embed many texts and return per-text usage. Batched providers only report usage
+        for the whole request, so they return None for each text.
+        """
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for text in texts:
+            embedding, usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usages.append(usage)
+        return embeddings, usages
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """Async embedding. Embedders without an async client run the sync call in a worker thread."""
+        return await asyncio.to_thread(self.get_embedding, text)
+
+    async def aget_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.get_embeddings_batch, texts)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        # Conservative estimate (~3 characters per token) so batches stay under provider limits
+        return len(text) // 3 + 1
+
+    def iter_batches(self, texts: List[str]) -> Iterator[List[str]]:
+        """Split texts into batches respecting batch_size and max_batch_tokens"""
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = self.estimate_tokens(text)
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
@@ -0,0 +1,207 @@
+import asyncio
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from phi.utils.log import logger
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different queries share a cache entry"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(text: str, model: str) -> str:
+    return sha256(f"{model}\x00{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+def pack_vector(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def unpack_vector(data: bytes) -> List[float]:
+    vector = array("f")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class EmbeddingStore:
+    """Persistent tier for the embedding cache. Vectors are stored as float32 bytes."""
+
+    def get(self, key: str) -> Optional[List[float]]:
+        raise NotImplementedError
+
+    def set(self, key: str, model: str, vector: List[float]) -> None:
+        raise NotImplementedError
+
+
+class SqliteEmbeddingStore(EmbeddingStore):
+    def __init__(self, path: Union[str, Path] = "embedding_cache.sqlite"):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, model TEXT, vector BLOB)"
+        )
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            row = self._connection.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+        return unpack_vector(row[0]) if row else None
+
+    def set(self, key: str, model: str, vector: List[float]) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, vector) VALUES (?, ?, ?)",
+                (key, model, pack_vector(vector)),
+            )
+            self._connection.commit()
+
+
+class MongoEmbeddingStore(EmbeddingStore):
+    def __init__(self, collection: Any):
+        """
+        Args:
+            collection: A pymongo Collection used to store the vectors
+        """
+        self.collection = collection
+
+    def get(self, key: str) -> Optional[List[float]]:
+        document = self.collection.find_one({"_id": key}, {"vector": 1})
+        return unpack_vector(document["vector"]) if document else None
+
+    def set(self, key: str, model: str, vector: List[float]) -> None:
+        self.collection.update_one(
+            {"_id": key}, {"$set": {"model": model, "vector": pack_vector(vector)}}, upsert=True
+        )
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache: (normalized text, model) -> vector.
+
+    Lookups go to an in-memory LRU first, then to the optional persistent store.
+    """
+
+    def __init__(self, maxsize: int = 10000, store: Optional[EmbeddingStore] = None):
+        self.maxsize = maxsize
+        self.store = store
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0
+
+    def _memory_get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+            return vector
+
+    def _memory_set(self, key: str, vector: List[float]) -> None:
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    def _store_get(self, key: str) -> Optional[List[float]]:
+        if self.store is None:
+            return None
+        try:
+            vector = self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Embedding cache store lookup failed: {e}")
+            return None
+        if vector is not None:
+            self._memory_set(key, vector)
+            with self._lock:
+                self.store_hits += 1
+        return vector
+
+    def _record_miss(self, key: str, model: str, vector: List[float], elapsed: float) -> None:
+        with self._lock:
+            self.misses += 1
+            self.miss_seconds += elapsed
+        if not vector:
+            return
+        self._memory_set(key, vector)
+        if self.store is not None:
+            try:
+                self.store.set(key, model, vector)
+            except Exception as e:
+                logger.warning(f"Embedding cache store write failed: {e}")
+
+    def get(self, text: str, model: str) -> Optional[List[float]]:
+        key = cache_key(text, model)
+        vector = self._memory_get(key)
+        if vector is None:
+            vector = self._store_get(key)
+        return vector
+
+    def get_or_compute(self, text: str, model: str, compute: Callable[[], List[float]]) -> List[float]:
+        key = cache_key(text, model)
+        vector = self._memory_get(key)
+        if vector is None:
+            vector = self._store_get(key)
+        if vector is not None:
+            return vector
+
+        start_time = perf_counter()
+        vector = compute()
+        self._record_miss(key, model, vector, perf_counter() - start_time)
+        return vector
+
+    async def aget_or_compute(
+        self, text: str, model: str, compute: Callable[[], Awaitable[List[float]]]
+    ) -> List[float]:
+        key = cache_key(text, model)
+        vector = self._memory_get(key)
+        if vector is None and self.store is not None:
+            vector = await asyncio.to_thread(self._store_get, key)
+        if vector is not None:
+            return vector
+
+        start_time = perf_counter()
+        vector = await compute()
+        elapsed = perf_counter() - start_time
+        if self.store is not None:
+            await asyncio.to_thread(self._record_miss, key, model, vector, elapsed)
+        else:
+            self._record_miss(key, model, vector, elapsed)
+        return vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.memory_hits + self.store_hits
+            lookups = hits + self.misses
+            avg_miss_seconds = self.miss_seconds / self.misses if self.misses else 0.0
+            return {
+                "size": len(self._memory),
+                "maxsize": self.maxsize,
+                "memory_hits": self.memory_hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "avg_miss_ms": round(avg_miss_seconds * 1000, 3),
+                # Estimated embedding latency avoided, based on the average cost of a miss
+                "saved_ms": round(avg_miss_seconds * hits * 1000, 3),
+            }
+
+
+# Process-wide cache shared by vector db query paths and the app's embedding helpers
+default_embedding_cache = EmbeddingCache()
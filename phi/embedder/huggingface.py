@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Tuple
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
@@ -14,6 +15,7 @@ class HuggingfaceCustomEmbedder(Embedder):
     """Huggingface Custom Embedder"""
 
     model: str = "jinaai/jina-embeddings-v2-base-code"
+    batch_size: int = 32
     api_key: Optional[str] = None
     client_params: Optional[Dict[str, Any]] = None
     huggingface_client: Optional[InferenceClient] = None
@@ -29,7 +31,7 @@ class HuggingfaceCustomEmbedder(Embedder):
             _client_params.update(self.client_params)
         return InferenceClient(**_client_params)
 
-    def _response(self, text: str):
+    def _response(self, text: Union[str, List[str]]):
         _request_params: SentenceSimilarityInput = {
             "json": {"inputs": text},
             "model": self.model,
@@ -46,3 +48,16 @@ class HuggingfaceCustomEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return super().get_embedding_and_usage(text)
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            response = self._response(text=batch)
+            if isinstance(response, (bytes, str)):
+                response = json.loads(response)
+            embeddings.extend(response)
+        return embeddings
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.get_embeddings_batch(texts)
+        return embeddings, [None] * len(embeddings)
@@ -1,5 +1,5 @@
 from os import getenv
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
@@ -14,6 +14,8 @@ except ImportError:
 class MistralEmbedder(Embedder):
     model: str = "mistral-embed"
     dimensions: int = 1024
+    batch_size: int = 128
+    max_batch_tokens: Optional[int] = 16000
     # -*- Request parameters
     request_params: Optional[Dict[str, Any]] = None
     # -*- Client parameters
@@ -43,7 +45,7 @@ class MistralEmbedder(Embedder):
             _client_params.update(self.client_params)
         return Mistral(**_client_params)
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.model,
@@ -66,3 +68,14 @@ class MistralEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            response: EmbeddingResponse = self._response(text=batch)
+            embeddings.extend(data.embedding for data in sorted(response.data, key=lambda d: d.index))
+        return embeddings
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.get_embeddings_batch(texts)
+        return embeddings, [None] * len(embeddings)
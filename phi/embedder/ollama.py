@@ -13,6 +13,7 @@ except ImportError:
 class OllamaEmbedder(Embedder):
     model: str = "openhermes"
     dimensions: int = 4096
+    batch_size: int = 64
     host: Optional[str] = None
     timeout: Optional[Any] = None
     options: Optional[Any] = None
@@ -60,3 +61,26 @@ class OllamaEmbedder(Embedder):
         except Exception as e:
             logger.warning(e)
         return embedding, usage
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+
+        # `Client.embed` (ollama >= 0.3) accepts a list of inputs; older clients only have `embeddings`
+        if not hasattr(self.client, "embed"):
+            return super().get_embeddings_batch(texts)
+
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            try:
+                response = self.client.embed(model=self.model, input=batch, **kwargs)
+                embeddings.extend(response.get("embeddings", []) or [[] for _ in batch])
+            except Exception as e:
+                logger.warning(e)
+                embeddings.extend([] for _ in batch)
+        return embeddings
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.get_embeddings_batch(texts)
+        return embeddings, [None] * len(embeddings)
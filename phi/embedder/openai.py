@@ -1,4 +1,4 @@
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from typing_extensions import Literal
 
 from phi.embedder.base import Embedder
@@ -6,6 +6,7 @@ from phi.utils.log import logger
 
 try:
     from openai import OpenAI as OpenAIClient
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
     raise ImportError("`openai` not installed")
@@ -15,6 +16,8 @@ class OpenAIEmbedder(Embedder):
     model: str = "text-embedding-ada-002"
     dimensions: int = 1536
     encoding_format: Literal["float", "base64"] = "float"
+    batch_size: int = 2048
+    max_batch_tokens: Optional[int] = 300000
     user: Optional[str] = None
     api_key: Optional[str] = None
     organization: Optional[str] = None
@@ -22,12 +25,9 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    async_openai_client: Optional[AsyncOpenAIClient] = None
 
-    @property
-    def client(self) -> OpenAIClient:
-        if self.openai_client:
-            return self.openai_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {}
         if self.api_key:
             _client_params["api_key"] = self.api_key
@@ -37,9 +37,22 @@ class OpenAIEmbedder(Embedder):
             _client_params["base_url"] = self.base_url
         if self.client_params:
             _client_params.update(self.client_params)
-        return OpenAIClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> OpenAIClient:
+        # Created once and reused, so every embedding call shares one keep-alive connection pool
+        if self.openai_client is None:
+            self.openai_client = OpenAIClient(**self._get_client_params())
+        return self.openai_client
+
+    @property
+    def async_client(self) -> AsyncOpenAIClient:
+        if self.async_openai_client is None:
+            self.async_openai_client = AsyncOpenAIClient(**self._get_client_params())
+        return self.async_openai_client
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+    def _request_params(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.model,
@@ -51,7 +64,13 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._request_params(text))
+
+    async def _aresponse(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return await self.async_client.embeddings.create(**self._request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self._response(text=text)
@@ -69,3 +88,29 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            response: CreateEmbeddingResponse = self._response(text=batch)
+            embeddings.extend(data.embedding for data in sorted(response.data, key=lambda d: d.index))
+        return embeddings
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.get_embeddings_batch(texts)
+        return embeddings, [None] * len(embeddings)
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        response: CreateEmbeddingResponse = await self._aresponse(text=text)
+        try:
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def aget_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            response: CreateEmbeddingResponse = await self._aresponse(text=batch)
+            embeddings.extend(data.embedding for data in sorted(response.data, key=lambda d: d.index))
+        return embeddings
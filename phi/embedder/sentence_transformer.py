@@ -22,10 +22,16 @@ except ImportError:
 class SentenceTransformerEmbedder(Embedder):
     model: str = "sentence-transformers/all-MiniLM-L6-v2"
     sentence_transformer_client: Optional[SentenceTransformer] = None
+    batch_size: int = 32
+
+    @property
+    def client(self) -> SentenceTransformer:
+        if self.sentence_transformer_client is None:
+            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.model)
+        return self.sentence_transformer_client
 
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        model = SentenceTransformer(model_name_or_path=self.model)
-        embedding = model.encode(text)
+        embedding = self.client.encode(text)
         try:
             return embedding
         except Exception as e:
@@ -34,3 +40,11 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return super().get_embedding_and_usage(text)
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings = self.client.encode(texts, batch_size=self.batch_size)
+        return [embedding.tolist() for embedding in embeddings]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.get_embeddings_batch(texts)
+        return embeddings, [None] * len(embeddings)
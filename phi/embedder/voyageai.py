@@ -13,6 +13,8 @@ except ImportError:
 class VoyageAIEmbedder(Embedder):
     model: str = "voyage-2"
     dimensions: int = 1024
+    batch_size: int = 128
+    max_batch_tokens: Optional[int] = 120000
     request_params: Optional[Dict[str, Any]] = None
     api_key: Optional[str] = None
     base_url: str = "https://api.voyageai.com/v1/embeddings"
@@ -38,8 +40,11 @@ class VoyageAIEmbedder(Embedder):
         return Client(**_client_params)
 
     def _response(self, text: str) -> EmbeddingsObject:
+        return self._batch_response(texts=[text])
+
+    def _batch_response(self, texts: List[str]) -> EmbeddingsObject:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": texts,
             "model": self.model,
         }
         if self.request_params:
@@ -60,3 +65,14 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for batch in self.iter_batches(texts):
+            response: EmbeddingsObject = self._batch_response(texts=batch)
+            embeddings.extend(response.embeddings)
+        return embeddings
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        embeddings = self.get_embeddings_batch(texts)
+        return embeddings, [None] * len(embeddings)
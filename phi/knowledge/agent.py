@@ -1,4 +1,5 @@
-from typing import List, Optional, Iterator, Dict, Any
+import asyncio
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from pydantic import ConfigDict
 
@@ -10,6 +11,11 @@ from phi.vectordb import VectorDb
 from phi.utils.log import logger
 
 
+def lazy_document_list(read: Callable[..., List[Document]], *args: Any, **kwargs: Any) -> Iterator[List[Document]]:
+    """A document source that calls read(*args, **kwargs) when it is first iterated"""
+    yield read(*args, **kwargs)
+
+
 class AgentKnowledge(AssistantKnowledge):
     """Base class for Agent knowledge
 
@@ -28,6 +34,13 @@ class AgentKnowledge(AssistantKnowledge):
     # ChunkingStrategy to chunk documents into smaller documents before storing in vector db
     chunking_strategy: ChunkingStrategy = CharacterChunks()
 
+    # aload: sources read at once, document lists embedded at once and written at once
+    read_concurrency: int = 4
+    embed_concurrency: int = 2
+    insert_concurrency: int = 2
+    # aload: document lists buffered between stages; a full buffer pauses the stage feeding it
+    load_queue_size: int = 4
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @property
@@ -37,6 +50,15 @@ class AgentKnowledge(AssistantKnowledge):
         """
         raise NotImplementedError
 
+    @property
+    def document_sources(self) -> Iterator[Iterator[List[Document]]]:
+        """Iterator over the sources of the knowledge base (files, urls, objects, ...), each an
+        iterator of document lists. aload reads sources concurrently, so a source should not do
+        any work until it is iterated.
+        Knowledge bases that do not split their documents by source are a single source.
+        """
+        yield iter(self.document_lists)
+
     def search(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
@@ -91,13 +113,145 @@ class AgentKnowledge(AssistantKnowledge):
             else:
                 # Filter out documents which already exist in the vector db
                 if skip_existing:
-                    documents_to_load = [
-                        document for document in document_list if not self.vector_db.doc_exists(document)
-                    ]
+                    documents_to_load = self.vector_db.exclude_existing(document_list)
                 self.vector_db.insert(documents=documents_to_load, filters=filters)
             num_documents += len(documents_to_load)
             logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
 
+    async def aload(
+        self,
+        recreate: bool = False,
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Load the knowledge base to the vector db, overlapping reading, embedding and inserting.
+
+        Sources are read concurrently and their document lists flow through bounded queues to
+        the embedding and insert stages, so the load takes about as long as its slowest stage
+        instead of the sum of every call. Concurrency per stage is set with read_concurrency,
+        embed_concurrency and insert_concurrency. Document lists are loaded in the order they
+        are read, not in source order.
+
+        Args:
+            recreate (bool): If True, recreates the collection in the vector db. Defaults to False.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
+            filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying. Defaults to None.
+        """
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return
+
+        await self._aprepare_vector_db(recreate=recreate)
+        use_upsert = upsert and self.vector_db.upsert_available()
+        await self._aload_sources(
+            self.document_sources, upsert=use_upsert, skip_existing=skip_existing and not use_upsert, filters=filters
+        )
+
+    async def _aprepare_vector_db(self, recreate: bool = False) -> None:
+        if self.vector_db is None:
+            return
+        if recreate:
+            logger.info("Dropping collection")
+            await asyncio.to_thread(self.vector_db.drop)
+
+        logger.info("Creating collection")
+        await asyncio.to_thread(self.vector_db.create)
+
+    async def _aload_sources(
+        self,
+        sources: Iterable[Iterator[List[Document]]],
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Run the read -> embed -> insert pipeline over sources.
+
+        Readers, vector dbs and embedders are synchronous, so every call runs in a worker thread.
+        The embed stage filters out existing documents (if skip_existing) and embeds the rest, so
+        the vector db does not embed them again on insert.
+
+        Returns:
+            int: Number of documents written
+        """
+        vector_db = self.vector_db
+        if vector_db is None:
+            return 0
+        embedder = getattr(vector_db, "embedder", None)
+        source_iterator = iter(sources)
+        source_lock = asyncio.Lock()
+        read_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.load_queue_size))
+        insert_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.load_queue_size))
+        read_workers = max(1, self.read_concurrency)
+        embed_workers = max(1, self.embed_concurrency)
+        insert_workers = max(1, self.insert_concurrency)
+        num_documents = 0
+
+        async def read() -> None:
+            while True:
+                # Sources are generators: only one thread may advance them at a time
+                async with source_lock:
+                    source = await asyncio.to_thread(next, source_iterator, None)
+                if source is None:
+                    return
+                documents = iter(source)
+                while True:
+                    document_list = await asyncio.to_thread(next, documents, None)
+                    if document_list is None:
+                        break
+                    if len(document_list) > 0:
+                        await read_queue.put(document_list)
+
+        async def embed() -> None:
+            while True:
+                document_list = await read_queue.get()
+                if document_list is None:
+                    return
+                if skip_existing:
+                    document_list = await asyncio.to_thread(vector_db.exclude_existing, document_list)
+                if len(document_list) == 0:
+                    continue
+                if embedder is not None:
+                    await asyncio.to_thread(Document.embed_batch, document_list, embedder)
+                await insert_queue.put(document_list)
+
+        async def insert() -> None:
+            nonlocal num_documents
+            while True:
+                document_list = await insert_queue.get()
+                if document_list is None:
+                    return
+                if upsert:
+                    await asyncio.to_thread(vector_db.upsert, documents=document_list, filters=filters)
+                else:
+                    await asyncio.to_thread(vector_db.insert, documents=document_list, filters=filters)
+                num_documents += len(document_list)
+                logger.info(f"Added {len(document_list)} documents to knowledge base")
+
+        async def stage(worker: Callable, workers: int, output: Optional[asyncio.Queue], consumers: int) -> None:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            # Tell each worker of the next stage that no more document lists are coming
+            if output is not None:
+                for _ in range(consumers):
+                    await output.put(None)
+
+        logger.info("Loading knowledge base")
+        tasks = [
+            asyncio.ensure_future(stage(read, read_workers, read_queue, embed_workers)),
+            asyncio.ensure_future(stage(embed, embed_workers, insert_queue, insert_workers)),
+            asyncio.ensure_future(stage(insert, insert_workers, None, 0)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed stage would leave the others blocked on its queue
+            for task in tasks:
+                task.cancel()
+            raise
+        logger.info(f"Loaded {num_documents} documents to knowledge base")
+        return num_documents
+
     def load_documents(
         self,
         documents: List[Document],
@@ -129,11 +283,7 @@ class AgentKnowledge(AssistantKnowledge):
             return
 
         # Filter out documents which already exist in the vector db
-        documents_to_load = (
-            [document for document in documents if not self.vector_db.doc_exists(document)]
-            if skip_existing
-            else documents
-        )
+        documents_to_load = self.vector_db.exclude_existing(documents) if skip_existing else documents
 
         # Insert documents
         if len(documents_to_load) > 0:
@@ -142,6 +292,18 @@ class AgentKnowledge(AssistantKnowledge):
         else:
             logger.info("No new documents to load")
 
+    async def aload_documents(
+        self,
+        documents: List[Document],
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Async load_documents: the vector db calls run in a worker thread"""
+        await asyncio.to_thread(
+            self.load_documents, documents=documents, upsert=upsert, skip_existing=skip_existing, filters=filters
+        )
+
     def load_document(
         self,
         document: Document,
@@ -20,3 +20,10 @@ class CombinedKnowledgeBase(AgentKnowledge):
         for kb in self.sources:
             logger.debug(f"Loading documents from {kb.__class__.__name__}")
             yield from kb.document_lists
+
+    @property
+    def document_sources(self) -> Iterator[Iterator[List[Document]]]:
+        """The sources of every knowledge base, so aload reads across knowledge bases at once"""
+
+        for kb in self.sources:
+            yield from kb.document_sources
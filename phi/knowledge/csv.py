@@ -3,7 +3,7 @@ from typing import Union, List, Iterator
 
 from phi.document import Document
 from phi.document.reader.csv_reader import CSVReader
-from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.agent import AgentKnowledge, lazy_document_list
 
 
 class CSVKnowledgeBase(AgentKnowledge):
@@ -26,3 +26,15 @@ class CSVKnowledgeBase(AgentKnowledge):
                 yield self.reader.read(file=_csv)
         elif _csv_path.exists() and _csv_path.is_file() and _csv_path.suffix == ".csv":
             yield self.reader.read(file=_csv_path)
+
+    @property
+    def document_sources(self) -> Iterator[Iterator[List[Document]]]:
+        """One source per CSV, so aload reads several CSVs at once"""
+
+        _csv_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
+
+        if _csv_path.exists() and _csv_path.is_dir():
+            for _csv in _csv_path.glob("**/*.csv"):
+                yield lazy_document_list(self.reader.read, file=_csv)
+        elif _csv_path.exists() and _csv_path.is_file() and _csv_path.suffix == ".csv":
+            yield lazy_document_list(self.reader.read, file=_csv_path)
@@ -9,6 +9,8 @@ from phi.knowledge.agent import AgentKnowledge
 class PDFKnowledgeBase(AgentKnowledge):
     path: Union[str, Path]
     reader: Union[PDFReader, PDFImageReader] = PDFReader()
+    # Documents per yielded list; pages are read lazily so each list is loaded while later pages are parsed
+    batch_size: int = 100
 
     @property
     def document_lists(self) -> Iterator[List[Document]]:
@@ -23,14 +25,27 @@ class PDFKnowledgeBase(AgentKnowledge):
 
         if _pdf_path.exists() and _pdf_path.is_dir():
             for _pdf in _pdf_path.glob("**/*.pdf"):
-                yield self.reader.read(pdf=_pdf)
+                yield from self.reader.iter_read_batches(_pdf, batch_size=self.batch_size)
         elif _pdf_path.exists() and _pdf_path.is_file() and _pdf_path.suffix == ".pdf":
-            yield self.reader.read(pdf=_pdf_path)
+            yield from self.reader.iter_read_batches(_pdf_path, batch_size=self.batch_size)
+
+    @property
+    def document_sources(self) -> Iterator[Iterator[List[Document]]]:
+        """One source per PDF, so aload reads several PDFs at once"""
+
+        _pdf_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
+
+        if _pdf_path.exists() and _pdf_path.is_dir():
+            for _pdf in _pdf_path.glob("**/*.pdf"):
+                yield self.reader.iter_read_batches(_pdf, batch_size=self.batch_size)
+        elif _pdf_path.exists() and _pdf_path.is_file() and _pdf_path.suffix == ".pdf":
+            yield self.reader.iter_read_batches(_pdf_path, batch_size=self.batch_size)
 
 
 class PDFUrlKnowledgeBase(AgentKnowledge):
     urls: List[str] = []
     reader: Union[PDFUrlReader, PDFUrlImageReader] = PDFUrlReader()
+    batch_size: int = 100
 
     @property
     def document_lists(self) -> Iterator[List[Document]]:
@@ -42,4 +57,11 @@ class PDFUrlKnowledgeBase(AgentKnowledge):
         """
 
         for url in self.urls:
-            yield self.reader.read(url=url)
+            yield from self.reader.iter_read_batches(url, batch_size=self.batch_size)
+
+    @property
+    def document_sources(self) -> Iterator[Iterator[List[Document]]]:
+        """One source per PDF url, so aload downloads and reads several PDFs at once"""
+
+        for url in self.urls:
+            yield self.reader.iter_read_batches(url, batch_size=self.batch_size)
@@ -2,6 +2,7 @@ from typing import List, Iterator
 
 from phi.document import Document
 from phi.document.reader.s3.pdf import S3PDFReader
+from phi.knowledge.agent import lazy_document_list
 from phi.knowledge.s3.base import S3KnowledgeBase
 
 
@@ -19,3 +20,10 @@ class S3PDFKnowledgeBase(S3KnowledgeBase):
         for s3_object in self.s3_objects:
             if s3_object.name.endswith(".pdf"):
                 yield self.reader.read(s3_object=s3_object)
+
+    @property
+    def document_sources(self) -> Iterator[Iterator[List[Document]]]:
+        """One source per PDF in the bucket, so aload downloads several objects at once"""
+        for s3_object in self.s3_objects:
+            if s3_object.name.endswith(".pdf"):
+                yield lazy_document_list(self.reader.read, s3_object=s3_object)
@@ -1,10 +1,11 @@
+import asyncio
 from typing import Iterator, List, Optional, Dict, Any
 
 from pydantic import model_validator
 
 from phi.document import Document
 from phi.document.reader.website import WebsiteReader
-from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.agent import AgentKnowledge, lazy_document_list
 from phi.utils.log import logger
 
 
@@ -34,6 +35,16 @@ class WebsiteKnowledgeBase(AgentKnowledge):
             for _url in self.urls:
                 yield self.reader.read(url=_url)
 
+    @property
+    def document_sources(self) -> Iterator[Iterator[List[Document]]]:
+        """One source per url, so aload crawls several websites at once"""
+        return self._url_sources(self.urls)
+
+    def _url_sources(self, urls: List[str]) -> Iterator[Iterator[List[Document]]]:
+        if self.reader is not None:
+            for _url in urls:
+                yield lazy_document_list(self.reader.read, url=_url)
+
     def load(
         self,
         recreate: bool = False,
@@ -75,7 +86,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
             document_list = self.reader.read(url=url)
             # Filter out documents which already exist in the vector db
             if not recreate:
-                document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
+                document_list = self.vector_db.exclude_existing(document_list)
             if upsert and self.vector_db.upsert_available():
                 self.vector_db.upsert(documents=document_list, filters=filters)
             else:
@@ -86,3 +97,46 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         if self.optimize_on is not None and num_documents > self.optimize_on:
             logger.debug("Optimizing Vector DB")
             self.vector_db.optimize()
+
+    async def aload(
+        self,
+        recreate: bool = False,
+        upsert: bool = True,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Load the website contents to the vector db, crawling the urls concurrently (see AgentKnowledge.aload)"""
+
+        if self.vector_db is None:
+            logger.warning("No vector db provided")
+            return
+
+        if self.reader is None:
+            logger.warning("No reader provided")
+            return
+
+        await self._aprepare_vector_db(recreate=recreate)
+
+        # As in load, urls already in the vector db are not crawled again unless recreating
+        urls_to_read = self.urls.copy()
+        if not recreate:
+            exists = await asyncio.gather(
+                *(asyncio.to_thread(self.vector_db.name_exists, name=url) for url in urls_to_read)
+            )
+            urls_to_read = []
+            for url, url_exists in zip(self.urls, exists):
+                if url_exists:
+                    logger.debug(f"Skipping {url} as it exists in the vector db")
+                else:
+                    urls_to_read.append(url)
+
+        num_documents = await self._aload_sources(
+            self._url_sources(urls_to_read),
+            upsert=upsert and self.vector_db.upsert_available(),
+            skip_existing=not recreate,
+            filters=filters,
+        )
+
+        if self.optimize_on is not None and num_documents > self.optimize_on:
+            logger.debug("Optimizing Vector DB")
+            await asyncio.to_thread(self.vector_db.optimize)
@@ -1,4 +1,7 @@
-from typing import List, Iterator, Optional, Dict, Any, Callable, Union
+import asyncio
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import List, Iterator, AsyncIterator, Optional, Dict, Any, Callable, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo
 
@@ -10,6 +13,21 @@ from phi.utils.log import logger
 from phi.utils.timer import Timer
 
 
+def _timed_execute(function_call: FunctionCall) -> Tuple[bool, float]:
+    _function_call_timer = Timer()
+    _function_call_timer.start()
+    function_call_success = function_call.execute()
+    _function_call_timer.stop()
+    return function_call_success, _function_call_timer.elapsed
+
+
+def _copy_outcome(source: FunctionCall, target: FunctionCall) -> None:
+    """Copy what executing source set onto target"""
+    target.result = source.result
+    target.error = source.error
+    target.cache_hit = source.cache_hit
+
+
 class Model(BaseModel):
     # ID of the model to use.
     id: str = Field(..., alias="model")
@@ -39,6 +57,10 @@ class Model(BaseModel):
     show_tool_calls: Optional[bool] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from one model turn that run at the same time. 1 runs them one by one.
+    tool_call_concurrency: int = 8
+    # Seconds to wait for the result of a tool call before reporting it as failed. None waits indefinitely.
+    tool_call_timeout: Optional[float] = None
 
     # -*- Functions available to the Model to call -*-
     # Functions extracted from the tools.
@@ -172,68 +194,182 @@ class Model(BaseModel):
     def run_function_calls(
         self, function_calls: List[FunctionCall], function_call_results: List[Message], tool_role: str = "tool"
     ) -> Iterator[ModelResponse]:
+        function_calls = self._function_calls_within_limit(function_calls)
+
+        # -*- Start function calls
         for function_call in function_calls:
-            if self.function_call_stack is None:
-                self.function_call_stack = []
-
-            # -*- Start function call
-            _function_call_timer = Timer()
-            _function_call_timer.start()
-            yield ModelResponse(
-                content=function_call.get_call_str(),
-                tool_call={
-                    "role": tool_role,
-                    "tool_call_id": function_call.call_id,
-                    "tool_name": function_call.function.name,
-                    "tool_args": function_call.arguments,
-                },
-                event=ModelResponseEvent.tool_call_started.value,
+            yield self._function_call_started(function_call, tool_role)
+
+        # -*- Run function calls, results come back in the order the model made the calls
+        for function_call, function_call_success, elapsed in self._execute_function_calls(function_calls):
+            yield self._function_call_completed(
+                function_call, function_call_success, elapsed, function_call_results, tool_role
             )
 
-            # -*- Run function call
-            function_call_success = function_call.execute()
-            _function_call_timer.stop()
-
-            _function_call_result = Message(
-                role=tool_role,
-                content=function_call.result if function_call_success else function_call.error,
-                tool_call_id=function_call.call_id,
-                tool_name=function_call.function.name,
-                tool_args=function_call.arguments,
-                tool_call_error=not function_call_success,
-                metrics={"time": _function_call_timer.elapsed},
+        self._check_function_call_limit()
+
+    async def arun_function_calls(
+        self, function_calls: List[FunctionCall], function_call_results: List[Message], tool_role: str = "tool"
+    ) -> AsyncIterator[ModelResponse]:
+        """
+        Async version of run_function_calls: the calls of a turn are awaited together with
+        asyncio.gather (async entrypoints on the running loop, sync ones in the default
+        executor), so tool calls never block the event loop.
+        """
+        function_calls = self._function_calls_within_limit(function_calls)
+
+        # -*- Start function calls
+        for function_call in function_calls:
+            yield self._function_call_started(function_call, tool_role)
+
+        # -*- Run function calls, results come back in the order the model made the calls
+        semaphore = asyncio.Semaphore(max(1, self.tool_call_concurrency))
+
+        async def _run(function_call: FunctionCall) -> Tuple[bool, float]:
+            async with semaphore:
+                _function_call_timer = Timer()
+                _function_call_timer.start()
+                # Sync entrypoints keep running in their thread after a timeout, so they run on a copy
+                detached = function_call.model_copy()
+                try:
+                    function_call_success = await asyncio.wait_for(
+                        detached.aexecute(), timeout=self.tool_call_timeout
+                    )
+                    _copy_outcome(detached, function_call)
+                except asyncio.TimeoutError:
+                    function_call.error = f"Function call timed out after {self.tool_call_timeout}s"
+                    logger.warning(f"{function_call.error}: {function_call.get_call_str()}")
+                    function_call_success = False
+                _function_call_timer.stop()
+                return function_call_success, _function_call_timer.elapsed
+
+        outcomes = await asyncio.gather(*(_run(function_call) for function_call in function_calls))
+        for function_call, (function_call_success, elapsed) in zip(function_calls, outcomes):
+            yield self._function_call_completed(
+                function_call, function_call_success, elapsed, function_call_results, tool_role
             )
-            yield ModelResponse(
-                content=f"{function_call.get_call_str()} completed in {_function_call_timer.elapsed:.4f}s.",
-                tool_call=_function_call_result.model_dump(
-                    include={
-                        "content",
-                        "tool_call_id",
-                        "tool_name",
-                        "tool_args",
-                        "tool_call_error",
-                        "metrics",
-                        "created_at",
-                    }
-                ),
-                event=ModelResponseEvent.tool_call_completed.value,
+
+        self._check_function_call_limit()
+
+    def _function_calls_within_limit(self, function_calls: List[FunctionCall]) -> List[FunctionCall]:
+        if self.function_call_stack is None:
+            self.function_call_stack = []
+        # Only run the calls that fit in the function call limit (at least one)
+        if self.tool_call_limit:
+            return function_calls[: max(1, self.tool_call_limit - len(self.function_call_stack))]
+        return function_calls
+
+    def _check_function_call_limit(self) -> None:
+        if self.tool_call_limit and len(self.function_call_stack or []) >= self.tool_call_limit:
+            self.deactivate_function_calls()
+
+    def _function_call_started(self, function_call: FunctionCall, tool_role: str) -> ModelResponse:
+        return ModelResponse(
+            content=function_call.get_call_str(),
+            tool_call={
+                "role": tool_role,
+                "tool_call_id": function_call.call_id,
+                "tool_name": function_call.function.name,
+                "tool_args": function_call.arguments,
+            },
+            event=ModelResponseEvent.tool_call_started.value,
+        )
+
+    def _function_call_completed(
+        self,
+        function_call: FunctionCall,
+        function_call_success: bool,
+        elapsed: float,
+        function_call_results: List[Message],
+        tool_role: str,
+    ) -> ModelResponse:
+        """Record a finished function call and return its completed event."""
+        _metrics: Dict[str, Any] = {"time": elapsed}
+        if function_call.cache_hit is not None:
+            _metrics["cache_hit"] = function_call.cache_hit
+        _function_call_result = Message(
+            role=tool_role,
+            content=function_call.result if function_call_success else function_call.error,
+            tool_call_id=function_call.call_id,
+            tool_name=function_call.function.name,
+            tool_args=function_call.arguments,
+            tool_call_error=not function_call_success,
+            metrics=_metrics,
+        )
+
+        # Add metrics to the model
+        if "tool_call_times" not in self.metrics:
+            self.metrics["tool_call_times"] = {}
+        if function_call.function.name not in self.metrics["tool_call_times"]:
+            self.metrics["tool_call_times"][function_call.function.name] = []
+        self.metrics["tool_call_times"][function_call.function.name].append(elapsed)
+        if function_call.cache_hit:
+            if "tool_cache_hits" not in self.metrics:
+                self.metrics["tool_cache_hits"] = {}
+            self.metrics["tool_cache_hits"][function_call.function.name] = (
+                self.metrics["tool_cache_hits"].get(function_call.function.name, 0) + 1
             )
 
-            # Add metrics to the model
-            if "tool_call_times" not in self.metrics:
-                self.metrics["tool_call_times"] = {}
-            if function_call.function.name not in self.metrics["tool_call_times"]:
-                self.metrics["tool_call_times"][function_call.function.name] = []
-            self.metrics["tool_call_times"][function_call.function.name].append(_function_call_timer.elapsed)
-
-            # Add the function call result to the function call results
-            function_call_results.append(_function_call_result)
-            self.function_call_stack.append(function_call)
-
-            # -*- Check function call limit
-            if self.tool_call_limit and len(self.function_call_stack) >= self.tool_call_limit:
-                self.deactivate_function_calls()
-                break  # Exit early if we reach the function call limit
+        # Add the function call result to the function call results
+        function_call_results.append(_function_call_result)
+        self.function_call_stack.append(function_call)  # type: ignore
+
+        return ModelResponse(
+            content=f"{function_call.get_call_str()} completed in {elapsed:.4f}s.",
+            tool_call=_function_call_result.model_dump(
+                include={
+                    "content",
+                    "tool_call_id",
+                    "tool_name",
+                    "tool_args",
+                    "tool_call_error",
+                    "metrics",
+                    "created_at",
+                }
+            ),
+            event=ModelResponseEvent.tool_call_completed.value,
+        )
+
+    def _execute_function_calls(self, function_calls: List[FunctionCall]) -> Iterator[Tuple[FunctionCall, bool, float]]:
+        """
+        Execute the function calls of one model turn and yield (function_call, success, elapsed)
+        in call order.
+
+        Independent calls (e.g. several searches) run on a thread pool of up to
+        tool_call_concurrency threads, so the turn takes as long as its slowest call instead
+        of the sum. A call that has not returned tool_call_timeout seconds after the calls were
+        submitted is reported as failed; its thread is left to finish in the background on a
+        copy of the function call, so its late result is discarded.
+        """
+        if not function_calls:
+            return
+        if self.tool_call_timeout is None and (len(function_calls) == 1 or self.tool_call_concurrency <= 1):
+            for function_call in function_calls:
+                yield (function_call, *_timed_execute(function_call))
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.tool_call_concurrency, len(function_calls))), thread_name_prefix="phi-tool"
+        )
+        try:
+            detached_calls = [function_call.model_copy() for function_call in function_calls]
+            futures = [executor.submit(_timed_execute, detached) for detached in detached_calls]
+            # The calls run concurrently, so they share one deadline instead of each wait starting its own
+            submitted_at = monotonic()
+            deadline = submitted_at + self.tool_call_timeout if self.tool_call_timeout is not None else None
+            for function_call, detached, future in zip(function_calls, detached_calls, futures):
+                try:
+                    remaining = max(0.0, deadline - monotonic()) if deadline is not None else None
+                    function_call_success, elapsed = future.result(timeout=remaining)
+                    _copy_outcome(detached, function_call)
+                except FuturesTimeoutError:
+                    function_call.error = f"Function call timed out after {self.tool_call_timeout}s"
+                    logger.warning(f"{function_call.error}: {function_call.get_call_str()}")
+                    function_call_success, elapsed = False, monotonic() - submitted_at
+                yield function_call, function_call_success, elapsed
+        finally:
+            # Do not block on calls that timed out
+            executor.shutdown(wait=False)
 
     def get_system_message_for_model(self) -> Optional[str]:
         return self.system_prompt
@@ -1,7 +1,7 @@
 import json
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Iterator, Dict, Any, Mapping, Union, Tuple
+from typing import Optional, List, Iterator, AsyncIterator, Dict, Any, Mapping, Union, Tuple
 
 from phi.model.base import Model
 from phi.model.message import Message
@@ -290,6 +290,49 @@ class Ollama(Model):
             return model_response
         return None
 
+    async def _ahandle_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+        model_response: ModelResponse,
+    ) -> Optional[ModelResponse]:
+        """
+        Async version of _handle_tool_calls: tool calls run with arun_function_calls and do not block the event loop.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            model_response (ModelResponse): The model response.
+
+        Returns:
+            Optional[ModelResponse]: The model response.
+        """
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            model_response.content = assistant_message.get_content_string()
+            model_response.content += "\n\n"
+            function_calls_to_run = self._get_function_calls_to_run(assistant_message, messages)
+            function_call_results: List[Message] = []
+
+            if self.show_tool_calls:
+                if len(function_calls_to_run) == 1:
+                    model_response.content += f" - Running: {function_calls_to_run[0].get_call_str()}\n\n"
+                elif len(function_calls_to_run) > 1:
+                    model_response.content += "Running:"
+                    for _f in function_calls_to_run:
+                        model_response.content += f"\n - {_f.get_call_str()}"
+                    model_response.content += "\n\n"
+
+            async for _ in self.arun_function_calls(
+                function_calls=function_calls_to_run,
+                function_call_results=function_call_results,
+            ):
+                pass
+
+            self._format_function_call_results(function_call_results, messages)
+
+            return model_response
+        return None
+
     def _update_usage_metrics(
         self,
         assistant_message: Message,
@@ -480,7 +523,7 @@ class Ollama(Model):
         metrics.log()
 
         # -*- Handle tool calls
-        if self._handle_tool_calls(assistant_message, messages, model_response):
+        if await self._ahandle_tool_calls(assistant_message, messages, model_response):
             response_after_tool_calls = await self.aresponse(messages=messages)
             if response_after_tool_calls.content is not None:
                 if model_response.content is None:
@@ -531,6 +574,42 @@ class Ollama(Model):
 
             self._format_function_call_results(function_call_results, messages)
 
+    async def _ahandle_stream_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+    ) -> AsyncIterator[ModelResponse]:
+        """
+        Async version of _handle_stream_tool_calls: tool calls run with arun_function_calls.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+
+        Returns:
+            AsyncIterator[ModelResponse]: An async iterator of the model response.
+        """
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            yield ModelResponse(content="\n\n")
+            function_calls_to_run = self._get_function_calls_to_run(assistant_message, messages)
+            function_call_results: List[Message] = []
+
+            if self.show_tool_calls:
+                if len(function_calls_to_run) == 1:
+                    yield ModelResponse(content=f" - Running: {function_calls_to_run[0].get_call_str()}\n\n")
+                elif len(function_calls_to_run) > 1:
+                    yield ModelResponse(content="Running:")
+                    for _f in function_calls_to_run:
+                        yield ModelResponse(content=f"\n - {_f.get_call_str()}")
+                    yield ModelResponse(content="\n\n")
+
+            async for intermediate_model_response in self.arun_function_calls(
+                function_calls=function_calls_to_run, function_call_results=function_call_results
+            ):
+                yield intermediate_model_response
+
+            self._format_function_call_results(function_call_results, messages)
+
     def _handle_tool_call_chunk(self, content, tool_call_buffer, message_data) -> Tuple[str, bool]:
         """
         Handle a tool call chunk for response stream.
@@ -716,7 +795,7 @@ class Ollama(Model):
 
         # -*- Handle tool calls
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
-            for model_response in self._handle_stream_tool_calls(assistant_message, messages):
+            async for model_response in self._ahandle_stream_tool_calls(assistant_message, messages):
                 yield model_response
             async for model_response in self.aresponse_stream(messages=messages):
                 yield model_response
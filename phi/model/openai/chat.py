@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional, List, Iterator, Dict, Any, Union
+from typing import Optional, List, Iterator, AsyncIterator, Dict, Any, Union
 
 import httpx
 from pydantic import BaseModel
@@ -410,30 +410,8 @@ class OpenAIChat(Model):
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
             model_response.content = ""
             tool_role: str = "tool"
-            function_calls_to_run: List[FunctionCall] = []
             function_call_results: List[Message] = []
-            for tool_call in assistant_message.tool_calls:
-                _tool_call_id = tool_call.get("id")
-                _function_call = get_function_call_for_tool_call(tool_call, self.functions)
-                if _function_call is None:
-                    messages.append(
-                        Message(
-                            role="tool",
-                            tool_call_id=_tool_call_id,
-                            content="Could not find function to call.",
-                        )
-                    )
-                    continue
-                if _function_call.error is not None:
-                    messages.append(
-                        Message(
-                            role="tool",
-                            tool_call_id=_tool_call_id,
-                            content=_function_call.error,
-                        )
-                    )
-                    continue
-                function_calls_to_run.append(_function_call)
+            function_calls_to_run = self._get_function_calls_to_run(assistant_message, messages, tool_role)
 
             if self.show_tool_calls:
                 model_response.content += "\nRunning:"
@@ -452,6 +430,83 @@ class OpenAIChat(Model):
             return model_response
         return None
 
+    async def _ahandle_tool_calls(
+        self, assistant_message: Message, messages: List[Message], model_response: ModelResponse
+    ) -> Optional[ModelResponse]:
+        """
+        Async version of _handle_tool_calls: tool calls run with arun_function_calls and do not block the event loop.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            model_response (ModelResponse): The model response.
+
+        Returns:
+            Optional[ModelResponse]: The model response after handling tool calls.
+        """
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            model_response.content = ""
+            tool_role: str = "tool"
+            function_call_results: List[Message] = []
+            function_calls_to_run = self._get_function_calls_to_run(assistant_message, messages, tool_role)
+
+            if self.show_tool_calls:
+                model_response.content += "\nRunning:"
+                for _f in function_calls_to_run:
+                    model_response.content += f"\n - {_f.get_call_str()}"
+                model_response.content += "\n\n"
+
+            async for _ in self.arun_function_calls(
+                function_calls=function_calls_to_run, function_call_results=function_call_results, tool_role=tool_role
+            ):
+                pass
+
+            if len(function_call_results) > 0:
+                messages.extend(function_call_results)
+
+            return model_response
+        return None
+
+    def _get_function_calls_to_run(
+        self, assistant_message: Message, messages: List[Message], tool_role: str = "tool"
+    ) -> List[FunctionCall]:
+        """
+        Get the function calls of the assistant message. Tool calls that cannot be run get
+        their error added to the messages instead.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            tool_role (str): The role of the tool messages.
+
+        Returns:
+            List[FunctionCall]: The function calls to run.
+        """
+        function_calls_to_run: List[FunctionCall] = []
+        for tool_call in assistant_message.tool_calls or []:
+            _tool_call_id = tool_call.get("id")
+            _function_call = get_function_call_for_tool_call(tool_call, self.functions)
+            if _function_call is None:
+                messages.append(
+                    Message(
+                        role=tool_role,
+                        tool_call_id=_tool_call_id,
+                        content="Could not find function to call.",
+                    )
+                )
+                continue
+            if _function_call.error is not None:
+                messages.append(
+                    Message(
+                        role=tool_role,
+                        tool_call_id=_tool_call_id,
+                        content=_function_call.error,
+                    )
+                )
+                continue
+            function_calls_to_run.append(_function_call)
+        return function_calls_to_run
+
     def _update_usage_metrics(
         self, assistant_message: Message, metrics: Metrics, response_usage: Optional[CompletionUsage]
     ) -> None:
@@ -653,7 +708,7 @@ class OpenAIChat(Model):
         metrics.log()
 
         # -*- Handle tool calls
-        if self._handle_tool_calls(assistant_message, messages, model_response):
+        if await self._ahandle_tool_calls(assistant_message, messages, model_response):
             response_after_tool_calls = await self.aresponse(messages=messages)
             if response_after_tool_calls.content is not None:
                 if model_response.content is None:
@@ -744,30 +799,8 @@ class OpenAIChat(Model):
         """
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
             tool_role: str = "tool"
-            function_calls_to_run: List[FunctionCall] = []
             function_call_results: List[Message] = []
-            for tool_call in assistant_message.tool_calls:
-                _tool_call_id = tool_call.get("id")
-                _function_call = get_function_call_for_tool_call(tool_call, self.functions)
-                if _function_call is None:
-                    messages.append(
-                        Message(
-                            role=tool_role,
-                            tool_call_id=_tool_call_id,
-                            content="Could not find function to call.",
-                        )
-                    )
-                    continue
-                if _function_call.error is not None:
-                    messages.append(
-                        Message(
-                            role=tool_role,
-                            tool_call_id=_tool_call_id,
-                            content=_function_call.error,
-                        )
-                    )
-                    continue
-                function_calls_to_run.append(_function_call)
+            function_calls_to_run = self._get_function_calls_to_run(assistant_message, messages, tool_role)
 
             if self.show_tool_calls:
                 yield ModelResponse(content="\nRunning:")
@@ -783,6 +816,40 @@ class OpenAIChat(Model):
             if len(function_call_results) > 0:
                 messages.extend(function_call_results)
 
+    async def _ahandle_stream_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+    ) -> AsyncIterator[ModelResponse]:
+        """
+        Async version of _handle_stream_tool_calls: tool calls run with arun_function_calls.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+
+        Returns:
+            AsyncIterator[ModelResponse]: An async iterator of the model response.
+        """
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            tool_role: str = "tool"
+            function_call_results: List[Message] = []
+            function_calls_to_run = self._get_function_calls_to_run(assistant_message, messages, tool_role)
+
+            if self.show_tool_calls:
+                yield ModelResponse(content="\nRunning:")
+                for _f in function_calls_to_run:
+                    yield ModelResponse(content=f"\n - {_f.get_call_str()}")
+                yield ModelResponse(content="\n\n")
+
+            async for intermediate_model_response in self.arun_function_calls(
+                function_calls=function_calls_to_run, function_call_results=function_call_results, tool_role=tool_role
+            ):
+                yield intermediate_model_response
+
+            if len(function_call_results) > 0:
+                messages.extend(function_call_results)
+
     def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
         """
         Generate a streaming response from OpenAI.
@@ -910,7 +977,7 @@ class OpenAIChat(Model):
 
         # -*- Handle tool calls
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
-            for model_response in self._handle_stream_tool_calls(assistant_message, messages):
+            async for model_response in self._ahandle_stream_tool_calls(assistant_message, messages):
                 yield model_response
             async for model_response in self.aresponse_stream(messages=messages):
                 yield model_response
@@ -1,5 +1,6 @@
 from phi.tools.tool import Tool
 from phi.tools.function import Function
+from phi.tools.cache import cached_tool
 from phi.tools.toolkit import Toolkit
 from phi.tools.tool_registry import ToolRegistry
 from phi.tools.jina_tools import JinaReaderTools
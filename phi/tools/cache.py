@@ -0,0 +1,262 @@
+import functools
+from abc import ABC, abstractmethod
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from hashlib import sha256
+from time import time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from phi.utils.log import logger
+
+# Result of the last cached tool lookup in the current context: True (hit), False (miss) or
+# None (the tool is not cached). FunctionCall reads it to add cache hits to tool-call metrics.
+tool_cache_status: ContextVar[Optional[bool]] = ContextVar("tool_cache_status", default=None)
+
+_ERROR_PREFIXES = ("Error", "Could not")
+
+
+def is_cacheable_result(result: Any) -> bool:
+    """Tools report failures as "Error ..." / "Could not ..." strings; those are not cached"""
+    if result is None:
+        return False
+    return not (isinstance(result, str) and result.startswith(_ERROR_PREFIXES))
+
+
+def tool_cache_key(namespace: str, arguments: Dict[str, Any]) -> str:
+    payload = json.dumps(arguments, sort_keys=True, default=str)
+    return sha256(f"{namespace}\x00{payload}".encode("utf-8")).hexdigest()
+
+
+class ToolResultStore(ABC):
+    """Shared tier for the tool result cache, so processes reuse each other's results."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (result, expires_at) or None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, tool: str, result: Any, expires_at: float) -> None:
+        raise NotImplementedError
+
+
+class MongoToolResultStore(ToolResultStore):
+    def __init__(self, collection: Any):
+        """
+        Args:
+            collection: A pymongo Collection used to store the results. Expired results are
+                removed by a TTL index on expires_at.
+        """
+        self.collection = collection
+        try:
+            self.collection.create_index("expires_at", expireAfterSeconds=0)
+        except Exception as e:
+            logger.warning(f"Could not create tool cache TTL index: {e}")
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        document = self.collection.find_one({"_id": key}, {"result": 1, "expires_at": 1})
+        if document is None:
+            return None
+        expires_at = document["expires_at"]
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return document["result"], expires_at.timestamp()
+
+    def set(self, key: str, tool: str, result: Any, expires_at: float) -> None:
+        self.collection.update_one(
+            {"_id": key},
+            {
+                "$set": {
+                    "tool": tool,
+                    "result": result,
+                    "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc),
+                }
+            },
+            upsert=True,
+        )
+
+
+class ToolResultCache:
+    """
+    Cache for pure lookup tools: (tool, arguments) -> result, each entry expiring after the
+    tool's TTL.
+
+    Lookups go to a size-bounded in-memory LRU first, then to the optional shared store.
+    TTLs are declared per tool with @cached_tool and can be overridden by tool name with
+    set_ttl (a TTL of 0 disables caching for that tool).
+    """
+
+    def __init__(self, maxsize: int = 2048, store: Optional[ToolResultStore] = None):
+        self.maxsize = maxsize
+        self.store = store
+        self.ttl_overrides: Dict[str, float] = {}
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._tool_stats: Dict[str, Dict[str, int]] = {}
+
+    def set_ttl(self, tool: str, ttl: float) -> None:
+        self.ttl_overrides[tool] = ttl
+
+    def ttl_for(self, tool: str, default: float) -> float:
+        return self.ttl_overrides.get(tool, default)
+
+    def _count(self, tool: str, field: str) -> None:
+        with self._lock:
+            counts = self._tool_stats.setdefault(tool, {"hits": 0, "store_hits": 0, "misses": 0})
+            counts[field] += 1
+
+    def _memory_get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return entry
+
+    def _memory_set(self, key: str, result: Any, expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (result, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    def get(self, tool: str, key: str) -> Tuple[bool, Any]:
+        """Return (found, result)"""
+        entry = self._memory_get(key)
+        if entry is not None:
+            self._count(tool, "hits")
+            return True, entry[0]
+        if self.store is not None:
+            try:
+                entry = self.store.get(key)
+            except Exception as e:
+                logger.warning(f"Tool cache store lookup failed: {e}")
+                entry = None
+            if entry is not None and entry[1] > time():
+                self._memory_set(key, *entry)
+                self._count(tool, "store_hits")
+                return True, entry[0]
+        self._count(tool, "misses")
+        return False, None
+
+    def set(self, tool: str, key: str, result: Any, ttl: float) -> None:
+        expires_at = time() + ttl
+        self._memory_set(key, result, expires_at)
+        if self.store is not None:
+            try:
+                self.store.set(key, tool, result, expires_at)
+            except Exception as e:
+                logger.warning(f"Tool cache store write failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            tools = {tool: dict(counts) for tool, counts in self._tool_stats.items()}
+            size = len(self._memory)
+        hits = sum(counts["hits"] + counts["store_hits"] for counts in tools.values())
+        lookups = hits + sum(counts["misses"] for counts in tools.values())
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "hits": hits,
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "tools": tools,
+        }
+
+
+# Process-wide cache shared by phi and strands toolkits
+default_tool_cache = ToolResultCache()
+
+
+def cached_tool(
+    ttl: float,
+    name: Optional[str] = None,
+    key_attrs: Sequence[str] = (),
+    cache_if: Callable[[Any], bool] = is_cacheable_result,
+    cache: Optional[ToolResultCache] = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Cache the results of a pure lookup tool for ttl seconds, keyed by a hash of its arguments.
+
+    Works on functions and toolkit methods, sync or async. For methods, self is not part of
+    the key; list the instance attributes that change the result (e.g. languages) in
+    key_attrs. The signature and docstring are kept, so the tool schema is unchanged.
+
+    Args:
+        ttl: Seconds a result stays valid; overridable per tool name with cache.set_ttl.
+        name: Tool name for TTL overrides and metrics, defaults to the function name.
+        key_attrs: Instance attributes added to the key of a method.
+        cache_if: Results it rejects (by default errors and None) are not cached.
+        cache: Cache to use, defaults to default_tool_cache.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        tool_name = name or func.__name__
+        namespace = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+        is_method = next(iter(signature.parameters), None) == "self"
+
+        def _key(args: Tuple, kwargs: Dict[str, Any]) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            if is_method:
+                instance = arguments.pop("self")
+                for attr in key_attrs:
+                    arguments[f"self.{attr}"] = getattr(instance, attr, None)
+            return tool_cache_key(namespace, arguments)
+
+        def _lookup(args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Optional[str], bool, Any, float]:
+            _cache = cache or default_tool_cache
+            _ttl = _cache.ttl_for(tool_name, ttl)
+            if _ttl <= 0:
+                return None, False, None, _ttl
+            try:
+                key = _key(args, kwargs)
+            except Exception as e:
+                logger.warning(f"Could not build cache key for {tool_name}: {e}")
+                return None, False, None, _ttl
+            found, result = _cache.get(tool_name, key)
+            tool_cache_status.set(found)
+            return key, found, result, _ttl
+
+        def _store(key: Optional[str], result: Any, _ttl: float) -> None:
+            if key is not None and cache_if(result):
+                (cache or default_tool_cache).set(tool_name, key, result, _ttl)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key, found, result, _ttl = _lookup(args, kwargs)
+                if found:
+                    return result
+                result = await func(*args, **kwargs)
+                _store(key, result, _ttl)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key, found, result, _ttl = _lookup(args, kwargs)
+            if found:
+                return result
+            result = func(*args, **kwargs)
+            _store(key, result, _ttl)
+            return result
+
+        return wrapper
+
+    return decorator
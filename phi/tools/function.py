@@ -1,7 +1,11 @@
+import asyncio
+import inspect
 from typing import Any, Dict, Optional, Callable, get_type_hints
 from pydantic import BaseModel, validate_call
 
+from phi.tools.cache import tool_cache_status
 from phi.utils.log import logger
+from phi.utils.run_async import run_awaitable
 
 
 class Function(BaseModel):
@@ -19,6 +23,8 @@ class Function(BaseModel):
 
     # If True, the arguments are sanitized before being passed to the function.
     sanitize_arguments: bool = True
+    # True if the entrypoint is a coroutine function. FunctionCall.aexecute awaits it on the running loop.
+    is_async: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(exclude_none=True, include={"name", "description", "parameters"})
@@ -45,8 +51,13 @@ class Function(BaseModel):
             description=getdoc(c),
             parameters=parameters,
             entrypoint=validate_call(c),
+            is_async=inspect.iscoroutinefunction(c),
         )
 
+    @property
+    def entrypoint_is_async(self) -> bool:
+        return self.is_async or inspect.iscoroutinefunction(self.entrypoint)
+
     def get_type_name(self, t):
         name = str(t)
         if "list" in name or "dict" in name:
@@ -110,6 +121,8 @@ class FunctionCall(BaseModel):
 
     # Error while parsing arguments or running the function.
     error: Optional[str] = None
+    # True if the result came from the tool result cache, False on a cache miss, None for uncached tools.
+    cache_hit: Optional[bool] = None
 
     def get_call_str(self) -> str:
         """Returns a string representation of the function call."""
@@ -125,8 +138,15 @@ class FunctionCall(BaseModel):
         call_str = f"{self.function.name}({', '.join([f'{k}={v}' for k, v in trimmed_arguments.items()])})"
         return call_str
 
+    def _call_entrypoint(self) -> Any:
+        tool_cache_status.set(None)
+        # Call the function with no arguments if none are provided.
+        if self.arguments is None:
+            return self.function.entrypoint()  # type: ignore
+        return self.function.entrypoint(**self.arguments)  # type: ignore
+
     def execute(self) -> bool:
-        """Runs the function call.
+        """Runs the function call. Coroutine entrypoints are run to completion on their own event loop.
 
         @return: True if the function call was successful, False otherwise.
         """
@@ -135,19 +155,41 @@ class FunctionCall(BaseModel):
 
         logger.debug(f"Running: {self.get_call_str()}")
 
-        # Call the function with no arguments if none are provided.
-        if self.arguments is None:
-            try:
-                self.result = self.function.entrypoint()
-                return True
-            except Exception as e:
-                logger.warning(f"Could not run function {self.get_call_str()}")
-                logger.exception(e)
-                self.error = str(e)
-                return False
+        try:
+            result = self._call_entrypoint()
+            if inspect.isawaitable(result):
+                result = run_awaitable(result)
+            self.result = result
+            self.cache_hit = tool_cache_status.get()
+            return True
+        except Exception as e:
+            logger.warning(f"Could not run function {self.get_call_str()}")
+            logger.exception(e)
+            self.error = str(e)
+            return False
+
+    async def aexecute(self) -> bool:
+        """Runs the function call without blocking the event loop.
+
+        Coroutine entrypoints are awaited on the running loop; sync entrypoints run in the
+        default executor.
+
+        @return: True if the function call was successful, False otherwise.
+        """
+        if self.function.entrypoint is None:
+            return False
+
+        if not self.function.entrypoint_is_async:
+            return await asyncio.get_running_loop().run_in_executor(None, self.execute)
+
+        logger.debug(f"Running: {self.get_call_str()}")
 
         try:
-            self.result = self.function.entrypoint(**self.arguments)
+            result = self._call_entrypoint()
+            if inspect.isawaitable(result):
+                result = await result
+            self.result = result
+            self.cache_hit = tool_cache_status.get()
             return True
         except Exception as e:
             logger.warning(f"Could not run function {self.get_call_str()}")
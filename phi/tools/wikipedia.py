@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from phi.document import Document
 from phi.knowledge.wikipedia import WikipediaKnowledgeBase
-from phi.tools import Toolkit
+from phi.tools import Toolkit, cached_tool
 from phi.utils.log import logger
 
 
@@ -37,6 +37,7 @@ class WikipediaTools(Toolkit):
         relevant_docs: List[Document] = self.knowledge_base.search(query=topic)
         return json.dumps([doc.to_dict() for doc in relevant_docs])
 
+    @cached_tool(ttl=24 * 60 * 60)
     def search_wikipedia(self, query: str) -> str:
         """Searches Wikipedia for a query.
 
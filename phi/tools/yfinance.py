@@ -1,6 +1,6 @@
 import json
 
-from phi.tools import Toolkit
+from phi.tools import Toolkit, cached_tool
 
 try:
     import yfinance as yf
@@ -60,6 +60,7 @@ class YFinanceTools(Toolkit):
         except Exception as e:
             return f"Error fetching current price for {symbol}: {e}"
 
+    @cached_tool(ttl=60 * 60)
     def get_company_info(self, symbol: str) -> str:
         """Use this function to get company information and overview for a given stock symbol.
 
@@ -129,6 +130,7 @@ class YFinanceTools(Toolkit):
         except Exception as e:
             return f"Error fetching historical prices for {symbol}: {e}"
 
+    @cached_tool(ttl=60 * 60)
     def get_stock_fundamentals(self, symbol: str) -> str:
         """Use this function to get fundamental data for a given stock symbol yfinance API.
 
@@ -172,6 +174,7 @@ class YFinanceTools(Toolkit):
         except Exception as e:
             return f"Error getting fundamentals for {symbol}: {e}"
 
+    @cached_tool(ttl=24 * 60 * 60)
     def get_income_statements(self, symbol: str) -> str:
         """Use this function to get income statements for a given stock symbol.
 
@@ -188,6 +191,7 @@ class YFinanceTools(Toolkit):
         except Exception as e:
             return f"Error fetching income statements for {symbol}: {e}"
 
+    @cached_tool(ttl=24 * 60 * 60)
     def get_key_financial_ratios(self, symbol: str) -> str:
         """Use this function to get key financial ratios for a given stock symbol.
 
@@ -204,6 +208,7 @@ class YFinanceTools(Toolkit):
         except Exception as e:
             return f"Error fetching key financial ratios for {symbol}: {e}"
 
+    @cached_tool(ttl=60 * 60)
     def get_analyst_recommendations(self, symbol: str) -> str:
         """Use this function to get analyst recommendations for a given stock symbol.
 
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Dict
+
+
+def run_awaitable(awaitable: Awaitable) -> Any:
+    """
+    Run an awaitable from sync code. asyncio.run cannot be used on a thread whose loop is
+    already running (sync code called from async code), so it then runs on a new thread.
+    """
+
+    async def _await() -> Any:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await())
+
+    outcome: Dict[str, Any] = {}
+
+    def _run() -> None:
+        try:
+            outcome["result"] = asyncio.run(_await())
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=_run, name="phi-run-async")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from hashlib import md5
+from typing import List, Optional, Dict, Any, Set
 
 from phi.document import Document
 
 
+def content_hash(document: Document) -> str:
+    """md5 of the document content, which the vector dbs store as the document id / content_hash"""
+    cleaned_content = document.content.replace("\x00", "\ufffd")
+    return md5(cleaned_content.encode()).hexdigest()
+
+
 class VectorDb(ABC):
     """Base class for Vector Databases"""
 
@@ -15,6 +22,25 @@ class VectorDb(ABC):
     def doc_exists(self, document: Document) -> bool:
         raise NotImplementedError
 
+    def doc_key(self, document: Document) -> str:
+        """Key docs_exist returns for a document"""
+        return content_hash(document)
+
+    def docs_exist(self, documents: List[Document]) -> Set[str]:
+        """
+        Keys (see doc_key) of the documents that are already stored.
+
+        This default checks one document at a time; vector dbs override it with batched lookups.
+        """
+        return {self.doc_key(document) for document in documents if self.doc_exists(document)}
+
+    def exclude_existing(self, documents: List[Document]) -> List[Document]:
+        """Documents that are not stored yet, checked with one docs_exist call"""
+        if not documents:
+            return []
+        existing = self.docs_exist(documents)
+        return [document for document in documents if self.doc_key(document) not in existing]
+
     @abstractmethod
     def name_exists(self, name: str) -> bool:
         raise NotImplementedError
@@ -0,0 +1,69 @@
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# Name of the sparse vector stored next to the dense vector in hybrid collections
+SPARSE_VECTOR_NAME = "bm25"
+
+_TOKEN_PATTERN = re.compile(r"[\w\-\.]+", re.UNICODE)
+
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have if in into is it its of on or that the their then there these "
+    "they this to was were will with".split()
+)
+
+
+class Bm25Encoder:
+    """
+    Turns text into BM25-weighted sparse vectors for Qdrant.
+
+    Documents carry the BM25 term-frequency part (with length normalization against
+    avg_len); the IDF part is applied by Qdrant at query time when the sparse vector is
+    configured with `modifier=IDF`. Terms are hashed to 32-bit indices, so no vocabulary
+    has to be stored or shared between processes.
+
+    Tokens keep dots and dashes so exact identifiers (SKUs, error codes, versions)
+    survive tokenization intact.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_len: float = 256.0):
+        self.k1 = k1
+        self.b = b
+        self.avg_len = avg_len
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        tokens = []
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            token = token.strip(".-")
+            if token and token not in _STOPWORDS:
+                tokens.append(token)
+        return tokens
+
+    @staticmethod
+    def token_index(token: str) -> int:
+        return zlib.crc32(token.encode("utf-8"))
+
+    def _merge(self, weights: Dict[str, float]) -> Tuple[List[int], List[float]]:
+        # Fold hash collisions into one index
+        merged: Dict[int, float] = {}
+        for token, weight in weights.items():
+            index = self.token_index(token)
+            merged[index] = merged.get(index, 0.0) + weight
+        return list(merged.keys()), list(merged.values())
+
+    def encode_document(self, text: str) -> Tuple[List[int], List[float]]:
+        tokens = self.tokenize(text)
+        length_norm = 1 - self.b + self.b * len(tokens) / self.avg_len
+        weights = {
+            token: frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+            for token, frequency in Counter(tokens).items()
+        }
+        return self._merge(weights)
+
+    def encode_query(self, text: str) -> Tuple[List[int], List[float]]:
+        return self._merge({token: 1.0 for token in self.tokenize(text)})
+
+
+bm25_encoder = Bm25Encoder()
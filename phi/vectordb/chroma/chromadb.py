@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -96,6 +96,23 @@ class ChromaDb(VectorDb):
                 logger.error(f"Document does not exist: {e}")
         return False
 
+    def docs_exist(self, documents: List[Document], batch_size: int = 1000) -> Set[str]:
+        """Get the ids of the documents that are already in the collection.
+        Args:
+            documents (List[Document]): Documents to check.
+            batch_size (int): Ids looked up per request.
+        Returns:
+            Set[str]: Ids (md5 of the content) that exist.
+        """
+        if self._collection is None:
+            return set()
+        doc_ids = list(dict.fromkeys(self.doc_key(document) for document in documents))
+        existing: Set[str] = set()
+        for i in range(0, len(doc_ids), batch_size):
+            result: GetResult = self._collection.get(ids=doc_ids[i : i + batch_size], include=[])
+            existing.update(result["ids"])
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
         Args:
@@ -124,8 +141,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -151,8 +168,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 import json
 
 try:
@@ -126,6 +126,28 @@ class LanceDb(VectorDb):
             return len(result) > 0
         return False
 
+    def docs_exist(self, documents: List[Document], batch_size: int = 500) -> Set[str]:
+        """
+        Ids of the documents that are already stored, one query per batch
+
+        Args:
+            documents (List[Document]): Documents to check
+            batch_size (int): Ids per query
+        """
+        if not self.table:
+            return set()
+        doc_ids = list(dict.fromkeys(self.doc_key(document) for document in documents))
+        existing: Set[str] = set()
+        for i in range(0, len(doc_ids), batch_size):
+            batch = doc_ids[i : i + batch_size]
+            # Ids are md5 hex digests, safe to inline
+            id_list = ", ".join(f"'{doc_id}'" for doc_id in batch)
+            result = (
+                self.table.search().where(f"{self._id} IN ({id_list})").select([self._id]).limit(len(batch)).to_arrow()
+            )
+            existing.update(result[self._id].to_pylist())
+        return existing
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -136,8 +158,8 @@ class LanceDb(VectorDb):
         """
         logger.debug(f"Inserting {len(documents)} documents")
         data = []
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -1,6 +1,6 @@
 from math import sqrt
 from hashlib import md5
-from typing import Optional, List, Union, Dict, Any, cast
+from typing import Optional, List, Set, Union, Dict, Any, cast
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -232,6 +232,30 @@ class PgVector(VectorDb):
         content_hash = md5(cleaned_content.encode()).hexdigest()
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    def docs_exist(self, documents: List[Document], batch_size: int = 1000) -> Set[str]:
+        """
+        Content hashes of the documents that are already in the table, one query per batch.
+
+        Args:
+            documents (List[Document]): The documents to check.
+            batch_size (int): Content hashes per query.
+
+        Returns:
+            Set[str]: The content hashes that exist.
+        """
+        content_hashes = list(dict.fromkeys(self.doc_key(document) for document in documents))
+        existing: Set[str] = set()
+        try:
+            with self.Session() as sess, sess.begin():
+                for i in range(0, len(content_hashes), batch_size):
+                    stmt = select(self.table.c.content_hash).where(
+                        self.table.c.content_hash.in_(content_hashes[i : i + batch_size])
+                    )
+                    existing.update(row[0] for row in sess.execute(stmt))
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -288,10 +312,10 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     try:
                         # Prepare documents for insertion
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -351,10 +375,10 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     try:
                         # Prepare documents for upserting
+                        Document.embed_batch(batch_docs, embedder=self.embedder)
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -1,4 +1,4 @@
-from typing import Optional, List, Union, Dict, Any
+from typing import Optional, List, Set, Union, Dict, Any
 from hashlib import md5
 
 try:
@@ -124,6 +124,25 @@ class PgVector2(VectorDb):
                 result = sess.execute(stmt).first()
                 return result is not None
 
+    def docs_exist(self, documents: List[Document], batch_size: int = 1000) -> Set[str]:
+        """
+        Content hashes of the documents that are already stored, one query per batch
+
+        Args:
+            documents (List[Document]): Documents to check
+            batch_size (int): Content hashes per query
+        """
+        content_hashes = list(dict.fromkeys(self.doc_key(document) for document in documents))
+        existing: Set[str] = set()
+        with self.Session() as sess:
+            with sess.begin():
+                for i in range(0, len(content_hashes), batch_size):
+                    stmt = select(self.table.c.content_hash).where(
+                        self.table.c.content_hash.in_(content_hashes[i : i + batch_size])
+                    )
+                    existing.update(row[0] for row in sess.execute(stmt))
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -153,8 +172,8 @@ class PgVector2(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: int = 10) -> None:
         with self.Session() as sess:
             counter = 0
+            Document.embed_batch(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -196,8 +215,8 @@ class PgVector2(VectorDb):
         """
         with self.Session() as sess:
             counter = 0
+            Document.embed_batch(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
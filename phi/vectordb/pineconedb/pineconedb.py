@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Set
 
 try:
     from pinecone import Pinecone, ServerlessSpec, PodSpec
@@ -179,6 +179,28 @@ class PineconeDB(VectorDb):
         response = self.index.fetch(ids=[document.id])
         return len(response.vectors) > 0
 
+    def doc_key(self, document: Document) -> str:
+        # Vectors are stored under the document id
+        return document.id
+
+    def docs_exist(self, documents: List[Document], batch_size: int = 1000) -> Set[str]:
+        """Get the ids of the documents that exist in the index.
+
+        Args:
+            documents (List[Document]): The documents to check.
+            batch_size (int): Ids fetched per request. Defaults to 1000.
+
+        Returns:
+            Set[str]: The ids that exist.
+
+        """
+        doc_ids = list(dict.fromkeys(document.id for document in documents if document.id))
+        existing: Set[str] = set()
+        for i in range(0, len(doc_ids), batch_size):
+            response = self.index.fetch(ids=doc_ids[i : i + batch_size])
+            existing.update(response.vectors.keys())
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """Check if an index with the given name exists.
 
@@ -215,8 +237,8 @@ class PineconeDB(VectorDb):
         """
 
         vectors = []
+        Document.embed_batch(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -1,5 +1,6 @@
+import uuid
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 try:
     from qdrant_client import QdrantClient  # noqa: F401
@@ -12,8 +13,11 @@ except ImportError:
 from phi.document import Document
 from phi.embedder import Embedder
 from phi.embedder.openai import OpenAIEmbedder
+from phi.embedder.cache import default_embedding_cache
 from phi.vectordb.base import VectorDb
+from phi.vectordb.bm25 import SPARSE_VECTOR_NAME, Bm25Encoder, bm25_encoder
 from phi.vectordb.distance import Distance
+from phi.vectordb.quantization import quantization_config, quantization_search_params
 from phi.utils.log import logger
 import os
 from os.path import dirname
@@ -49,6 +53,13 @@ class Qdrant(VectorDb):
         timeout: Optional[float] = None,
         host: Optional[str] = None,
         path: Optional[str] = None,
+        use_sparse: bool = True,
+        sparse_encoder: Bm25Encoder = bm25_encoder,
+        quantization: Optional[str] = None,
+        quantization_always_ram: bool = True,
+        on_disk: bool = False,
+        rescore: bool = True,
+        oversampling: Optional[float] = None,
         **kwargs,
     ):
         # Collection attributes
@@ -77,6 +88,19 @@ class Qdrant(VectorDb):
         self.host: Optional[str] = host
         self.path: Optional[str] = path
 
+        # BM25 sparse vectors stored next to the dense ones, used by keyword_search and hybrid_search
+        self.use_sparse: bool = use_sparse
+        self.sparse_encoder: Bm25Encoder = sparse_encoder
+        self._has_sparse: Optional[bool] = None
+
+        # Vector storage: "scalar" or "binary" quantization, original vectors on disk, and
+        # rescoring of the quantized candidates with the originals at search time
+        self.quantization: Optional[str] = quantization
+        self.quantization_always_ram: bool = quantization_always_ram
+        self.on_disk: bool = on_disk
+        self.rescore: bool = rescore
+        self.oversampling: Optional[float] = oversampling
+
         # Qdrant client kwargs
         self.kwargs = kwargs
 
@@ -112,8 +136,34 @@ class Qdrant(VectorDb):
             logger.debug(f"Creating collection: {self.collection}")
             self.client.create_collection(
                 collection_name=self.collection,
-                vectors_config=models.VectorParams(size=self.dimensions, distance=_distance),
+                vectors_config=models.VectorParams(size=self.dimensions, distance=_distance, on_disk=self.on_disk),
+                sparse_vectors_config=(
+                    {SPARSE_VECTOR_NAME: models.SparseVectorParams(modifier=models.Modifier.IDF)}
+                    if self.use_sparse
+                    else None
+                ),
+                quantization_config=quantization_config(self.quantization, always_ram=self.quantization_always_ram),
             )
+            self._has_sparse = self.use_sparse
+
+    def has_sparse(self) -> bool:
+        """
+        True if the collection stores BM25 sparse vectors. Collections created before
+        hybrid search was added only have the dense vector and fall back to dense search.
+        """
+        if self._has_sparse is None:
+            try:
+                info = self.client.get_collection(self.collection)
+                self._has_sparse = SPARSE_VECTOR_NAME in (info.config.params.sparse_vectors or {})
+            except Exception as e:
+                logger.debug(f"Could not read collection config: {e}")
+                return False
+        return self._has_sparse
+
+    def _sparse_vector(self, text: str, query: bool = False) -> models.SparseVector:
+        encode = self.sparse_encoder.encode_query if query else self.sparse_encoder.encode_document
+        indices, values = encode(text)
+        return models.SparseVector(indices=indices, values=values)
 
     def doc_exists(self, document: Document) -> bool:
         """
@@ -132,6 +182,29 @@ class Qdrant(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def docs_exist(self, documents: List[Document], batch_size: int = 256) -> Set[str]:
+        """
+        Content hashes of the documents that are already stored, looked up in batches.
+
+        Args:
+            documents (List[Document]): Documents to check
+            batch_size (int): Ids retrieved per request
+        """
+        if not self.client:
+            return set()
+        doc_ids = list(dict.fromkeys(self.doc_key(document) for document in documents))
+        existing: Set[str] = set()
+        for i in range(0, len(doc_ids), batch_size):
+            points = self.client.retrieve(
+                collection_name=self.collection,
+                ids=doc_ids[i : i + batch_size],
+                with_payload=False,
+                with_vectors=False,
+            )
+            # Qdrant returns the md5 ids in UUID form
+            existing.update(uuid.UUID(str(point.id)).hex for point in points)
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -164,14 +237,18 @@ class Qdrant(VectorDb):
         """
         logger.debug(f"Inserting {len(documents)} documents")
         points = []
+        Document.embed_batch(documents, embedder=self.embedder)
+        with_sparse = self.has_sparse()
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
+            vector: Any = document.embedding
+            if with_sparse:
+                vector = {"": document.embedding, SPARSE_VECTOR_NAME: self._sparse_vector(cleaned_content)}
             points.append(
                 models.PointStruct(
                     id=doc_id,
-                    vector=document.embedding,
+                    vector=vector,
                     payload={
                         "name": document.name,
                         "meta_data": document.meta_data,
@@ -205,12 +282,7 @@ class Qdrant(VectorDb):
             limit (int): Number of search results to return
             filters (Optional[Dict[str, Any]]): Filters to apply while searching
         """
-        # query_embedding = self.embedder.get_embedding(query)
-        query_embedding = client.embeddings.create(
-            input=[query],
-            model="text-embedding-3-small"
-        )
-        query_embedding = query_embedding.data[0].embedding
+        query_embedding = self._query_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -218,25 +290,92 @@ class Qdrant(VectorDb):
         results = self.client.search(
             collection_name=self.collection,
             query_vector=query_embedding,
+            search_params=self._search_params(),
             with_vectors=True,
             with_payload=True,
             limit=limit,
         )
+        return self._build_documents(results)
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.search(query, limit=limit)
+
+    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+        """
+        BM25 search over the sparse vectors. Returns [] for collections without them.
+        """
+        if not self.has_sparse():
+            logger.warning(f"Collection {self.collection} has no sparse vectors, keyword search unavailable")
+            return []
+        response = self.client.query_points(
+            collection_name=self.collection,
+            query=self._sparse_vector(query, query=True),
+            using=SPARSE_VECTOR_NAME,
+            with_payload=True,
+            limit=limit,
+        )
+        return self._build_documents(response.points)
+
+    def hybrid_search(self, query: str, limit: int = 5, prefetch_limit: Optional[int] = None) -> List[Document]:
+        """
+        Dense + BM25 retrieval fused server-side with reciprocal rank fusion, so exact
+        terms (SKUs, error codes) are found even when their embedding is not close.
+        Falls back to dense search for collections without sparse vectors.
 
+        Args:
+            query (str): Query to search for
+            limit (int): Number of fused results to return
+            prefetch_limit (Optional[int]): Candidates taken from each retriever, defaults to 4 * limit
+        """
+        if not self.has_sparse():
+            return self.search(query, limit=limit)
+
+        query_embedding = self._query_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        prefetch_limit = prefetch_limit or limit * 4
+        response = self.client.query_points(
+            collection_name=self.collection,
+            prefetch=[
+                models.Prefetch(query=query_embedding, params=self._search_params(), limit=prefetch_limit),
+                models.Prefetch(
+                    query=self._sparse_vector(query, query=True), using=SPARSE_VECTOR_NAME, limit=prefetch_limit
+                ),
+            ],
+            query=models.FusionQuery(fusion=models.Fusion.RRF),
+            with_payload=True,
+            limit=limit,
+        )
+        return self._build_documents(response.points)
+
+    def _search_params(self) -> Optional[models.SearchParams]:
+        return quantization_search_params(self.quantization, rescore=self.rescore, oversampling=self.oversampling)
+
+    def _query_embedding(self, query: str) -> Optional[List[float]]:
+        # query_embedding = self.embedder.get_embedding(query)
+        return default_embedding_cache.get_or_compute(
+            query,
+            "openai/text-embedding-3-small",
+            lambda: client.embeddings.create(input=[query], model="text-embedding-3-small").data[0].embedding,
+        )
 
+    def _build_documents(self, results) -> List[Document]:
         # Build search results
         search_results: List[Document] = []
         for result in results:
             if result.payload is None:
                 continue
             try:
+                vector = result.vector.get("") if isinstance(result.vector, dict) else result.vector
                 search_results.append(
                     Document(
                             name=result.payload["metadata"]["source"] if "source" in result.payload["metadata"] else "",
                             metadata=result.payload["metadata"],
                             content=result.payload["page_content"],
                             embedder=self.embedder,
-                            embedding=result.vector
+                            embedding=vector
                     )
                 )
             except Exception as e:
@@ -248,6 +387,7 @@ class Qdrant(VectorDb):
         if self.exists():
             logger.debug(f"Deleting collection: {self.collection}")
             self.client.delete_collection(self.collection)
+            self._has_sparse = None
 
     def exists(self) -> bool:
         if self.client:
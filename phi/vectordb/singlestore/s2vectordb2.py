@@ -1,5 +1,5 @@
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Set, Dict, Any
 from hashlib import md5
 
 try:
@@ -113,6 +113,24 @@ class S2VectorDb(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def docs_exist(self, documents: List[Document], batch_size: int = 1000) -> Set[str]:
+        """
+        Content hashes of the documents that are already stored, one query per batch
+
+        Args:
+            documents (List[Document]): Documents to check
+            batch_size (int): Content hashes per query
+        """
+        content_hashes = list(dict.fromkeys(self.doc_key(document) for document in documents))
+        existing: Set[str] = set()
+        with self.Session.begin() as sess:
+            for i in range(0, len(content_hashes), batch_size):
+                stmt = select(self.table.c.content_hash).where(
+                    self.table.c.content_hash.in_(content_hashes[i : i + batch_size])
+                )
+                existing.update(row[0] for row in sess.execute(stmt))
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -148,8 +166,8 @@ class S2VectorDb(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_batch(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -190,8 +208,8 @@ class S2VectorDb(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            Document.embed_batch(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -1,7 +1,9 @@
 import asyncio
-import logging
-from typing import Optional
+import threading
+from typing import Any, Dict, List, Optional
 
+from phi.tools.cache import cached_tool, is_cacheable_result
+from phi.utils.run_async import run_awaitable
 from strands_agents.tools.toolkit import Toolkit
 from strands_agents.utils.log import logger
 
@@ -10,13 +12,218 @@ try:
 except ImportError:
     raise ImportError("`crawl4ai` not installed. Please install using `pip install crawl4ai`")
 
+NO_CONTENT = "No content found on the page"
+
+
+class _Browser:
+    def __init__(self, crawler: AsyncWebCrawler):
+        self.crawler = crawler
+        self.active = 0
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    Long-lived headless browsers shared by every Crawl4aiTools instance.
+
+    The browsers live on a dedicated event loop thread, so they outlive the loop of any single
+    agent run and can be used from sync code, from any event loop and from several threads.
+    At most `size` browsers are started, lazily and only when every running browser already has
+    `pages_per_browser` pages open; further crawls wait for a free page. A browser is restarted
+    after `recycle_after` crawls, or after a crawl raises, to bound Chromium's memory growth.
+    Browsers waiting to be recycled count against `size` until they are closed, so crawls wait
+    for one to close rather than start an extra browser. Sizes are read when the first crawl
+    starts the pool.
+    """
+
+    def __init__(self, size: int = 2, pages_per_browser: int = 4, recycle_after: int = 200, start_timeout: float = 60):
+        self.size = size
+        self.pages_per_browser = pages_per_browser
+        self.recycle_after = recycle_after
+        self.start_timeout = start_timeout
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # Owned by the pool loop
+        self._browsers: List[_Browser] = []
+        self._pages: Optional[asyncio.Semaphore] = None
+        # Guards _browsers, _retiring and _starting, notified when a page is released or a browser closed
+        self._browsers_changed: Optional[asyncio.Condition] = None
+        # Browsers removed from _browsers that are still closing, and browsers being started
+        self._retiring = 0
+        self._starting = 0
+        self._stats = {"crawls": 0, "browser_starts": 0, "browser_start_seconds": 0.0}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="crawl4ai-browser-pool", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def crawl(self, url: str, **run_kwargs: Any) -> Any:
+        """Crawl url on a pooled browser; run_kwargs go to AsyncWebCrawler.arun. Works from any event loop."""
+        future = asyncio.run_coroutine_threadsafe(self._crawl(url, run_kwargs), self._ensure_loop())
+        return await asyncio.wrap_future(future)
+
+    def crawl_sync(self, url: str, **run_kwargs: Any) -> Any:
+        """Blocking version of crawl"""
+        return asyncio.run_coroutine_threadsafe(self._crawl(url, run_kwargs), self._ensure_loop()).result()
+
+    async def _crawl(self, url: str, run_kwargs: Dict[str, Any]) -> Any:
+        if self._pages is None:
+            self._pages = asyncio.Semaphore(max(1, self.size) * max(1, self.pages_per_browser))
+            self._browsers_changed = asyncio.Condition()
+        async with self._pages:
+            browser = await self._acquire()
+            try:
+                return await browser.crawler.arun(url=url, **run_kwargs)
+            except Exception:
+                # Page errors come back in the result, so a raise usually means the browser is broken
+                browser.uses = max(browser.uses, self.recycle_after)
+                raise
+            finally:
+                await self._release(browser)
+
+    def _claim(self, browser: _Browser) -> _Browser:
+        browser.active += 1
+        browser.uses += 1
+        self._stats["crawls"] += 1
+        return browser
+
+    async def _acquire(self) -> _Browser:
+        condition = self._browsers_changed
+        assert condition is not None
+        async with condition:
+            while True:
+                usable = [
+                    browser
+                    for browser in self._browsers
+                    if browser.uses < self.recycle_after and browser.active < self.pages_per_browser
+                ]
+                browser = min(usable, key=lambda b: b.active, default=None)
+                if browser is not None:
+                    return self._claim(browser)
+                if len(self._browsers) + self._retiring + self._starting < max(1, self.size):
+                    # Reserve the slot, the browser is started outside the lock
+                    self._starting += 1
+                    break
+                # Every browser is busy, starting or due for recycling, wait until one is freed
+                await condition.wait()
+
+        # A slow start must not hold up crawls on the browsers already running
+        try:
+            browser = await self._start_browser()
+        except BaseException:
+            async with condition:
+                self._starting -= 1
+                condition.notify_all()
+            raise
+        async with condition:
+            self._starting -= 1
+            self._browsers.append(browser)
+            condition.notify_all()
+            return self._claim(browser)
+
+    async def _release(self, browser: _Browser) -> None:
+        condition = self._browsers_changed
+        assert condition is not None
+        async with condition:
+            browser.active -= 1
+            retire = browser.uses >= self.recycle_after and browser.active == 0 and browser in self._browsers
+            if retire:
+                self._browsers.remove(browser)
+                self._retiring += 1
+            condition.notify_all()
+        if retire:
+            try:
+                await self._close_browser(browser)
+            finally:
+                async with condition:
+                    self._retiring -= 1
+                    condition.notify_all()
+
+    async def _start_browser(self) -> _Browser:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        # Not thread_safe: that locks every arun, allowing one page per browser. All crawls run on
+        # the pool loop, so concurrent pages of one browser never race across threads
+        crawler = AsyncWebCrawler()
+        try:
+            await asyncio.wait_for(crawler.start(), timeout=self.start_timeout)
+        except BaseException:
+            # Do not leak a half started Chromium
+            await self._close_browser(_Browser(crawler))
+            raise
+        self._stats["browser_starts"] += 1
+        self._stats["browser_start_seconds"] += loop.time() - started_at
+        logger.info(f"Started pooled browser {self._stats['browser_starts']}")
+        return _Browser(crawler)
+
+    async def _close_browser(self, browser: _Browser) -> None:
+        try:
+            await browser.crawler.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser: {e}")
+
+    async def _close_all(self) -> None:
+        browsers, self._browsers = self._browsers, []
+        self._pages = None
+        self._browsers_changed = None
+        self._retiring = 0
+        self._starting = 0
+        await asyncio.gather(*(self._close_browser(browser) for browser in browsers))
+
+    def close(self, timeout: float = 30) -> None:
+        """Close every browser and stop the pool loop; the next crawl starts a new pool"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Error closing browser pool: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+    def stats(self) -> Dict[str, Any]:
+        browsers = list(self._browsers)
+        starts = self._stats["browser_starts"]
+        return {
+            "browsers": len(browsers),
+            "retiring_browsers": self._retiring,
+            "active_pages": sum(browser.active for browser in browsers),
+            "max_browsers": self.size,
+            "pages_per_browser": self.pages_per_browser,
+            "crawls": self._stats["crawls"],
+            "browser_starts": starts,
+            "avg_browser_start_seconds": round(self._stats["browser_start_seconds"] / starts, 3) if starts else 0.0,
+        }
+
+
+# Process-wide pool shared by every Crawl4aiTools instance and agent run
+default_browser_pool = BrowserPool()
+
+
+def _has_content(result: Any) -> bool:
+    return is_cacheable_result(result) and result != NO_CONTENT
+
 
 class Crawl4aiTools(Toolkit):
     def __init__(
         self,
         existing_tools: Optional[list] = None,
         max_length: Optional[int] = 100000,
-        timeout: int = 60
+        timeout: int = 60,
+        browser_pool: Optional[BrowserPool] = None,
     ):
         """
         Initialize the web crawler tool with minimal improvements.
@@ -24,17 +231,34 @@ class Crawl4aiTools(Toolkit):
         Args:
             max_length: Maximum length of returned content
             timeout: Timeout in seconds for page loading
+            browser_pool: Browsers to crawl with, defaults to the shared default_browser_pool
         """
         super().__init__(existing_tools or [])
 
         self.max_length = max_length
         self.timeout = timeout
+        self.browser_pool = browser_pool or default_browser_pool
 
-        self.register(self.web_crawler, name="crawl4ai_tools")
+        self.register(self.aweb_crawler, name="crawl4ai_tools")
+
+    async def aweb_crawler(self, url: str, max_length: Optional[int] = None) -> str:
+        """
+        Crawls a website using crawl4ai's WebCrawler with improved error handling.
+
+        :param url: The URL to crawl.
+        :param max_length: The maximum length of the result.
+
+        :return: The results of the crawling.
+        """
+        if url is None:
+            return "No URL provided"
+
+        return await self._async_web_crawler(url, max_length)
 
     def web_crawler(self, url: str, max_length: Optional[int] = None) -> str:
         """
         Crawls a website using crawl4ai's WebCrawler with improved error handling.
+        Sync version of aweb_crawler; safe to call from inside a running event loop.
 
         :param url: The URL to crawl.
         :param max_length: The maximum length of the result.
@@ -44,12 +268,13 @@ class Crawl4aiTools(Toolkit):
         if url is None:
             return "No URL provided"
 
-        # Run the async crawler function synchronously
-        return asyncio.run(self._async_web_crawler(url, max_length))
+        return run_awaitable(self._async_web_crawler(url, max_length))
 
+    @cached_tool(ttl=10 * 60, name="crawl4ai_tools", key_attrs=("max_length", "timeout"), cache_if=_has_content)
     async def _async_web_crawler(self, url: str, max_length: Optional[int] = None) -> str:
         """
-        Asynchronous method to crawl a website using AsyncWebCrawler with retry logic.
+        Asynchronous method to crawl a website on a pooled browser. Pages are cached by URL for
+        10 minutes (set the "crawl4ai_tools" TTL to 0 to disable).
 
         :param url: The URL to crawl.
         :param max_length: The maximum length of the result.
@@ -59,43 +284,42 @@ class Crawl4aiTools(Toolkit):
         length = max_length or self.max_length
 
         try:
-            async with AsyncWebCrawler(thread_safe=True) as crawler:
-                logger.info(f"Starting crawl for URL: {url}")
-                
-                result = await crawler.arun(
-                    url=url, 
-                    cache_mode=CacheMode.BYPASS,
-                    page_timeout=self.timeout * 1000,  # Convert to milliseconds
-                    wait_until="domcontentloaded",
-                )
-
-                if not result or not result.markdown:
-                    return "No content found on the page"
-
-                content = result.markdown.strip()
-                if length and len(content) > length:
-                    content = content[:length] + "..."
-                    
-                content = self._clean_content(content)
-
-                logger.info(f"Successfully crawled {url}")
-                return content
+            logger.info(f"Starting crawl for URL: {url}")
+
+            result = await self.browser_pool.crawl(
+                url,
+                cache_mode=CacheMode.BYPASS,
+                page_timeout=self.timeout * 1000,  # Convert to milliseconds
+                wait_until="domcontentloaded",
+            )
+
+            if not result or not result.markdown:
+                return NO_CONTENT
+
+            content = result.markdown.strip()
+            if length and len(content) > length:
+                content = content[:length] + "..."
+
+            content = self._clean_content(content)
+
+            logger.info(f"Successfully crawled {url}")
+            return content
 
         except Exception as e:
-                logger.error(f"Error crawling {url}: {str(e)}")
-                return f"Error crawling the page: {str(e)}"
+            logger.error(f"Error crawling {url}: {str(e)}")
+            return f"Error crawling the page: {str(e)}"
 
     def _clean_content(self, content: str) -> str:
         """Clean and optimize the crawled content."""
         if not content:
             return ""
-        
+
         # Remove excessive whitespace
         content = " ".join(content.split())
-        
+
         return content.strip()
 
 if __name__ == '__main__':
     # Example usage
     crawler = Crawl4aiTools()
-    print(crawler._tools)
\ No newline at end of file
+    print(crawler._tools)
@@ -18,6 +18,7 @@ from typing import List, Optional
 
 from strands_agents.utils.log import logger
 from strands_agents.tools.toolkit import Toolkit
+from phi.tools.cache import cached_tool, is_cacheable_result
 
 try:
     import googlemaps
@@ -26,6 +27,11 @@ except ImportError:
     print("Error importing googlemaps. Please install the package using `pip install googlemaps google-maps-places`.")
 
 
+def _has_results(result: str) -> bool:
+    # Lookup failures are returned as an empty list
+    return is_cacheable_result(result) and result != str([])
+
+
 class GoogleMapTools(Toolkit):
     def __init__(
         self,
@@ -157,6 +163,7 @@ class GoogleMapTools(Toolkit):
             logger.error(f"Error validating address: {str(e)}")
             return str({})
 
+    @cached_tool(ttl=30 * 24 * 60 * 60, cache_if=_has_results)
     def geocode_address(self, address: str, region: Optional[str] = None) -> str:
         """
         Convert an address into geographic coordinates using Google Maps Geocoding API.
@@ -175,6 +182,7 @@ class GoogleMapTools(Toolkit):
             logger.error(f"Error geocoding address: {str(e)}")
             return str([])
 
+    @cached_tool(ttl=30 * 24 * 60 * 60, cache_if=_has_results)
     def reverse_geocode(
         self, lat: float, lng: float, result_type: Optional[List[str]] = None, location_type: Optional[List[str]] = None
     ) -> str:
@@ -4,6 +4,7 @@ from typing import List, Optional
 from phi.document import Document
 from phi.knowledge.wikipedia import WikipediaKnowledgeBase
 
+from phi.tools.cache import cached_tool
 from strands_agents.tools.toolkit import Toolkit
 from strands_agents.utils.log import logger
 
@@ -39,6 +40,7 @@ class WikipediaTools(Toolkit):
         relevant_docs: List[Document] = self.knowledge_base.search(query=topic)
         return json.dumps([doc.to_dict() for doc in relevant_docs])
 
+    @cached_tool(ttl=24 * 60 * 60)
     def search_wikipedia(self, query: str) -> str:
         """Searches Wikipedia for a query.
 
@@ -1,6 +1,7 @@
 import json
 
 from strands_agents.tools.toolkit import Toolkit
+from phi.tools.cache import cached_tool
 from strands_agents.utils.log import logger
 
 try:
@@ -63,6 +64,7 @@ class YFinanceTools(Toolkit):
             logger.error(f"Error fetching current price for {symbol}: {e}")
             return f"Error fetching current price for {symbol}: {e}"
 
+    @cached_tool(ttl=60 * 60)
     def get_company_info(self, symbol: str) -> str:
         """Use this function to get company information and overview for a given stock symbol.
 
@@ -134,6 +136,7 @@ class YFinanceTools(Toolkit):
             logger.error(f"Error fetching historical prices for {symbol}: {e}")
             return f"Error fetching historical prices for {symbol}: {e}"
 
+    @cached_tool(ttl=60 * 60)
     def get_stock_fundamentals(self, symbol: str) -> str:
         """Use this function to get fundamental data for a given stock symbol yfinance API.
 
@@ -178,6 +181,7 @@ class YFinanceTools(Toolkit):
             logger.error(f"Error getting fundamentals for {symbol}: {e}")
             return f"Error getting fundamentals for {symbol}: {e}"
 
+    @cached_tool(ttl=24 * 60 * 60)
     def get_income_statements(self, symbol: str) -> str:
         """Use this function to get income statements for a given stock symbol.
 
@@ -195,6 +199,7 @@ class YFinanceTools(Toolkit):
             logger.error(f"Error fetching income statements for {symbol}: {e}")
             return f"Error fetching income statements for {symbol}: {e}"
 
+    @cached_tool(ttl=24 * 60 * 60)
     def get_key_financial_ratios(self, symbol: str) -> str:
         """Use this function to get key financial ratios for a given stock symbol.
 
@@ -212,6 +217,7 @@ class YFinanceTools(Toolkit):
             logger.error(f"Error fetching key financial ratios for {symbol}: {e}")
             return f"Error fetching key financial ratios for {symbol}: {e}"
 
+    @cached_tool(ttl=60 * 60)
     def get_analyst_recommendations(self, symbol: str) -> str:
         """Use this function to get analyst recommendations for a given stock symbol.
 
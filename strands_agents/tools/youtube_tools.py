@@ -3,6 +3,7 @@ from urllib.parse import urlparse, parse_qs, urlencode
 from urllib.request import urlopen
 from typing import Optional, List
 
+from phi.tools.cache import cached_tool
 from strands_agents.tools.toolkit import Toolkit
 from strands_agents.utils.log import logger
 
@@ -52,6 +53,7 @@ class YouTubeTools(Toolkit):
                 return parsed_url.path.split("/")[2]
         return None
 
+    @cached_tool(ttl=24 * 60 * 60)
     def get_youtube_video_data(self, url: str) -> str:
         """Function to get video data from a YouTube URL.
         Data returned includes {title, author_name, author_url, type, height, width, version, provider_name, provider_url, thumbnail_url}
@@ -96,6 +98,8 @@ class YouTubeTools(Toolkit):
             logger.error(f"Error getting video data: {e}")
             return f"Error getting video data: {e}"
 
+    # Captions do not change once published; the languages setting changes the result
+    @cached_tool(ttl=7 * 24 * 60 * 60, key_attrs=("languages",))
     def get_youtube_video_captions(self, url: str) -> str:
         """Use this function to get captions from a YouTube video.
 